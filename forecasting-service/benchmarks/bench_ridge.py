@@ -0,0 +1,77 @@
+"""
+RidgeRegression solver benchmark
+
+Times the NumPy closed-form solver against the pure-Python gradient-descent
+fallback on synthetic residual-correction data (7 features, the width used by
+RASSPriceModel) and reports the speedup per sample count.
+
+Usage:
+    python benchmarks/bench_ridge.py
+    python benchmarks/bench_ridge.py --sizes 100 1000 10000 --json ridge.json
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from model import RidgeRegression  # noqa: E402
+
+N_FEATURES = 7
+
+
+def make_data(n_samples: int, seed: int = 42):
+    rng = random.Random(seed)
+    true_w = [rng.uniform(-2, 2) for _ in range(N_FEATURES)]
+    X = [[rng.gauss(0, 1) for _ in range(N_FEATURES)] for _ in range(n_samples)]
+    y = [sum(w * x for w, x in zip(true_w, row)) + rng.gauss(0, 0.1) for row in X]
+    return X, y
+
+
+def time_fit(solver: str, X, y, iterations: int, repeats: int) -> float:
+    """Best-of-`repeats` wall time in milliseconds"""
+    best = float("inf")
+    for _ in range(repeats):
+        model = RidgeRegression(alpha=1.0, learning_rate=0.001, iterations=iterations, solver=solver)
+        start = time.perf_counter()
+        model.fit(X, y)
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--iterations", type=int, default=500,
+                        help="gradient-descent iterations (RASSPriceModel uses 500)")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--json", dest="json_path", help="write results to this file")
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'n':>8} {'closed_form_ms':>15} {'gradient_descent_ms':>20} {'speedup':>10}")
+    for n in args.sizes:
+        X, y = make_data(n)
+        closed = time_fit("closed_form", X, y, args.iterations, args.repeats)
+        gd = time_fit("gradient_descent", X, y, args.iterations, 1)
+        speedup = gd / closed if closed > 0 else float("inf")
+        results.append({
+            "n_samples": n,
+            "n_features": N_FEATURES,
+            "closed_form_ms": round(closed, 3),
+            "gradient_descent_ms": round(gd, 3),
+            "speedup": round(speedup, 1),
+        })
+        print(f"{n:>8} {closed:>15.3f} {gd:>20.1f} {speedup:>9.0f}x")
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump({"benchmark": "ridge_solver", "iterations": args.iterations, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
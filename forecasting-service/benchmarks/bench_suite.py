@@ -0,0 +1,331 @@
+"""
+Forecasting service benchmark suite
+
+Times the training and inference hot paths on seeded synthetic series and
+writes machine-readable JSON:
+
+    features   ingest_price_history, FeatureEngineer rolling features and
+               feature matrix, per series length
+    model      RASSPriceModel.train (with its per-stage timings) and predict,
+               per series length
+    members    each EnsembleForecaster member (_run_holt, _run_lstm,
+               _run_sarima, _run_gbr, _run_prophet), per series length
+    endpoints  the main endpoints through an in-process ASGI client (httpx
+               ASGITransport, app lifespan included), per series length, and
+               POST /forecast/batch per batch size
+    ridge      the RidgeRegression solvers (see bench_ridge.py)
+
+"cold" endpoint cases send a different series on every repeat, so they miss
+the forecast caches and the model registry; "warm" cases repeat one payload.
+Everything runs offline: no network, no external services. Members whose
+backend is not installed fall back to Holt, as in the service; the backends
+available are recorded under "environment".
+
+Usage:
+    python benchmarks/bench_suite.py --json bench.json
+    python benchmarks/bench_suite.py --quick
+    python benchmarks/bench_suite.py --groups features members --lengths 30 365 3650
+    python benchmarks/bench_suite.py --groups endpoints --batch-sizes 1 10 100 500
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_DIR, ".."))
+sys.path.insert(0, BENCH_DIR)
+
+# Reproducible service state: no startup warm-up, no artifacts from earlier runs
+os.environ["FORECAST_WARMUP"] = "false"
+os.environ["MODEL_ARTIFACT_DIR"] = ""
+
+from model import (  # noqa: E402
+    EnsembleForecaster, FeatureEngineer, RASSPriceModel, backend_report,
+    ingest_price_history, library_versions,
+)
+
+GROUPS = ["features", "model", "members", "endpoints", "ridge"]
+MEMBERS = ["holt", "lstm", "sarima", "gbr", "prophet"]
+DEFAULT_LENGTHS = [30, 90, 365, 1095, 3650]
+DEFAULT_BATCH_SIZES = [1, 10, 100, 500]
+BASE_DATE = datetime(2020, 1, 1)
+STEPS = 14
+
+
+# ============================================================================
+# SYNTHETIC DATA
+# ============================================================================
+
+def make_prices(n: int, seed: int) -> list:
+    """Trend + weekly and yearly seasonality + noise, in RWF/kg"""
+    rng = random.Random(seed)
+    base = rng.uniform(200, 800)
+    prices = []
+    for i in range(n):
+        weekly = 0.05 * base * math.sin(2 * math.pi * i / 7)
+        yearly = 0.15 * base * math.sin(2 * math.pi * i / 365)
+        prices.append(round(max(1.0, base + 0.02 * i + weekly + yearly + rng.gauss(0, 0.04 * base)), 2))
+    return prices
+
+
+def make_payload(n: int, seed: int) -> list:
+    """historical_prices payload as the backend sends it"""
+    return [
+        {"date": (BASE_DATE + timedelta(days=i)).strftime("%Y-%m-%dT%H:%M:%S"), "price": p}
+        for i, p in enumerate(make_prices(n, seed))
+    ]
+
+
+# ============================================================================
+# TIMING
+# ============================================================================
+
+def summarize(samples: list) -> dict:
+    return {
+        "repeats": len(samples),
+        "min_ms": round(min(samples), 3),
+        "median_ms": round(statistics.median(samples), 3),
+        "max_ms": round(max(samples), 3),
+    }
+
+
+def time_calls(fn, repeats: int, setup=None) -> dict:
+    """Time fn(*setup(i)) for each repeat; setup runs outside the timer"""
+    samples = []
+    for i in range(repeats):
+        args = setup(i) if setup else ()
+        start = time.perf_counter()
+        fn(*args)
+        samples.append((time.perf_counter() - start) * 1000)
+    return summarize(samples)
+
+
+class Recorder:
+    def __init__(self):
+        self.results = []
+
+    def add(self, group: str, case: str, stats: dict, **params):
+        row = {"group": group, "case": case, **params, **stats}
+        self.results.append(row)
+        label = " ".join(f"{k}={v}" for k, v in params.items())
+        print(f"{group:<10} {case:<34} {label:<22} median {stats['median_ms']:>10.2f} ms"
+              f"  min {stats['min_ms']:>10.2f} ms")
+
+
+# ============================================================================
+# GROUPS
+# ============================================================================
+
+def bench_features(rec: Recorder, args):
+    for n in args.lengths:
+        payload = make_payload(n, args.seed + n)
+        prices = make_prices(n, args.seed + n)
+        rec.add("features", "ingest_price_history",
+                time_calls(lambda: ingest_price_history(payload), args.repeats), n=n)
+        rec.add("features", "create_rolling_features",
+                time_calls(lambda: FeatureEngineer.create_rolling_features(prices), args.repeats), n=n)
+        rec.add("features", "build_feature_matrix",
+                time_calls(lambda: FeatureEngineer.build_feature_matrix(prices, start=7), args.repeats), n=n)
+
+
+def bench_model(rec: Recorder, args):
+    for n in args.lengths:
+        history = ingest_price_history(make_payload(n, args.seed + n))
+        models = []
+
+        def train(model):
+            model.train(history)
+            models.append(model)
+
+        stats = time_calls(train, args.repeats, setup=lambda i: (RASSPriceModel(),))
+        stages = {k: round(v, 3) for k, v in (models[-1].training_timings or {}).items()}
+        rec.add("model", "RASSPriceModel.train", {**stats, "stages_ms": stages}, n=n)
+
+        trained = models[-1]
+        rec.add("model", "RASSPriceModel.predict",
+                time_calls(lambda: trained.predict(history, STEPS), args.repeats), n=n)
+
+
+def bench_members(rec: Recorder, args):
+    ef = EnsembleForecaster()
+    for n in args.lengths:
+        history = ingest_price_history(make_payload(n, args.seed + n))
+        train, dates = history.price_list, history.date_list
+        for name in MEMBERS:
+            run = getattr(ef, f"_run_{name}")
+            call = (lambda: run(train, STEPS, dates)) if name == "prophet" else (lambda: run(train, STEPS))
+            rec.add("members", f"EnsembleForecaster._run_{name}", time_calls(call, args.repeats), n=n)
+
+
+async def _bench_endpoints(rec: Recorder, args):
+    import httpx
+    import main
+
+    headers = {"X-FORECAST-KEY": main.FORECAST_API_KEY}
+    transport = httpx.ASGITransport(app=main.app)
+
+    async def timed(client, method, url, body=None):
+        start = time.perf_counter()
+        response = await client.request(method, url, json=body, headers=headers)
+        elapsed = (time.perf_counter() - start) * 1000
+        if response.status_code != 200:
+            raise RuntimeError(f"{method} {url} -> {response.status_code}: {response.text[:200]}")
+        return elapsed
+
+    async def cases(client, group, case, method, url, make_body, params):
+        cold = [await timed(client, method, url, make_body(i)) for i in range(args.repeats)]
+        rec.add(group, f"{case} cold", summarize(cold), **params)
+        warm = [await timed(client, method, url, make_body(0)) for _ in range(args.repeats)]
+        rec.add(group, f"{case} warm", summarize(warm), **params)
+
+    async with main.app.router.lifespan_context(main.app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+            # Spawning the worker pool and importing the backends is paid once
+            start = time.perf_counter()
+            await timed(client, "POST", "/forecast/price/enhanced", {
+                "crop": "maize", "market": "Kigali", "days": 7,
+                "historical_prices": make_payload(30, args.seed - 1),
+            })
+            rec.add("endpoints", "pool startup (first ML request)",
+                    summarize([(time.perf_counter() - start) * 1000]))
+
+            rec.add("endpoints", "GET /health",
+                    summarize([await timed(client, "GET", "/health") for _ in range(args.repeats)]))
+
+            for n in args.lengths:
+                def body(i, n=n, **extra):
+                    return {"crop": "maize", "market": "Kigali", "days": 7,
+                            "historical_prices": make_payload(n, args.seed + 1000 * n + i), **extra}
+
+                await cases(client, "endpoints", "POST /forecast/price", "POST",
+                            "/forecast/price", body, {"n": n})
+                await cases(client, "endpoints", "POST /forecast/price/enhanced", "POST",
+                            "/forecast/price/enhanced", body, {"n": n})
+
+                def anomaly(i, n=n):
+                    payload = make_payload(n, args.seed + 1000 * n + i)
+                    return {"crop": "maize", "market": "Kigali",
+                            "current_price": payload[-1]["price"] * 1.3, "historical_prices": payload}
+
+                await cases(client, "endpoints", "POST /detect/anomaly", "POST",
+                            "/detect/anomaly", anomaly, {"n": n})
+
+                # A new stored series trains once; each later day is folded in
+                payload = make_payload(n + args.repeats, args.seed + 1000 * n)
+                url = f"/series/maize/bench-series-{n}/observations"
+                seed = await timed(client, "POST", url, {"observations": payload[:n]})
+                rec.add("endpoints", "POST /series observations retrain", summarize([seed]), n=n)
+                appends = [await timed(client, "POST", url, {"observations": [payload[n + i]]})
+                           for i in range(args.repeats)]
+                rec.add("endpoints", "POST /series observations incremental", summarize(appends), n=n)
+
+            for size in args.batch_sizes:
+                def batch(i, size=size):
+                    return {"days": 7, "items": [
+                        {"crop": "maize", "market": f"bench-{j}",
+                         "historical_prices": make_payload(args.batch_length, args.seed + 7919 * i + j)}
+                        for j in range(size)
+                    ]}
+
+                cold = [await timed(client, "POST", "/forecast/batch", batch(i + 1))
+                        for i in range(args.batch_repeats)]
+                rec.add("endpoints", "POST /forecast/batch cold", summarize(cold),
+                        batch=size, n=args.batch_length)
+
+            if args.multi_model:
+                await cases(client, "endpoints", "GET /forecast/multi-model", "GET",
+                            "/forecast/multi-model/maize?market=Kigali&days=14", lambda i: None, {})
+
+
+def bench_endpoints(rec: Recorder, args):
+    asyncio.run(_bench_endpoints(rec, args))
+
+
+def bench_ridge(rec: Recorder, args):
+    from bench_ridge import N_FEATURES, make_data, time_fit
+
+    for n in args.ridge_sizes:
+        X, y = make_data(n, seed=args.seed)
+        for solver in ("closed_form", "gradient_descent"):
+            ms = time_fit(solver, X, y, iterations=500, repeats=1 if solver == "gradient_descent" else args.repeats)
+            rec.add("ridge", f"RidgeRegression {solver}", summarize([ms]), n=n, features=N_FEATURES)
+
+
+RUNNERS = {
+    "features": bench_features,
+    "model": bench_model,
+    "members": bench_members,
+    "endpoints": bench_endpoints,
+    "ridge": bench_ridge,
+}
+
+
+def environment() -> dict:
+    report = backend_report()
+    return {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpuCount": os.cpu_count(),
+        "libraries": library_versions(),
+        "backendsAvailable": {name: info["available"] for name, info in report["backends"].items()},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--groups", nargs="+", choices=GROUPS, default=GROUPS)
+    parser.add_argument("--lengths", type=int, nargs="+", default=DEFAULT_LENGTHS,
+                        help="series lengths in days")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=DEFAULT_BATCH_SIZES)
+    parser.add_argument("--batch-length", type=int, default=90,
+                        help="series length of each item in the batch cases")
+    parser.add_argument("--batch-repeats", type=int, default=1)
+    parser.add_argument("--ridge-sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--no-multi-model", dest="multi_model", action="store_false",
+                        help="skip GET /forecast/multi-model (an ensemble fit per cold call)")
+    parser.add_argument("--quick", action="store_true",
+                        help="smoke-test sizes: lengths 30 365, batch sizes 1 10, 1 repeat")
+    parser.add_argument("--json", dest="json_path", help="write results to this file")
+    args = parser.parse_args()
+
+    if args.quick:
+        args.lengths, args.batch_sizes, args.ridge_sizes, args.repeats = [30, 365], [1, 10], [100, 1000], 1
+
+    started = datetime.now()
+    rec = Recorder()
+    for group in GROUPS:
+        if group in args.groups:
+            RUNNERS[group](rec, args)
+
+    if args.json_path:
+        output = {
+            "benchmark": "forecasting_service",
+            "startedAt": started.isoformat(timespec="seconds"),
+            "durationSeconds": round((datetime.now() - started).total_seconds(), 1),
+            "config": {
+                "groups": args.groups, "lengths": args.lengths, "batchSizes": args.batch_sizes,
+                "batchLength": args.batch_length, "repeats": args.repeats, "seed": args.seed,
+                "steps": STEPS,
+            },
+            "environment": environment(),
+            "results": rec.results,
+        }
+        with open(args.json_path, "w") as f:
+            json.dump(output, f, indent=2)
+        print(f"Wrote {len(rec.results)} results to {args.json_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,17 +5,36 @@ Enhanced with ML-powered price prediction model
 """
 
 import os
-from fastapi import FastAPI, HTTPException, Query, Header, Depends
+import asyncio
+import bisect
+import functools
+import hashlib
+import json
+import multiprocessing
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Query, Header, Depends, Request
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, AsyncIterator, Iterable
 from datetime import datetime, timedelta
 import logging
 import math
 import random
 
 # Import the price prediction model and ensemble components
-from model import predict_price, train_model, EnsembleForecaster, LSTMLiteModel
+from model import (
+    predict_price, train_model, forecast_ensemble, LSTMLiteModel,
+    get_model_registry, preload_model_artifacts, init_worker, load_backends, backend_report,
+    RollingWindowStats, run_with_metrics, drain_metrics, member_pruning,
+    series_store, train_series_model,
+)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -76,10 +95,334 @@ def _generate_crop_prices(
         })
     return prices
 
+# ============================================================================
+# METRICS (Prometheus text exposition format)
+# ============================================================================
+
+PROMETHEUS_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Histogram bucket upper bounds: request and model latency in seconds, series
+# length in data points
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+MODEL_DURATION_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+SERIES_LENGTH_BUCKETS = (7, 14, 30, 60, 90, 180, 365, 730, 1095, 1825, 3650)
+
+
+def _format_labels(names: Iterable[str], values: Iterable[Any]) -> str:
+    pairs = [
+        f'{name}="' + str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+        for name, value in zip(names, values)
+    ]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _metric_family(name: str, kind: str, help_text: str, samples: List[tuple]) -> List[str]:
+    """HELP/TYPE header plus one line per (labels dict, value) sample"""
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+    for labels, value in samples:
+        lines.append(f"{name}{_format_labels(labels.keys(), labels.values())} {value}")
+    return lines
+
+
+class Histogram:
+    """Bucketed observations per label set, rendered with cumulative buckets"""
+
+    def __init__(self, name: str, help_text: str, label_names: tuple, buckets: tuple):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.buckets = tuple(sorted(buckets))
+        # labels -> [count per bucket..., count above the last bucket, sum]
+        self._series: Dict[tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels: tuple, value: float) -> None:
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[bisect.bisect_left(self.buckets, value)] += 1
+            series[-1] += value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            snapshot = {labels: list(series) for labels, series in sorted(self._series.items())}
+        for labels, series in snapshot.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + ("+Inf",), series[:-1]):
+                cumulative += count
+                le = _format_labels(self.label_names + ("le",), labels + (bound,))
+                lines.append(f"{self.name}_bucket{le} {cumulative}")
+            plain = _format_labels(self.label_names, labels)
+            lines.append(f"{self.name}_sum{plain} {round(series[-1], 6)}")
+            lines.append(f"{self.name}_count{plain} {cumulative}")
+        return lines
+
+
+class ServiceMetrics:
+    """
+    Request, model and series-length histograms, per-series counters of
+    member fits skipped by MemberPruningCache and SARIMA / Prophet fits by
+    how their caches served them. Model observations are
+    recorded by timing hooks in model.py and reach this process with each pool
+    task's result (see ForecastExecutor.run), or are drained at scrape time
+    when models ran in the API process itself. Each pool result also carries
+    its worker's model registry stats, summed by registry_summary().
+    """
+
+    def __init__(self):
+        self.requests = Histogram(
+            "rass_http_request_duration_seconds",
+            "Time from request to response start, per route template",
+            ("method", "route", "status"), LATENCY_BUCKETS,
+        )
+        self.models = Histogram(
+            "rass_model_duration_seconds",
+            "Wall time per model and phase (train, validate, predict, ensemble member)",
+            ("model", "phase"), MODEL_DURATION_BUCKETS,
+        )
+        self.series_length = Histogram(
+            "rass_series_length_points",
+            "Length of the price series models are trained on",
+            ("kind",), SERIES_LENGTH_BUCKETS,
+        )
+        # (crop, market, model) -> [fits skipped, ms saved]
+        self._pruned: Dict[tuple, list] = {}
+        # (model, mode) -> SARIMA / Prophet fits; mode is "reuse", "append",
+        # "warm" or "cold"
+        self._fits: Dict[tuple, int] = {}
+        # worker pid -> model registry stats as of its last task
+        self._registries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def record_events(self, events: Iterable[tuple]) -> None:
+        for metric, labels, value in events:
+            if metric == "model_seconds":
+                self.models.observe(tuple(labels), value)
+            elif metric == "series_length":
+                self.series_length.observe(tuple(labels), value)
+            elif metric == "member_pruned_ms":
+                with self._lock:
+                    counts = self._pruned.setdefault(tuple(labels), [0, 0.0])
+                    counts[0] += 1
+                    counts[1] += value
+            elif metric == "model_fits":
+                with self._lock:
+                    self._fits[tuple(labels)] = self._fits.get(tuple(labels), 0) + int(value)
+            elif metric == "model_registry":
+                with self._lock:
+                    self._registries[labels[0]] = value
+
+    def forget_registries(self) -> None:
+        """Drop the registry snapshots of a pool that was torn down"""
+        with self._lock:
+            self._registries.clear()
+
+    def registry_summary(self) -> Dict[str, Any]:
+        """Model registry stats summed over the pool workers, as of each one's last task"""
+        with self._lock:
+            snapshots = list(self._registries.values())
+        counters = ("size", "hits", "misses", "stale", "evictions", "diskHits")
+        summary: Dict[str, Any] = {name: sum(s[name] for s in snapshots) for name in counters}
+        lookups = summary["hits"] + summary["misses"]
+        summary["hitRate"] = round(summary["hits"] / lookups, 4) if lookups else 0.0
+        summary["workers"] = len(snapshots)
+        if snapshots:
+            summary["maxSize"] = snapshots[0]["maxSize"]
+            summary["maxAgeSeconds"] = snapshots[0]["maxAgeSeconds"]
+        stores = [s["artifacts"] for s in snapshots if s.get("artifacts") and s["artifacts"]["enabled"]]
+        if stores:
+            summary["artifacts"] = {
+                name: sum(store[name] for store in stores)
+                for name in ("saved", "pendingSaves", "loaded", "rejected", "errors")
+            }
+        return summary
+
+    def pruning_summary(self) -> Dict[str, Any]:
+        """Skipped fits and estimated ms saved, in total and per crop/market series"""
+        with self._lock:
+            pruned = {labels: list(counts) for labels, counts in sorted(self._pruned.items())}
+        series: Dict[str, Dict[str, Any]] = {}
+        for (crop, market, model_key), (fits, ms) in pruned.items():
+            entry = series.setdefault(f"{crop}/{market}", {"skippedFits": 0, "savedMs": 0.0, "members": []})
+            entry["skippedFits"] += fits
+            entry["savedMs"] = round(entry["savedMs"] + ms, 1)
+            entry["members"].append(model_key)
+        return {
+            "enabled": member_pruning.enabled,
+            "threshold": member_pruning.threshold,
+            "window": member_pruning.window,
+            "reprobeEvery": member_pruning.reprobe_every,
+            "skippedFits": sum(fits for fits, _ in pruned.values()),
+            "savedMs": round(sum(ms for _, ms in pruned.values()), 1),
+            "series": series,
+        }
+
+    def render(self) -> List[str]:
+        lines = self.requests.render() + self.models.render() + self.series_length.render()
+        with self._lock:
+            pruned = sorted(self._pruned.items())
+            fits = sorted(self._fits.items())
+        names = ("crop", "market", "model")
+        lines += _metric_family(
+            "rass_member_pruned_fits_total", "counter",
+            "Member fits skipped because the member was pruned for the series",
+            [(dict(zip(names, labels)), fits) for labels, (fits, _) in pruned],
+        )
+        lines += _metric_family(
+            "rass_member_pruned_saved_seconds_total", "counter",
+            "Estimated training time saved by pruned members",
+            [(dict(zip(names, labels)), round(ms / 1000, 6)) for labels, (_, ms) in pruned],
+        )
+        lines += _metric_family(
+            "rass_model_fits_total", "counter",
+            "SARIMA and Prophet fits by mode: reuse, append (filter only), warm or cold estimation",
+            [({"model": model_key, "mode": mode}, count) for (model_key, mode), count in fits],
+        )
+        return lines
+
+
+service_metrics = ServiceMetrics()
+
+
+# ============================================================================
+# MODEL EXECUTION POOL
+# ============================================================================
+
+class ForecastExecutor:
+    """
+    Runs CPU-bound model fitting in a ProcessPoolExecutor so the event loop
+    keeps serving cheap endpoints (e.g. /health) while models train.
+
+    - `workers`: pool size; 0 runs tasks on the default thread pool instead
+    - `max_pending`: tasks admitted at once; further requests get 503
+    - `task_timeout`: seconds before a request gives up with 504 (the worker
+      finishes the task in the background)
+    - `initializer`: run once in each worker process as it starts
+    """
+
+    def __init__(
+        self, workers: int, max_pending: int, task_timeout: float,
+        initializer=None, initargs: tuple = ()
+    ):
+        self.workers = max(0, workers)
+        self.max_pending = max(1, max_pending)
+        self.task_timeout = task_timeout
+        self.initializer = initializer
+        self.initargs = initargs
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.timed_out = 0
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=self.initializer,
+                initargs=self.initargs,
+            )
+        return self._pool
+
+    async def run(self, fn, *args, **kwargs):
+        """Run `fn(*args, **kwargs)` off the event loop. `fn` must be picklable."""
+        if self._pending >= self.max_pending:
+            self.rejected += 1
+            raise HTTPException(status_code=503, detail="Forecast queue is full, retry shortly")
+
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            # Workers return their model timings alongside the result
+            call = functools.partial(run_with_metrics, fn, *args, **kwargs)
+            pool = self._get_pool() if self.workers > 0 else None
+            result, events = await asyncio.wait_for(
+                loop.run_in_executor(pool, call), timeout=self.task_timeout
+            )
+            service_metrics.record_events(events)
+            self.completed += 1
+            return result
+        except asyncio.TimeoutError:
+            self.timed_out += 1
+            raise HTTPException(
+                status_code=504,
+                detail=f"Forecast task exceeded {self.task_timeout:.0f}s timeout"
+            )
+        except BrokenProcessPool:
+            logger.error("Forecast worker pool crashed; it will be recreated on next request")
+            self._pool = None
+            service_metrics.forget_registries()
+            raise HTTPException(status_code=503, detail="Forecast workers restarting, retry shortly")
+        finally:
+            self._pending -= 1
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "mode": "process" if self.workers > 0 else "thread",
+            "pending": self._pending,
+            "maxPending": self.max_pending,
+            "taskTimeoutSeconds": self.task_timeout,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "timedOut": self.timed_out,
+        }
+
+
+# Load persisted model artifacts eagerly (at boot and in every worker as it
+# starts) instead of lazily on first lookup
+MODEL_ARTIFACT_PRELOAD = os.getenv("MODEL_ARTIFACT_PRELOAD", "false").lower() in ("1", "true", "yes")
+# Import Prophet/statsmodels/scikit-learn/XGBoost/LightGBM in each worker as it
+# starts instead of on the first request that needs them
+PRELOAD_ML_BACKENDS = os.getenv("PRELOAD_ML_BACKENDS", "false").lower() in ("1", "true", "yes")
+
+forecast_executor = ForecastExecutor(
+    workers=int(os.getenv("FORECAST_POOL_WORKERS", str(min(4, os.cpu_count() or 1)))),
+    max_pending=int(os.getenv("FORECAST_POOL_MAX_PENDING", "64")),
+    task_timeout=float(os.getenv("FORECAST_TASK_TIMEOUT_SECONDS", "60")),
+    initializer=init_worker,
+    initargs=(MODEL_ARTIFACT_PRELOAD, PRELOAD_ML_BACKENDS),
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    report = backend_report()
+    logger.info(f"model.py imported in {report['modelImportMs']} ms; backends load on first use")
+    if PRELOAD_ML_BACKENDS:
+        try:
+            report = await forecast_executor.run(load_backends)
+            logger.info("Backend imports (ms): " + ", ".join(
+                f"{name}={info['importMs']}" for name, info in report["backends"].items() if info["loaded"]
+            ))
+        except Exception as e:
+            logger.warning(f"Backend preload failed: {e}")
+    if MODEL_ARTIFACT_PRELOAD:
+        try:
+            loaded = await forecast_executor.run(preload_model_artifacts)
+            logger.info(f"Model artifacts warm at startup ({loaded} loaded)")
+        except Exception as e:
+            logger.warning(f"Model artifact preload failed: {e}")
+    warmup_task = asyncio.create_task(forecast_warmup.run()) if forecast_warmup.enabled else None
+    yield
+    if warmup_task is not None:
+        warmup_task.cancel()
+    forecast_executor.shutdown()
+
+
 app = FastAPI(
     title="RASS Forecasting Service",
     description="AI-powered forecasting for agricultural prices, supply, and demand with ML-enhanced predictions",
-    version="2.0.0"
+    version="2.0.0",
+    lifespan=lifespan
 )
 SERVICE_STARTED_AT = datetime.utcnow()
 
@@ -100,6 +443,233 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    """Observe request latency labelled by route template (not raw path)"""
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        route = request.scope.get("route")
+        service_metrics.requests.observe(
+            (request.method, getattr(route, "path", "unmatched"), str(status)),
+            time.perf_counter() - start,
+        )
+
+# ============================================================================
+# FORECAST RESULT CACHE
+# ============================================================================
+
+class ForecastResultCache:
+    """
+    TTL- and size-bounded cache of forecast results keyed by a content hash of
+    the normalised request payload. Least recently used entries are evicted
+    first once `max_size` is reached.
+    """
+
+    def __init__(self, max_size: int = 512, ttl_seconds: float = 300.0):
+        self.max_size = max(1, max_size)
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+
+    @staticmethod
+    def fingerprint(namespace: str, payload: Dict[str, Any]) -> str:
+        """SHA-256 over a canonical JSON encoding of the payload"""
+        canonical = json.dumps(payload, sort_keys=True, default=str, separators=(",", ":"))
+        return hashlib.sha256(f"{namespace}:{canonical}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            stored_at, value = entry
+            if now - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                self.expired += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxSize": self.max_size,
+                "ttlSeconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "expired": self.expired,
+                "evictions": self.evictions,
+                "hitRate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+def _normalise_price_history(historical_prices: Optional[List[Dict[str, Any]]]) -> Optional[List[List[Any]]]:
+    """Reduce price dicts to the (date, price) pairs the model actually reads"""
+    if historical_prices is None:
+        return None
+    normalised = []
+    for item in historical_prices:
+        price = item.get("price", item.get("pricePerKg"))
+        normalised.append([
+            item.get("date", item.get("observedAt")),
+            float(price) if isinstance(price, (int, float)) else price,
+        ])
+    return normalised
+
+
+forecast_cache = ForecastResultCache(
+    max_size=int(os.getenv("FORECAST_CACHE_MAX_SIZE", "512")),
+    ttl_seconds=float(os.getenv("FORECAST_CACHE_TTL_SECONDS", "300")),
+)
+
+# Multi-model ensemble results for the synthetic crop/market catalogue. The
+# history is part of the key, so entries roll over with the calendar day.
+multi_model_cache = ForecastResultCache(
+    max_size=int(os.getenv("MULTI_MODEL_CACHE_MAX_SIZE", "256")),
+    ttl_seconds=float(os.getenv("MULTI_MODEL_CACHE_TTL_SECONDS", "3600")),
+)
+
+
+def _budgeted_get(cache: ForecastResultCache, cache_key: str, max_latency_ms: Optional[int]):
+    """
+    Cached result for `cache_key`. A complete result always qualifies; a
+    partial one (members left out by a latency budget) is only reused for
+    requests with the same budget.
+    """
+    result = cache.get(cache_key)
+    if result is None and max_latency_ms:
+        result = cache.get(f"{cache_key}:budget={max_latency_ms}")
+    return result
+
+
+def _budgeted_put(cache: ForecastResultCache, cache_key: str, max_latency_ms: Optional[int], result, partial: bool):
+    cache.put(f"{cache_key}:budget={max_latency_ms}" if partial else cache_key, result)
+
+
+async def _multi_model_result(
+    crop: str, market: str, days: int, hist: List[Dict[str, Any]],
+    max_latency_ms: Optional[int] = None, started_at: Optional[float] = None
+) -> Dict[str, Any]:
+    """Ensemble forecast for a catalogue series, served from multi_model_cache when possible"""
+    started_at = started_at or time.time()
+    cache_key = ForecastResultCache.fingerprint("multi-model", {
+        "crop": crop.lower(),
+        "market": market,
+        "days": days,
+        "history": _normalise_price_history(hist),
+    })
+    result = _budgeted_get(multi_model_cache, cache_key, max_latency_ms)
+    if result is None:
+        prices = [h["price"] for h in hist]
+        dates  = [datetime.strptime(h["date"], "%Y-%m-%d") for h in hist]
+        result = await forecast_executor.run(
+            forecast_ensemble, prices, dates, days, crop=crop, market=market,
+            max_latency_ms=max_latency_ms, started_at=started_at
+        )
+        _budgeted_put(multi_model_cache, cache_key, max_latency_ms, result, result.get("partial", False))
+    return result
+
+
+# ============================================================================
+# STARTUP WARM-UP
+# ============================================================================
+
+class ForecastWarmup:
+    """
+    Background task that precomputes `/forecast/multi-model` results for every
+    RWANDA_CROPS x MARKET_PREMIUMS pair, at most `concurrency` at a time.
+
+    It runs after startup completes, so readiness and cheap endpoints are never
+    blocked; progress is reported under `warmup` in GET /health.
+    """
+
+    def __init__(self, enabled: bool, concurrency: int, days: int = 14):
+        self.enabled = enabled
+        self.concurrency = max(1, concurrency)
+        self.days = days
+        self.status = "pending" if enabled else "disabled"
+        self.total = 0
+        self.completed = 0
+        self.failed = 0
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    async def _warm_one(self, semaphore: asyncio.Semaphore, crop: str, market: str) -> None:
+        async with semaphore:
+            try:
+                hist = _generate_crop_prices(crop, days=60, market=market)
+                await _multi_model_result(crop, market, self.days, hist)
+                self.completed += 1
+            except Exception as e:
+                self.failed += 1
+                detail = e.detail if isinstance(e, HTTPException) else e
+                logger.warning(f"Warm-up failed for {crop}/{market}: {detail}")
+
+    async def run(self) -> None:
+        grid = [(crop, market) for crop in RWANDA_CROPS for market in MARKET_PREMIUMS]
+        self.total = len(grid)
+        self.status = "running"
+        self.started_at = time.monotonic()
+        logger.info(f"Warm-up started: {self.total} crop/market series, concurrency {self.concurrency}")
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        try:
+            await asyncio.gather(*(self._warm_one(semaphore, c, m) for c, m in grid))
+            self.status = "done"
+        except asyncio.CancelledError:
+            self.status = "cancelled"
+            raise
+        finally:
+            self.finished_at = time.monotonic()
+        logger.info(
+            f"Warm-up finished: {self.completed}/{self.total} warmed, {self.failed} failed "
+            f"in {self.finished_at - self.started_at:.1f}s"
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        elapsed = None
+        if self.started_at is not None:
+            elapsed = round((self.finished_at or time.monotonic()) - self.started_at, 1)
+        return {
+            "status": self.status,
+            "total": self.total,
+            "completed": self.completed,
+            "failed": self.failed,
+            "progress": round((self.completed + self.failed) / self.total, 4) if self.total else 0.0,
+            "concurrency": self.concurrency,
+            "elapsedSeconds": elapsed,
+        }
+
+
+forecast_warmup = ForecastWarmup(
+    enabled=os.getenv("FORECAST_WARMUP", "false").lower() in ("1", "true", "yes"),
+    concurrency=int(os.getenv("FORECAST_WARMUP_CONCURRENCY", "2")),
+)
+
 # Pydantic models
 class PriceForecastRequest(BaseModel):
     crop: str
@@ -124,6 +694,34 @@ class EnhancedPriceForecastRequest(BaseModel):
         default=None,
         description="External factors: rainfallAnomaly, fuelPriceIndex, expectedSupply, demandIndex, season"
     )
+    max_latency_ms: Optional[int] = Field(
+        default=None, ge=1,
+        description="Latency budget; slower ensemble members are skipped or dropped to meet it"
+    )
+
+FORECAST_BATCH_MAX_ITEMS = int(os.getenv("FORECAST_BATCH_MAX_ITEMS", "500"))
+
+class BatchForecastItem(BaseModel):
+    """One series in a POST /forecast/batch request"""
+    crop: str = Field(..., description="Crop type (e.g., maize, beans, rice)")
+    market: str = Field(..., description="Market name")
+    days: Optional[int] = Field(default=None, ge=1, le=14, description="Overrides the batch horizon")
+    historical_prices: Optional[List[Dict[str, Any]]] = Field(
+        default=None,
+        description="List of historical prices with 'date' and 'price' or 'pricePerKg'"
+    )
+    market_info: Optional[Dict[str, Any]] = None
+    external_factors: Optional[Dict[str, Any]] = None
+    max_latency_ms: Optional[int] = Field(default=None, ge=1, description="Overrides the batch latency budget")
+
+class BatchForecastRequest(BaseModel):
+    """Many series forecast with the ML model in one round trip"""
+    items: List[BatchForecastItem] = Field(..., min_length=1, max_length=FORECAST_BATCH_MAX_ITEMS)
+    days: int = Field(default=7, ge=1, le=14, description="Forecast horizon in days")
+    max_latency_ms: Optional[int] = Field(
+        default=None, ge=1,
+        description="Latency budget per item, counted from when the item starts"
+    )
 
 class EnhancedForecastResponse(BaseModel):
     """Enhanced response with trend, volatility, and recommendations"""
@@ -138,6 +736,25 @@ class EnhancedForecastResponse(BaseModel):
     top_factors: List[str] = Field(default=[], description="Top contributing factors")
     role_specific_advice: str = Field(default="", description="Role-tailored actionable advice")
     role: str = Field(default="general", description="User role context")
+    members: Dict[str, Any] = Field(default={}, description="Per-member status, weight and timings")
+    partial: bool = Field(default=False, description="True when a latency budget left members out")
+    pruning: Dict[str, Any] = Field(default={}, description="Members pruned for this series and the compute saved")
+
+class SeriesObservationsRequest(BaseModel):
+    """New observations for a stored series, and the forecast to return"""
+    observations: List[Dict[str, Any]] = Field(
+        ..., min_length=1,
+        description="New or revised prices with 'date' and 'price' or 'pricePerKg'"
+    )
+    days: int = Field(default=7, ge=1, le=14, description="Forecast horizon in days")
+    market_info: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description="Market features; a change triggers a full retrain"
+    )
+    external_factors: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description="External factors; a change triggers a full retrain"
+    )
 
 class SupplyForecastRequest(BaseModel):
     crop: str
@@ -416,15 +1033,6 @@ class ForecastingEngine:
         """Calculate mean"""
         return sum(values) / len(values) if values else 0.0
     
-    @staticmethod
-    def _calculate_std(values: List[float]) -> float:
-        """Calculate standard deviation"""
-        if not values or len(values) < 2:
-            return 0.0
-        mean = ForecastingEngine._calculate_mean(values)
-        variance = sum((x - mean) ** 2 for x in values) / (len(values) - 1)
-        return math.sqrt(variance)
-    
     @staticmethod
     def _calculate_trend(prices: List[float]) -> float:
         """Calculate linear trend"""
@@ -475,8 +1083,9 @@ class ForecastingEngine:
                 prices = [300.0] * 30  # Default fallback
             
             # Calculate statistics
-            mean_price = ForecastingEngine._calculate_mean(prices)
-            std_price = ForecastingEngine._calculate_std(prices)
+            stats = RollingWindowStats((), prices)
+            mean_price = stats.mean()
+            std_price = stats.std()
             trend = ForecastingEngine._calculate_trend(prices[-min(30, len(prices)):])
             current_price = prices[-1] if prices else mean_price
             
@@ -616,8 +1225,9 @@ class ForecastingEngine:
                     'severity': 'low'
                 }
             
-            mean_price = ForecastingEngine._calculate_mean(prices)
-            std_price = ForecastingEngine._calculate_std(prices)
+            stats = RollingWindowStats((), prices)
+            mean_price = stats.mean()
+            std_price = stats.std()
             z_score = (current_price - mean_price) / std_price if std_price > 0 else 0.0
             
             is_anomaly = abs(z_score) > 2.5
@@ -701,9 +1311,61 @@ async def health():
         "coverage": {
             "supportedCrops": len(RWANDA_CROPS),
             "supportedMarkets": len(MARKET_PREMIUMS)
-        }
+        },
+        # Models live in the pool workers' registries when there is a pool
+        "modelRegistry": (
+            service_metrics.registry_summary() if forecast_executor.workers > 0
+            else get_model_registry().stats()
+        ),
+        "memberPruning": service_metrics.pruning_summary(),
+        "seriesStore": series_store.stats(),
+        "forecastCache": forecast_cache.stats(),
+        "multiModelCache": multi_model_cache.stats(),
+        "executor": forecast_executor.stats(),
+        "warmup": forecast_warmup.stats(),
+        "imports": backend_report()
     }
 
+def _render_metrics() -> str:
+    lines = service_metrics.render()
+
+    caches = {"forecast": forecast_cache.stats(), "multi_model": multi_model_cache.stats()}
+    lines += _metric_family("rass_cache_hits_total", "counter", "Forecast result cache hits",
+                            [({"cache": name}, s["hits"]) for name, s in caches.items()])
+    lines += _metric_family("rass_cache_misses_total", "counter", "Forecast result cache misses",
+                            [({"cache": name}, s["misses"]) for name, s in caches.items()])
+    lines += _metric_family("rass_cache_hit_ratio", "gauge", "Hits / lookups since start",
+                            [({"cache": name}, s["hitRate"]) for name, s in caches.items()])
+    lines += _metric_family("rass_cache_entries", "gauge", "Entries currently cached",
+                            [({"cache": name}, s["size"]) for name, s in caches.items()])
+
+    series = series_store.stats()
+    lines += _metric_family("rass_series_updates_total", "counter", "Stored-series appends by model update",
+                            [({"update": update}, n) for update, n in series["updates"].items()])
+    lines += _metric_family("rass_series_stored", "gauge", "Series held in the series store",
+                            [({}, series["series"])])
+
+    executor = forecast_executor.stats()
+    lines += _metric_family("rass_executor_workers", "gauge", "Model worker processes (0 = thread pool)",
+                            [({}, executor["workers"])])
+    lines += _metric_family("rass_executor_pending_tasks", "gauge", "Model tasks admitted and not finished",
+                            [({}, executor["pending"])])
+    lines += _metric_family("rass_executor_queue_depth", "gauge", "Model tasks waiting for a free worker",
+                            [({}, max(0, executor["pending"] - executor["workers"]))])
+    lines += _metric_family("rass_executor_tasks_total", "counter", "Model tasks by outcome", [
+        ({"outcome": "completed"}, executor["completed"]),
+        ({"outcome": "rejected"}, executor["rejected"]),
+        ({"outcome": "timed_out"}, executor["timedOut"]),
+    ])
+    return "\n".join(lines) + "\n"
+
+
+@app.get("/metrics")
+async def metrics():
+    """Prometheus scrape endpoint"""
+    service_metrics.record_events(drain_metrics())
+    return Response(content=_render_metrics(), media_type=PROMETHEUS_MEDIA_TYPE)
+
 @app.post("/forecast/price", response_model=ForecastResponse, dependencies=[Depends(require_api_key)])
 async def forecast_price_legacy(request: PriceForecastRequest):
     """Legacy price forecast endpoint (for backward compatibility)"""
@@ -717,8 +1379,67 @@ async def forecast_price_legacy(request: PriceForecastRequest):
     return ForecastResponse(**result)
 
 
+async def _ml_price_forecast(
+    crop: str,
+    market: str,
+    days: int,
+    historical_prices: Optional[List[Dict[str, Any]]] = None,
+    market_info: Optional[Dict[str, Any]] = None,
+    external_factors: Optional[Dict[str, Any]] = None,
+    max_latency_ms: Optional[int] = None,
+    started_at: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    RASSPriceModel forecast for one series, run in the worker pool and served
+    from forecast_cache when the same payload was seen recently.
+
+    `max_latency_ms` counts from `started_at` (time.time(), default now).
+
+    Returns {"forecast": predict_price(...) result, "current_price": float}.
+    """
+    started_at = started_at or time.time()
+    cache_key = forecast_cache.fingerprint("price-enhanced", {
+        "crop": crop.strip().lower(),
+        "market": market.strip().lower(),
+        "days": days,
+        "historical_prices": _normalise_price_history(historical_prices),
+        "market_info": market_info,
+        "external_factors": external_factors,
+    })
+    cached = _budgeted_get(forecast_cache, cache_key, max_latency_ms)
+
+    if cached is None:
+        # Generate synthetic data if no historical data provided
+        historical_data = historical_prices
+        if not historical_data:
+            historical_data = ForecastingEngine._generate_synthetic_prices(30)
+
+        # Call the ML model in the worker pool
+        forecast = await forecast_executor.run(
+            predict_price,
+            historical_data=historical_data,
+            forecast_days=days,
+            market_info=market_info,
+            external_info=external_factors,
+            crop=crop,
+            market=market,
+            max_latency_ms=max_latency_ms,
+            started_at=started_at
+        )
+
+        prices = [p.get('price', p.get('pricePerKg', 300.0)) for p in historical_data if isinstance(p.get('price', p.get('pricePerKg')), (int, float))]
+        cached = {"forecast": forecast, "current_price": prices[-1] if prices else 300.0}
+        _budgeted_put(forecast_cache, cache_key, max_latency_ms, cached, forecast.get("partial", False))
+
+    return cached
+
+
 @app.post("/forecast/price/enhanced", response_model=EnhancedForecastResponse, dependencies=[Depends(require_api_key)])
-async def forecast_price_enhanced(request: EnhancedPriceForecastRequest, role: str = Header(None, alias="X-User-Role")):
+async def forecast_price_enhanced(
+    request: EnhancedPriceForecastRequest,
+    role: str = Header(None, alias="X-User-Role"),
+    max_latency_header: Optional[int] = Header(None, alias="X-Max-Latency-Ms", ge=1),
+):
     """
     Enhanced ML-powered price forecast with Rwanda-specific factors.
 
@@ -729,26 +1450,28 @@ async def forecast_price_enhanced(request: EnhancedPriceForecastRequest, role: s
     - Actionable recommendation: Sell Now, Hold, Monitor
     - Human-readable explanation with top contributing factors
     - Role-specific advice tailored to: farmer, cooperative, buyer, transporter, government
+
+    With max_latency_ms (or an X-Max-Latency-Ms header) the slower members
+    are skipped or dropped to meet the budget; `members` reports which ran.
     """
+    started_at = time.time()
     logger.info(f"Enhanced price forecast: {request.crop} in {request.market} for {request.days} days (role: {role})")
 
     try:
-        # Generate synthetic data if no historical data provided
-        historical_data = request.historical_prices
-        if not historical_data:
-            historical_data = ForecastingEngine._generate_synthetic_prices(30)
-
-        # Call the ML model
-        result = predict_price(
-            historical_data=historical_data,
-            forecast_days=request.days,
+        cached = await _ml_price_forecast(
+            crop=request.crop,
+            market=request.market,
+            days=request.days,
+            historical_prices=request.historical_prices,
             market_info=request.market_info,
-            external_info=request.external_factors
+            external_factors=request.external_factors,
+            max_latency_ms=request.max_latency_ms or max_latency_header,
+            started_at=started_at,
         )
 
-        # Extract forecast metrics for role-specific advice
-        prices = [p.get('price', p.get('pricePerKg', 300.0)) for p in historical_data if isinstance(p.get('price', p.get('pricePerKg')), (int, float))]
-        current_price = prices[-1] if prices else 300.0
+        # Role advice is cheap, so it is recomputed on every hit
+        result = dict(cached["forecast"])
+        current_price = cached["current_price"]
 
         medians = [p['median'] for p in result['predictions']]
         avg_forecast = ForecastingEngine._calculate_mean(medians)
@@ -774,6 +1497,8 @@ async def forecast_price_enhanced(request: EnhancedPriceForecastRequest, role: s
 
         return EnhancedForecastResponse(**result)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Enhanced forecast error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Forecast error: {str(e)}")
@@ -842,44 +1567,187 @@ async def detect_anomaly(request: AnomalyDetectionRequest):
     )
     return result
 
+# ============================================================================
+# NDJSON STREAMING (batch endpoints)
+# ============================================================================
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def _wants_ndjson(stream: bool, accept: Optional[str]) -> bool:
+    """Stream when asked via ?stream=true or an Accept: application/x-ndjson header"""
+    return stream or NDJSON_MEDIA_TYPE in (accept or "").lower()
+
+
+def _ndjson_line(obj: Any) -> bytes:
+    return (json.dumps(jsonable_encoder(obj)) + "\n").encode("utf-8")
+
+
+def _batch_summary(count: int, failed: int) -> Dict[str, Any]:
+    return {
+        "done": True,
+        "forecast_date": datetime.now().isoformat(),
+        "count": count,
+        "succeeded": count - failed,
+        "failed": failed,
+    }
+
+
+async def _stream_completed(coros: Iterable) -> AsyncIterator[bytes]:
+    """
+    Yield one NDJSON line per result as soon as it completes (completion
+    order, each carrying its request `index`), then a summary line. Nothing
+    is accumulated, and pending work is cancelled if the client goes away.
+    """
+    tasks = [asyncio.ensure_future(c) for c in coros]
+    failed = 0
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            result = await next_done
+            if result.get("status") == "error":
+                failed += 1
+            yield _ndjson_line(result)
+        yield _ndjson_line(_batch_summary(len(tasks), failed))
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
 @app.get("/forecast/batch")
 async def batch_forecast(
     crops: str = Query(..., description="Comma-separated list of crops"),
     markets: str = Query(..., description="Comma-separated list of markets"),
-    days: int = Query(7, description="Forecast period in days")
+    days: int = Query(7, description="Forecast period in days"),
+    stream: bool = Query(False, description="Stream results as NDJSON"),
+    accept: Optional[str] = Header(None),
 ):
     """Batch forecast for multiple crops and markets"""
     crop_list = [c.strip() for c in crops.split(',')]
     market_list = [m.strip() for m in markets.split(',')]
-    
-    results = []
-    for crop in crop_list:
-        for market in market_list:
-            try:
-                forecast = ForecastingEngine.forecast_price(crop, market, days)
-                results.append({
-                    'crop': crop,
-                    'market': market,
-                    **forecast
-                })
-            except Exception as e:
-                logger.error(f"Error forecasting {crop} in {market}: {str(e)}")
-                results.append({
-                    'crop': crop,
-                    'market': market,
-                    'error': str(e)
-                })
-    
+
+    def forecasts():
+        for crop in crop_list:
+            for market in market_list:
+                try:
+                    forecast = ForecastingEngine.forecast_price(crop, market, days)
+                    yield {
+                        'crop': crop,
+                        'market': market,
+                        **forecast
+                    }
+                except Exception as e:
+                    logger.error(f"Error forecasting {crop} in {market}: {str(e)}")
+                    yield {
+                        'crop': crop,
+                        'market': market,
+                        'error': str(e)
+                    }
+
+    if _wants_ndjson(stream, accept):
+        def lines():
+            count = failed = 0
+            for result in forecasts():
+                count += 1
+                failed += 'error' in result
+                yield _ndjson_line(result)
+            yield _ndjson_line(_batch_summary(count, failed))
+        return StreamingResponse(lines(), media_type=NDJSON_MEDIA_TYPE)
+
     return {
         'forecast_date': datetime.now().isoformat(),
-        'forecasts': results
+        'forecasts': list(forecasts())
     }
 
+# Batch items forecast at once; defaults to one per pool worker
+FORECAST_BATCH_CONCURRENCY = int(os.getenv("FORECAST_BATCH_CONCURRENCY", "0")) or max(1, forecast_executor.workers)
+
+
+async def _batch_item_forecast(
+    index: int, item: BatchForecastItem, days: int, semaphore: asyncio.Semaphore,
+    max_latency_ms: Optional[int] = None
+) -> Dict[str, Any]:
+    """Forecast one batch item; failures are reported on the item, never raised"""
+    async with semaphore:
+        try:
+            cached = await _ml_price_forecast(
+                crop=item.crop,
+                market=item.market,
+                days=item.days or days,
+                historical_prices=item.historical_prices,
+                market_info=item.market_info,
+                external_factors=item.external_factors,
+                max_latency_ms=item.max_latency_ms or max_latency_ms,
+            )
+            return {
+                "index": index,
+                "crop": item.crop,
+                "market": item.market,
+                "status": "ok",
+                "current_price": cached["current_price"],
+                **cached["forecast"],
+            }
+        except Exception as e:
+            detail = e.detail if isinstance(e, HTTPException) else str(e)
+            logger.error(f"Batch item {index} ({item.crop} in {item.market}) failed: {detail}")
+            return {
+                "index": index,
+                "crop": item.crop,
+                "market": item.market,
+                "status": "error",
+                "error": detail,
+            }
+
+
+@app.post("/forecast/batch", dependencies=[Depends(require_api_key)])
+async def batch_forecast_ml(
+    request: BatchForecastRequest,
+    stream: bool = Query(False, description="Stream results as NDJSON"),
+    accept: Optional[str] = Header(None),
+    max_latency_header: Optional[int] = Header(None, alias="X-Max-Latency-Ms", ge=1),
+):
+    """
+    ML price forecasts for many user-supplied series in one request.
+
+    Each item runs RASSPriceModel in the worker pool, at most
+    FORECAST_BATCH_CONCURRENCY at a time. A failing item is returned with
+    status "error" and does not affect the others; results keep request order.
+
+    With ?stream=true (or Accept: application/x-ndjson) each item is sent as
+    an NDJSON line the moment it finishes, followed by a summary line.
+
+    A latency budget (max_latency_ms or X-Max-Latency-Ms) applies to each
+    item separately, from the moment that item starts.
+    """
+    logger.info(f"Batch ML forecast: {len(request.items)} series for {request.days} days")
+
+    semaphore = asyncio.Semaphore(FORECAST_BATCH_CONCURRENCY)
+    max_latency_ms = request.max_latency_ms or max_latency_header
+    items = (
+        _batch_item_forecast(i, item, request.days, semaphore, max_latency_ms)
+        for i, item in enumerate(request.items)
+    )
+    if _wants_ndjson(stream, accept):
+        return StreamingResponse(_stream_completed(items), media_type=NDJSON_MEDIA_TYPE)
+
+    results = await asyncio.gather(*items)
+    failed = sum(1 for r in results if r["status"] == "error")
+
+    return {
+        "forecast_date": datetime.now().isoformat(),
+        "count": len(results),
+        "succeeded": len(results) - failed,
+        "failed": failed,
+        "forecasts": results,
+    }
+
+
 @app.get("/forecast/multi-model/{crop}", dependencies=[Depends(require_api_key)])
 async def multi_model_forecast(
     crop: str,
     market: str = "Kigali",
     days: int = 14,
+    max_latency_ms: Optional[int] = Query(None, ge=1, description="Latency budget in milliseconds"),
+    max_latency_header: Optional[int] = Header(None, alias="X-Max-Latency-Ms", ge=1),
 ):
     """
     Multi-model ensemble price forecast for a specific Rwanda crop.
@@ -890,20 +1758,19 @@ async def multi_model_forecast(
     - **crop**: One of maize, beans, sorghum, cassava, potatoes, tomatoes, rice, wheat
     - **market**: Rwanda market name (default Kigali)
     - **days**: Forecast horizon 1-30 days
+    - **max_latency_ms**: Latency budget (or X-Max-Latency-Ms); members that
+      would miss it are skipped or dropped and the weights renormalised
     """
+    started_at = time.time()
     days = max(1, min(days, 30))
     logger.info(f"Multi-model forecast: {crop} in {market} for {days} days")
 
     try:
         hist = _generate_crop_prices(crop, days=60, market=market)
-        prices = [h["price"] for h in hist]
-        dates  = [
-            datetime.strptime(h["date"], "%Y-%m-%d") for h in hist
-        ]
-
-        ef = EnsembleForecaster()
-        ef.fit_and_weight(prices, dates)
-        result = ef.forecast(days, prices, dates)
+        result = await _multi_model_result(
+            crop, market, days, hist,
+            max_latency_ms=max_latency_ms or max_latency_header, started_at=started_at
+        )
 
         # Format per-model predictions with dates
         base_date = datetime.now()
@@ -925,14 +1792,83 @@ async def multi_model_forecast(
             "modelWeights":     result["modelWeights"],
             "bestModel":        result["bestModel"],
             "ensembleAccuracy": result["ensembleAccuracy"],
+            "members":          result.get("members", {}),
+            "partial":          result.get("partial", False),
             "generatedAt":      datetime.now().isoformat(),
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Multi-model forecast error: {e}")
         raise HTTPException(status_code=500, detail=f"Multi-model forecast error: {str(e)}")
 
 
+@app.post("/series/{crop}/{market}/observations", dependencies=[Depends(require_api_key)])
+async def append_series_observations(crop: str, market: str, request: SeriesObservationsRequest):
+    """
+    Append observations to a stored series and forecast it.
+
+    New days are folded into the series' model incrementally (Holt level and
+    trend, SARIMA filter state) in milliseconds, not the seconds of a fit. A full
+    retrain, run in the worker pool, happens only for a new series, a revised
+    day, changed market_info/external_factors, a forecast error beyond
+    SERIES_DRIFT_Z recent standard deviations, or once the model is older than
+    SERIES_RETRAIN_MAX_AGE_SECONDS or has absorbed SERIES_RETRAIN_MAX_OBS
+    observations. `update` and `reason` report which path was taken. A
+    retrain that errors or cannot train keeps the previous model and is
+    requested again by the next append (`series.pendingRetrain`).
+    """
+    # Appends, retrains and forecasts of one series run in arrival order
+    state = series_store.open(crop, market)
+    async with state.lock:
+        try:
+            started = time.perf_counter()
+            outcome = await asyncio.to_thread(
+                series_store.append, state, request.observations,
+                request.market_info, request.external_factors
+            )
+            if outcome["update"] == "retrain":
+                model = await forecast_executor.run(
+                    train_series_model,
+                    history=state.history,
+                    market_info=state.market_info,
+                    external_info=state.external_info,
+                    crop=crop,
+                    market=market
+                )
+                if not series_store.set_model(state, model):
+                    # The previous model keeps serving; the retrain stays pending
+                    outcome = {**outcome, "update": "none", "reason": "retrain-failed"}
+            update_ms = (time.perf_counter() - started) * 1000
+
+            forecast = await asyncio.to_thread(series_store.forecast, state, request.days)
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"Series update error for {crop}/{market}: {e}")
+            raise HTTPException(status_code=500, detail=f"Series update error: {str(e)}")
+
+        dates = state.history.date_list
+        return {
+            "crop": crop.lower(),
+            "market": market,
+            "appended": outcome["appended"],
+            "update": outcome["update"],
+            "reason": outcome["reason"],
+            "updateMs": round(update_ms, 2),
+            "series": {
+                "length": len(dates),
+                "firstDate": dates[0].strftime("%Y-%m-%d") if dates else None,
+                "lastDate": dates[-1].strftime("%Y-%m-%d") if dates else None,
+                "trainedAt": datetime.fromtimestamp(state.trained_at).isoformat() if state.trained_at else None,
+                "observationsSinceTraining": state.since_training,
+                "pendingRetrain": state.pending_retrain,
+            },
+            "forecast": forecast,
+        }
+
+
 @app.get("/forecast/crop-demand/{crop}", dependencies=[Depends(require_api_key)])
 async def forecast_crop_demand(
     crop: str,
@@ -1031,7 +1967,8 @@ async def national_forecast_overview():
             hist   = _generate_crop_prices(crop_name, days=30, market="Kigali")
             prices = [h["price"] for h in hist]
 
-            avg_p  = sum(prices) / len(prices) if prices else info["base"]
+            stats  = RollingWindowStats((), prices)
+            avg_p  = stats.mean() if prices else info["base"]
             recent = prices[-7:] if len(prices) >= 7 else prices
             older  = prices[-14:-7] if len(prices) >= 14 else prices[:max(1, len(prices) // 2)]
 
@@ -1043,7 +1980,7 @@ async def national_forecast_overview():
 
             # Coefficient of variation for volatility classification
             m   = avg_p
-            s   = math.sqrt(sum((p - m) ** 2 for p in prices) / max(len(prices) - 1, 1))
+            s   = stats.std()
             cv  = s / m if m > 0 else 0.0
             all_volatilities.append(cv)
             vol_str = "HIGH" if cv > 0.20 else "MEDIUM" if cv > 0.10 else "LOW"
@@ -1113,9 +2050,9 @@ async def volatility_report():
             hist   = _generate_crop_prices(crop_name, days=60, market="Kigali")
             prices = [h["price"] for h in hist]
 
-            n     = len(prices)
-            mu    = sum(prices) / n if n else 0.0
-            sigma = math.sqrt(sum((p - mu) ** 2 for p in prices) / max(n - 1, 1))
+            stats = RollingWindowStats((), prices)
+            mu    = stats.mean()
+            sigma = stats.std()
             cv    = sigma / mu if mu > 0 else 0.0
 
             min_p = min(prices) if prices else 0.0
@@ -1171,6 +2108,9 @@ async def model_performance():
         all_model_metrics: Dict[str, Dict[str, Any]] = {}
         forecast_vs_actual: List[Dict[str, Any]] = []
 
+        # Fit every crop's ensemble concurrently in the worker pool
+        evaluations = []
+        tasks = []
         for crop_name in eval_crops:
             hist = _generate_crop_prices(crop_name, days=60, market="Kigali")
             prices = [h["price"] for h in hist]
@@ -1183,11 +2123,15 @@ async def model_performance():
             test = prices[-holdout_days:]
             test_dates = dates_list[-holdout_days:]
 
-            # Build ensemble and evaluate
-            ens = EnsembleForecaster()
-            ens.fit_and_weight(train, dates_list[:-holdout_days])
-            result = ens.forecast(holdout_days, train, dates_list[:-holdout_days])
+            evaluations.append((crop_name, test, test_dates))
+            tasks.append(forecast_executor.run(
+                forecast_ensemble, train, dates_list[:-holdout_days], holdout_days,
+                crop=crop_name, market="Kigali"
+            ))
+
+        results = await asyncio.gather(*tasks)
 
+        for (crop_name, test, test_dates), result in zip(evaluations, results):
             # Per-model evaluation
             model_preds = result.get("models", {})
             for model_key, preds in model_preds.items():
@@ -1277,6 +2221,8 @@ async def model_performance():
             "holdoutDays": holdout_days,
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Model performance evaluation error: {e}")
         raise HTTPException(status_code=500, detail=f"Model performance error: {str(e)}")
@@ -4,54 +4,149 @@ Pure Python implementation for agricultural price forecasting
 Optimized for Rwanda's agricultural markets with short-term forecasts (1-14 days)
 """
 
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Collection
 from datetime import datetime, timedelta
 from enum import Enum
+import asyncio
+import functools
+import hashlib
+import json
+import importlib
+import importlib.metadata
+import importlib.util
 import math
 import logging
-import pandas as pd
+import multiprocessing
+import os
+import re
+import threading
+import time
+
+_MODULE_IMPORT_STARTED = time.perf_counter()
 
 logger = logging.getLogger(__name__)
 
-# Try to import advanced ML libraries safely
-try:
-    from prophet import Prophet
-    PROPHET_AVAILABLE = True
-except ImportError:
-    PROPHET_AVAILABLE = False
+# ============================================================================
+# OPTIONAL BACKENDS (probed at import, loaded on first use)
+# ============================================================================
+
+# Milliseconds spent importing each heavy backend in this process
+BACKEND_IMPORT_MS: Dict[str, float] = {}
+
+
+def _module_available(name: str) -> bool:
+    """Check that a package is installed without importing it"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+class LazyBackend:
+    """
+    Stand-in for a heavy optional import, resolved on first attribute access
+    or call, so `Prophet(...)` or `xgb.XGBRegressor(...)` work unchanged.
+
+    The import is timed into BACKEND_IMPORT_MS. If it fails, the module-level
+    availability `flag` is cleared and ImportError is raised, sending the
+    caller down its existing fallback path.
+    """
+
+    def __init__(self, name: str, module: str, attr: str = None, flag: str = None):
+        self._name = name
+        self._module = module
+        self._attr = attr
+        self._flag = flag
+        self._target = None
+        self._error: Optional[Exception] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._target is not None
+
+    def _resolve(self):
+        if self._target is not None:
+            return self._target
+        with self._lock:
+            if self._target is None:
+                if self._error is None:
+                    start = time.perf_counter()
+                    try:
+                        module = importlib.import_module(self._module)
+                        self._target = getattr(module, self._attr) if self._attr else module
+                    except Exception as e:
+                        self._error = e
+                        if self._flag:
+                            globals()[self._flag] = False
+                        logger.warning(f"{self._name} failed to import: {e}")
+                    BACKEND_IMPORT_MS[self._name] = round((time.perf_counter() - start) * 1000, 1)
+                if self._error is not None:
+                    raise ImportError(f"{self._name} unavailable: {self._error}") from self._error
+        return self._target
+
+    def __getattr__(self, name: str):
+        return getattr(self._resolve(), name)
+
+    def __call__(self, *args, **kwargs):
+        return self._resolve()(*args, **kwargs)
+
+
+PANDAS_AVAILABLE = _module_available("pandas")
+
+PROPHET_AVAILABLE = _module_available("prophet")
+if not PROPHET_AVAILABLE:
     logger.warning("Prophet not available. Falling back to Holt-Linear model.")
 
-try:
-    from statsmodels.tsa.statespace.sarimax import SARIMAX
-    SARIMA_AVAILABLE = True
-except ImportError:
-    SARIMA_AVAILABLE = False
+SARIMA_AVAILABLE = _module_available("statsmodels")
+if not SARIMA_AVAILABLE:
     logger.warning("statsmodels not available. SARIMA model disabled.")
 
-try:
-    from sklearn.ensemble import GradientBoostingRegressor
-    SKLEARN_AVAILABLE = True
-except ImportError:
-    SKLEARN_AVAILABLE = False
+SKLEARN_AVAILABLE = _module_available("sklearn")
+if not SKLEARN_AVAILABLE:
     logger.warning("scikit-learn not available. Gradient boosting disabled.")
 
-try:
-    import xgboost as xgb
-    XGBOOST_AVAILABLE = True
-except (ImportError, Exception) as e:
-    XGBOOST_AVAILABLE = False
-    logger.warning(f"XGBoost not available: {e}")
-    xgb = None
-
-try:
-    import lightgbm as lgb
-    LIGHTGBM_AVAILABLE = True
-except (ImportError, Exception) as e:
-    LIGHTGBM_AVAILABLE = False
-    logger.warning(f"LightGBM not available: {e}")
-    lgb = None
-
+XGBOOST_AVAILABLE = _module_available("xgboost")
+if not XGBOOST_AVAILABLE:
+    logger.warning("XGBoost not available")
+
+LIGHTGBM_AVAILABLE = _module_available("lightgbm")
+if not LIGHTGBM_AVAILABLE:
+    logger.warning("LightGBM not available")
+
+JOBLIB_AVAILABLE = _module_available("joblib")
+if not JOBLIB_AVAILABLE:
+    logger.warning("joblib not available. Trained models will not be persisted.")
+
+pd = LazyBackend("pandas", "pandas", flag="PANDAS_AVAILABLE")
+Prophet = LazyBackend("prophet", "prophet", "Prophet", flag="PROPHET_AVAILABLE")
+SARIMAX = LazyBackend(
+    "statsmodels", "statsmodels.tsa.statespace.sarimax", "SARIMAX", flag="SARIMA_AVAILABLE"
+)
+GradientBoostingRegressor = LazyBackend(
+    "scikit-learn", "sklearn.ensemble", "GradientBoostingRegressor", flag="SKLEARN_AVAILABLE"
+)
+xgb = LazyBackend("xgboost", "xgboost", flag="XGBOOST_AVAILABLE") if XGBOOST_AVAILABLE else None
+lgb = LazyBackend("lightgbm", "lightgbm", flag="LIGHTGBM_AVAILABLE") if LIGHTGBM_AVAILABLE else None
+joblib = LazyBackend("joblib", "joblib", flag="JOBLIB_AVAILABLE")
+
+_BACKENDS: Dict[str, Tuple[Optional[LazyBackend], str]] = {
+    "pandas": (pd, "PANDAS_AVAILABLE"),
+    "prophet": (Prophet, "PROPHET_AVAILABLE"),
+    "statsmodels": (SARIMAX, "SARIMA_AVAILABLE"),
+    "scikit-learn": (GradientBoostingRegressor, "SKLEARN_AVAILABLE"),
+    "xgboost": (xgb, "XGBOOST_AVAILABLE"),
+    "lightgbm": (lgb, "LIGHTGBM_AVAILABLE"),
+    "joblib": (joblib, "JOBLIB_AVAILABLE"),
+}
+
+# NumPy is light and used throughout, so it stays an eager import
 try:
     import numpy as np
     NUMPY_AVAILABLE = True
@@ -60,6 +155,32 @@ except ImportError:
     logger.warning("NumPy not available. LSTMLiteModel will use Holt-Linear fallback.")
 
 
+def load_backends() -> Dict[str, Any]:
+    """Import every available backend now (e.g. in a warm worker); returns backend_report()"""
+    for name, (backend, flag) in _BACKENDS.items():
+        if backend is not None and globals().get(flag, False) and not backend.loaded:
+            try:
+                backend._resolve()
+            except ImportError:
+                pass
+    return backend_report()
+
+
+def backend_report() -> Dict[str, Any]:
+    """Availability, load state and import time (ms) of each heavy backend in this process"""
+    return {
+        "modelImportMs": MODEL_IMPORT_MS,
+        "backends": {
+            name: {
+                "available": bool(globals().get(flag, False)) and backend is not None,
+                "loaded": backend is not None and backend.loaded,
+                "importMs": BACKEND_IMPORT_MS.get(name),
+            }
+            for name, (backend, flag) in _BACKENDS.items()
+        },
+    }
+
+
 # ============================================================================
 # DATA STRUCTURES
 # ============================================================================
@@ -135,6 +256,9 @@ class ForecastOutput:
     recommendation: str
     explanation: str
     top_factors: List[str] = field(default_factory=list)
+    # Per-member status and timings (see RASSPriceModel.predict)
+    members: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    partial: bool = False
 
 
 # ============================================================================
@@ -195,12 +319,324 @@ def rolling_mean(values: List[float], window: int) -> List[float]:
     """Calculate rolling mean with specified window"""
     if not values or window <= 0:
         return []
-    
-    result = []
-    for i in range(len(values)):
-        start = max(0, i - window + 1)
-        result.append(mean(values[start:i + 1]))
-    return result
+    means, _ = RollingWindowStats.rolling(values, window)
+    return [float(m) for m in means]
+
+
+# Model timing observations (metric, labels, value) recorded in this process
+# and not yet collected by the API process; bounded in case nothing collects
+_METRIC_EVENTS: deque = deque(maxlen=10000)
+
+
+def record_metric(metric: str, labels: Tuple[str, ...], value: float) -> None:
+    """Queue one observation: ("model_seconds", (model, phase), s) or ("series_length", (kind,), n)"""
+    _METRIC_EVENTS.append((metric, labels, value))
+    if metric == "model_seconds":
+        member_costs.observe(labels[0], labels[1], value)
+
+
+def drain_metrics() -> List[Tuple[str, Tuple[str, ...], float]]:
+    """Take every observation recorded so far"""
+    events = []
+    while True:
+        try:
+            events.append(_METRIC_EVENTS.popleft())
+        except IndexError:
+            return events
+
+
+def run_with_metrics(fn, *args, **kwargs) -> Tuple[Any, List[Tuple[str, Tuple[str, ...], Any]]]:
+    """Call fn and return (result, observations); lets pool workers ship timings with results.
+
+    The observations end with a ("model_registry", (pid,), stats) snapshot of
+    this process's model registry, so the API process can report the
+    registries that actually serve its pool.
+    """
+    result = fn(*args, **kwargs)
+    return result, drain_metrics() + [("model_registry", (str(os.getpid()),), _model_registry.stats())]
+
+
+@contextmanager
+def stage_timer(timings: Dict[str, float], stage: str, model: str = None, phase: str = "train"):
+    """
+    Accumulate the wall time of a block into timings[stage] (milliseconds) and
+    record it as a model_seconds observation labelled (model or stage, phase)
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        timings[stage] = timings.get(stage, 0.0) + elapsed * 1000
+        record_metric("model_seconds", (model or stage, phase), elapsed)
+
+
+def timed_model(model: str, phase: str):
+    """Decorator recording each call's wall time as a model_seconds observation"""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                record_metric("model_seconds", (model, phase), time.perf_counter() - start)
+        return wrapper
+    return decorate
+
+
+class RollingWindowStats:
+    """
+    Mean / sample standard deviation of a price series over several trailing
+    windows at once, plus the whole series.
+
+    Streaming: append() is O(1) per window - running sums and sums of squares
+    over a deque holding the longest window, with values shifted by the first
+    one seen so the subtraction stays well conditioned - and the whole-series
+    moments use Welford's update. A window longer than the series covers all of
+    it, matching mean(prices[-w:]) / std_dev(prices[-w:]).
+
+    Batch: rolling() returns the same statistics for every prefix of a series
+    in one vectorized pass over cumulative sums.
+    """
+
+    def __init__(self, windows: Tuple[int, ...] = (7, 14, 30), values: List[float] = ()):
+        self.windows = tuple(sorted({int(w) for w in windows if int(w) > 0}))
+        self.count = 0
+        self._shift: Optional[float] = None
+        self._recent = deque(maxlen=(self.windows[-1] if self.windows else 0) + 1)
+        self._sums = {w: 0.0 for w in self.windows}
+        self._sqs = {w: 0.0 for w in self.windows}
+        self._mean = 0.0
+        self._m2 = 0.0
+        self.extend(values)
+
+    def append(self, value: float) -> None:
+        value = float(value)
+        if self._shift is None:
+            self._shift = value
+        d = value - self._shift
+        self._recent.append(d)
+        self.count += 1
+        for w in self.windows:
+            self._sums[w] += d
+            self._sqs[w] += d * d
+            if self.count > w:
+                old = self._recent[-w - 1]
+                self._sums[w] -= old
+                self._sqs[w] -= old * old
+
+        delta = value - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (value - self._mean)
+
+    def extend(self, values: List[float]) -> None:
+        if self.count or len(values) < 2:
+            for v in values:
+                self.append(v)
+            return
+
+        # Seeding an empty accumulator: one pass per window over the tail
+        values = [float(v) for v in values]
+        self._shift = shift = values[0]
+        self._recent.extend(v - shift for v in values[-self._recent.maxlen:])
+        recent = list(self._recent)
+        for w in self.windows:
+            tail = recent[-w:]
+            self._sums[w] = sum(tail)
+            self._sqs[w] = sum(d * d for d in tail)
+        self.count = len(values)
+        self._mean = sum(values) / self.count
+        self._m2 = sum((v - self._mean) ** 2 for v in values)
+
+    def last(self, back: int = 0) -> float:
+        """Value `back` steps before the latest (0 = latest); within the longest window"""
+        return self._recent[-back - 1] + self._shift
+
+    def _window(self, window: Optional[int]) -> Optional[int]:
+        if window is None or window >= self.count:
+            return None
+        if window not in self._sums:
+            raise ValueError(f"Window {window} not tracked (tracking {self.windows})")
+        return window
+
+    def mean(self, window: Optional[int] = None) -> float:
+        """Mean of the last `window` values (whole series when None or longer)"""
+        if self.count == 0:
+            return 0.0
+        w = self._window(window)
+        if w is None:
+            return self._mean
+        return self._shift + self._sums[w] / w
+
+    def std(self, window: Optional[int] = None) -> float:
+        """Sample standard deviation of the last `window` values"""
+        w = self._window(window)
+        if w is None:
+            return math.sqrt(self._m2 / (self.count - 1)) if self.count >= 2 else 0.0
+        if w < 2:
+            return 0.0
+        s = self._sums[w]
+        return math.sqrt(max(self._sqs[w] - s * s / w, 0.0) / (w - 1))
+
+    def cv(self, window: Optional[int] = None) -> float:
+        """Coefficient of variation (0 when the mean is 0)"""
+        m = self.mean(window)
+        return self.std(window) / m if m != 0 else 0.0
+
+    @staticmethod
+    def rolling(values: List[float], window: int):
+        """
+        Mean and sample std of values[max(0, i - window + 1):i + 1] for every i,
+        from cumulative sums: O(n) for any window. Returns NumPy arrays, or
+        lists when NumPy is unavailable.
+        """
+        if not NUMPY_AVAILABLE:
+            stats = RollingWindowStats((window,))
+            means, stds = [], []
+            for v in values:
+                stats.append(v)
+                means.append(stats.mean(window))
+                stds.append(stats.std(window))
+            return means, stds
+
+        x = np.asarray(values, dtype=np.float64)
+        if len(x) == 0:
+            return np.zeros(0), np.zeros(0)
+        shift = x[0]
+        d = x - shift
+        c1 = np.concatenate(([0.0], np.cumsum(d)))
+        c2 = np.concatenate(([0.0], np.cumsum(d * d)))
+        hi = np.arange(1, len(x) + 1)
+        lo = np.maximum(hi - window, 0)
+        k = (hi - lo).astype(np.float64)
+        s = c1[hi] - c1[lo]
+        q = c2[hi] - c2[lo]
+        means = shift + s / k
+        var = np.maximum(q - s * s / k, 0.0) / np.maximum(k - 1, 1)
+        stds = np.where(k >= 2, np.sqrt(var), 0.0)
+        return means, stds
+
+
+# ============================================================================
+# PRICE HISTORY INGESTION
+# ============================================================================
+
+@dataclass
+class PriceHistory:
+    """
+    A price series in columnar form, in ascending date order: dates as
+    datetime64 and prices as float64 NumPy arrays (plain lists without NumPy).
+    """
+    dates: Any
+    prices: Any
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    @property
+    def date_list(self) -> List[datetime]:
+        if NUMPY_AVAILABLE:
+            return self.dates.astype("datetime64[us]").tolist()
+        return list(self.dates)
+
+    @property
+    def price_list(self) -> List[float]:
+        return self.prices.tolist() if NUMPY_AVAILABLE else list(self.prices)
+
+    def merge(self, newer: "PriceHistory") -> "PriceHistory":
+        """This series with `newer` folded in; a day present in both takes `newer`'s price"""
+        if not NUMPY_AVAILABLE:
+            by_day = dict(zip(self.dates, self.prices))
+            by_day.update(zip(newer.dates, newer.prices))
+            days = sorted(by_day)
+            return PriceHistory(days, [by_day[d] for d in days])
+        # np.unique keeps the first occurrence of each day, so `newer` goes first
+        dates = np.concatenate([newer.dates.astype("datetime64[D]"), self.dates.astype("datetime64[D]")])
+        prices = np.concatenate([newer.prices, self.prices])
+        days, first = np.unique(dates, return_index=True)
+        return PriceHistory(days, prices[first])
+
+    @staticmethod
+    def from_points(points: List[PricePoint]) -> "PriceHistory":
+        """Sort PricePoints by date (no de-duplication)"""
+        ordered = sorted(points or [], key=lambda x: x.date)
+        dates = [p.date for p in ordered]
+        prices = [float(p.price) for p in ordered]
+        if NUMPY_AVAILABLE:
+            return PriceHistory(np.array(dates, dtype="datetime64[us]"), np.array(prices, dtype=np.float64))
+        return PriceHistory(dates, prices)
+
+
+def as_price_history(historical_prices) -> PriceHistory:
+    """Accept a PriceHistory as-is, or sort a list of PricePoints into one"""
+    if isinstance(historical_prices, PriceHistory):
+        return historical_prices
+    return PriceHistory.from_points(historical_prices)
+
+
+def _parse_day(value) -> Optional[datetime]:
+    """Calendar day of one date field (ISO string or datetime); None if unparseable"""
+    if isinstance(value, datetime):
+        return datetime(value.year, value.month, value.day)
+    if isinstance(value, str):
+        try:
+            return datetime.strptime(value[:10].split("T")[0], "%Y-%m-%d")
+        except ValueError:
+            return None
+    return None
+
+
+def ingest_price_history(historical_data: List[Dict[str, Any]]) -> PriceHistory:
+    """
+    Convert an API price payload ({"date"|"observedAt", "price"|"pricePerKg"}
+    dicts) into a PriceHistory with one observation per calendar day.
+
+    Dates are parsed in one vectorized datetime64[D] conversion of their ISO
+    day prefix, falling back to per-item parsing only when that fails; dates
+    that still cannot be parsed count as today, and items with a non-numeric
+    price are skipped. Same-day observations are averaged, and the grouping
+    also sorts the result.
+    """
+    raw_dates = []
+    raw_prices = []
+    for item in historical_data or []:
+        price = item.get("price", item.get("pricePerKg", 0))
+        try:
+            price = float(price)
+        except (TypeError, ValueError):
+            logger.warning(f"Skipping invalid price point: {price!r}")
+            continue
+        raw_dates.append(item.get("date", item.get("observedAt", "")))
+        raw_prices.append(price)
+
+    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+
+    if not NUMPY_AVAILABLE:
+        by_day: Dict[datetime, List[float]] = {}
+        for value, price in zip(raw_dates, raw_prices):
+            by_day.setdefault(_parse_day(value) or today, []).append(price)
+        days = sorted(by_day)
+        return PriceHistory(days, [mean(by_day[d]) for d in days])
+
+    if not raw_prices:
+        return PriceHistory(np.zeros(0, dtype="datetime64[D]"), np.zeros(0))
+
+    try:
+        days = np.array([v[:10] for v in raw_dates], dtype="datetime64[D]")
+    except (TypeError, ValueError, IndexError):
+        days = np.array(
+            [_parse_day(v) or today for v in raw_dates], dtype="datetime64[us]"
+        ).astype("datetime64[D]")
+    days[np.isnat(days)] = np.datetime64(today, "D")
+
+    unique_days, inverse = np.unique(days, return_inverse=True)
+    prices = np.asarray(raw_prices, dtype=np.float64)
+    if len(unique_days) == len(days):
+        return PriceHistory(unique_days, prices[np.argsort(days, kind="stable")])
+    sums = np.bincount(inverse, weights=prices, minlength=len(unique_days))
+    counts = np.bincount(inverse, minlength=len(unique_days))
+    return PriceHistory(unique_days, sums / counts)
 
 
 # ============================================================================
@@ -235,34 +671,73 @@ class FeatureEngineer:
     def create_rolling_features(prices: List[float]) -> Dict[str, float]:
         """Create rolling statistics features"""
         features = {}
+        stats = RollingWindowStats((7, 14, 30), prices[-30:])
         
-        # Rolling means
+        # Rolling means (whole series while it is shorter than the window)
         for window in [7, 14, 30]:
-            if len(prices) >= window:
-                features[f"rolling_mean_{window}d"] = mean(prices[-window:])
-                features[f"rolling_std_{window}d"] = std_dev(prices[-window:])
-            else:
-                features[f"rolling_mean_{window}d"] = mean(prices) if prices else 0.0
-                features[f"rolling_std_{window}d"] = std_dev(prices) if prices else 0.0
+            features[f"rolling_mean_{window}d"] = stats.mean(window)
+            features[f"rolling_std_{window}d"] = stats.std(window)
         
         # Momentum
-        if len(prices) >= 7:
-            short_ma = mean(prices[-7:])
-            long_ma = mean(prices[-14:]) if len(prices) >= 14 else mean(prices)
-            features["momentum"] = short_ma - long_ma
-        else:
-            features["momentum"] = 0.0
+        features["momentum"] = stats.mean(7) - stats.mean(14) if len(prices) >= 7 else 0.0
         
         # Volatility (coefficient of variation)
-        if prices:
-            m = mean(prices[-14:]) if len(prices) >= 14 else mean(prices)
-            s = std_dev(prices[-14:]) if len(prices) >= 14 else std_dev(prices)
-            features["volatility_cv"] = s / m if m != 0 else 0.0
-        else:
-            features["volatility_cv"] = 0.0
+        features["volatility_cv"] = stats.cv(14)
         
         return features
     
+    @staticmethod
+    def build_feature_matrix(prices: List[float], start: int = 7):
+        """
+        Batch equivalent of the per-row price features used by the tree and
+        residual models: row k holds [price_pct_change_1d, price_pct_change_7d,
+        momentum, volatility_cv] computed from prices[:start + k].
+
+        Built in one vectorized NumPy pass; returns an (n_rows, 4) array, or a
+        list of lists when NumPy is unavailable.
+        """
+        start = max(1, start)
+        n = len(prices)
+
+        if not NUMPY_AVAILABLE:
+            rows = []
+            for i in range(start, n):
+                lag = FeatureEngineer.create_lag_features(prices[:i])
+                roll = FeatureEngineer.create_rolling_features(prices[:i])
+                rows.append([
+                    lag.get("price_pct_change_1d", 0),
+                    lag.get("price_pct_change_7d", 0),
+                    roll.get("momentum", 0),
+                    roll.get("volatility_cv", 0),
+                ])
+            return rows
+
+        if n <= start:
+            return np.zeros((0, 4))
+
+        p = np.asarray(prices, dtype=np.float64)
+        lengths = np.arange(start, n)            # history length behind each row
+        last = p[lengths - 1]
+        X = np.zeros((len(lengths), 4))
+
+        # Percent changes over 1 and 7 days (0 when the lag is missing or zero)
+        for col, lag in ((0, 1), (1, 7)):
+            has_lag = lengths > lag
+            prev = np.where(has_lag, p[np.maximum(lengths - lag - 1, 0)], 0.0)
+            valid = has_lag & (prev != 0)
+            X[:, col] = np.where(valid, (last - prev) / np.where(valid, prev, 1.0) * 100, 0.0)
+
+        # Momentum and CV over the trailing 7/14-day windows (whole history
+        # while it is shorter), read off the rolling statistics at each row end
+        mean7, _ = RollingWindowStats.rolling(p, 7)
+        mean14, std14 = RollingWindowStats.rolling(p, 14)
+        ends = lengths - 1
+        X[:, 2] = np.where(lengths >= 7, mean7[ends] - mean14[ends], 0.0)
+        m14 = mean14[ends]
+        X[:, 3] = np.where(m14 != 0, std14[ends] / np.where(m14 != 0, m14, 1.0), 0.0)
+
+        return X
+
     @staticmethod
     def create_seasonal_features(date: datetime) -> Dict[str, float]:
         """Create seasonal features"""
@@ -315,6 +790,39 @@ class FeatureEngineer:
         }
 
 
+class RollingFeatureState:
+    """
+    Model features of a price series that grows one value at a time, as in
+    recursive multi-step forecasting.
+
+    Tracks the last 15 values in a RollingWindowStats over the 7- and 14-value
+    windows, so append() and features() are O(1) however long the history is.
+    features() returns [pct_1d, pct_7d, momentum, volatility_cv], matching
+    create_lag_features / create_rolling_features on the full series.
+    """
+
+    def __init__(self, prices: List[float] = ()):
+        self.count = len(prices)
+        self._stats = RollingWindowStats((7, 14), prices[-15:])
+
+    def append(self, price: float) -> None:
+        self._stats.append(price)
+        self.count += 1
+
+    def _pct_change(self, lag: int) -> float:
+        if self.count <= lag:
+            return 0.0
+        prev = self._stats.last(lag)
+        return (self._stats.last() - prev) / prev * 100 if prev != 0 else 0.0
+
+    def features(self) -> List[float]:
+        if self.count == 0:
+            return [0.0, 0.0, 0.0, 0.0]
+        stats = self._stats
+        momentum = stats.mean(7) - stats.mean(14) if self.count >= 7 else 0.0
+        return [self._pct_change(1), self._pct_change(7), momentum, stats.cv(14)]
+
+
 # ============================================================================
 # STATISTICAL MODEL (Double Exponential Smoothing / Holt's Linear)
 # ============================================================================
@@ -328,27 +836,55 @@ class HoltLinearModel:
         self.level = 0.0
         self.trend = 0.0
         self.fitted = False
+        # fitted_values[t] is the one-step-ahead forecast of prices[t] made from
+        # prices[:t] (identical to refitting on that prefix); residuals = actual - fitted
+        self.fitted_values: List[float] = []
+        self.residuals: List[float] = []
     
     def fit(self, prices: List[float]) -> None:
         """Fit the model to historical prices"""
         if len(prices) < 2:
             self.level = prices[0] if prices else 0.0
             self.trend = 0.0
+            self.fitted_values = list(prices)
+            self.residuals = [0.0] * len(prices)
             self.fitted = True
             return
         
         # Initialize
         self.level = prices[0]
         self.trend = prices[1] - prices[0]
+        # A one-point prefix forecasts its own value (trend 0)
+        fitted_values = [prices[0], prices[0]]
         
         # Update through all observations
         for i in range(1, len(prices)):
             prev_level = self.level
             self.level = self.alpha * prices[i] + (1 - self.alpha) * (self.level + self.trend)
             self.trend = self.beta * (self.level - prev_level) + (1 - self.beta) * self.trend
+            fitted_values.append(self.level + self.trend)
         
+        # The final entry is the forecast beyond the series, not a fitted value
+        self.fitted_values = fitted_values[:len(prices)]
+        self.residuals = [prices[t] - self.fitted_values[t] for t in range(len(prices))]
         self.fitted = True
     
+    def update(self, price: float) -> float:
+        """Fold one new observation into the fitted state, exactly as fit() on
+        the extended series would; returns its one-step-ahead error"""
+        if len(self.fitted_values) < 2:
+            # The trend is initialised from the first two observations
+            prices = [f + r for f, r in zip(self.fitted_values, self.residuals)]
+            self.fit(prices + [price])
+            return self.residuals[-1]
+        forecast = self.level + self.trend
+        prev_level = self.level
+        self.level = self.alpha * price + (1 - self.alpha) * forecast
+        self.trend = self.beta * (self.level - prev_level) + (1 - self.beta) * self.trend
+        self.fitted_values.append(forecast)
+        self.residuals.append(price - forecast)
+        return price - forecast
+    
     def forecast(self, steps: int) -> List[float]:
         """Generate forecasts for n steps ahead"""
         if not self.fitted:
@@ -378,6 +914,7 @@ class LSTMLiteModel:
     ----------
     fit(prices: List[float])
     forecast(steps: int) -> List[float]
+    fit_batch(series: List[List[float]]) -> List[LSTMLiteModel]
     """
 
     def __init__(self, hidden_size: int = 8, learning_rate: float = 0.01, epochs: int = 100):
@@ -430,74 +967,144 @@ class LSTMLiteModel:
                 self._fitted = True
                 return
 
-            seq = self._normalise(prices)
-            n   = len(seq)
-            H   = self.hidden_size
-            rng = np.random.default_rng(42)
-
-            # Initialise weights (Xavier-ish)
-            scale = 0.1
-            self.Wx = rng.normal(0, scale, (H, 1))
-            self.Wh = rng.normal(0, scale, (H, H))
-            self.b  = np.zeros((H, 1))
-            self.Wy = rng.normal(0, scale, (1, H))
-            self.by = np.zeros((1, 1))
-
-            # Truncated BPTT — one step at a time
-            for _ in range(self.epochs):
-                h = np.zeros((H, 1))
-                dWx = np.zeros_like(self.Wx)
-                dWh = np.zeros_like(self.Wh)
-                db  = np.zeros_like(self.b)
-                dWy = np.zeros_like(self.Wy)
-                dby = np.zeros_like(self.by)
-
-                for t in range(n - 1):
-                    x_t    = np.array([[seq[t]]])
-                    y_true = np.array([[seq[t + 1]]])
-
-                    # Forward pass
-                    z       = self.Wx @ x_t + self.Wh @ h + self.b
-                    h_raw   = np.tanh(z)
-                    gate    = self._sigmoid(z)          # input gate
-                    h_new   = gate * h_raw + (1.0 - gate) * h
-                    y_hat_m = self.Wy @ h_new + self.by   # (1,1) matrix — used in backprop
-
-                    # Backward pass (one-step)
-                    dy   = 2.0 * (y_hat_m - y_true)
-                    dWy += dy * h_new.T
-                    dby += dy
-                    dh   = self.Wy.T @ dy
-                    dz   = dh * (1.0 - np.tanh(z) ** 2)
-                    dWx += dz @ x_t.T
-                    dWh += dz @ h.T
-                    db  += dz
-                    h    = h_new
-
-                # Gradient clipping + SGD update
-                for param, grad in [(self.Wx, dWx), (self.Wh, dWh),
-                                    (self.b, db), (self.Wy, dWy), (self.by, dby)]:
-                    np.clip(grad, -1.0, 1.0, out=grad)
-                    param -= self.lr * grad / max(n - 1, 1)
-
-            # Cache final hidden state for warm-start forecasting
-            h = np.zeros((H, 1))
-            for t in range(n - 1):
-                x_t  = np.array([[seq[t]]])
-                z    = self.Wx @ x_t + self.Wh @ h + self.b
-                h_rw = np.tanh(z)
-                gate = self._sigmoid(z)
-                h    = gate * h_rw + (1.0 - gate) * h
-
-            self._h_last  = h
-            self._last_val = float(seq[-1])
-            self._fitted   = True
+            self._train_panel([self], [prices])
 
         except Exception as e:
             logger.warning(f"LSTMLiteModel training failed ({e}). Using Holt fallback.")
             self._fallback.fit(prices)
             self._fitted = True
 
+    @classmethod
+    def fit_batch(
+        cls,
+        series: List[List[float]],
+        hidden_size: int = 8,
+        learning_rate: float = 0.01,
+        epochs=100,
+    ) -> List["LSTMLiteModel"]:
+        """
+        Train one model per series in a single batched pass.
+
+        Series are right-padded to a common length and masked, so each model
+        gets the same weights as an independent fit() on its own series, while
+        the per-timestep Python overhead is paid once for the whole panel.
+        `epochs` may be an int or one value per series.
+
+        Its one caller is EnsembleForecaster, which trains its validation and
+        full-series LSTMs as a panel of two. No endpoint trains a cross-series
+        panel: the national overview and volatility report fit no models, and
+        /models/performance fans its per-crop ensembles out over the pool.
+        """
+        if isinstance(epochs, int):
+            epochs = [epochs] * len(series)
+        models = [cls(hidden_size, learning_rate, e) for e in epochs]
+        batch = [i for i, s in enumerate(series) if len(s) >= 6]
+
+        if not NUMPY_AVAILABLE or len(batch) < len(series):
+            # Short series (and NumPy-less runs) take the Holt path in fit()
+            for i, s in enumerate(series):
+                if not NUMPY_AVAILABLE or i not in batch:
+                    models[i].fit(s)
+            if not NUMPY_AVAILABLE:
+                return models
+        if not batch:
+            return models
+
+        try:
+            cls._train_panel([models[i] for i in batch], [series[i] for i in batch])
+        except Exception as e:
+            logger.warning(f"LSTMLiteModel batched training failed ({e}). Fitting series one by one.")
+            for i in batch:
+                models[i].fit(series[i])
+        return models
+
+    @staticmethod
+    def _train_panel(models: List["LSTMLiteModel"], series: List[List[float]]) -> None:
+        """
+        Batched truncated BPTT over a panel of series, one model per series.
+
+        Weights carry a leading batch dimension (B, ...). Timesteps past the
+        end of a series and epochs past a model's own `epochs` are masked out,
+        leaving its weights untouched.
+        """
+        H   = models[0].hidden_size
+        lr  = models[0].lr
+        B   = len(models)
+        seqs    = [m._normalise(s) for m, s in zip(models, series)]
+        steps   = np.array([len(q) - 1 for q in seqs])
+        epochs  = np.array([m.epochs for m in models])
+        T       = int(steps.max())
+        X = np.zeros((B, T + 1))
+        for i, q in enumerate(seqs):
+            X[i, :len(q)] = q
+        step_mask = (np.arange(T)[None, :] < steps[:, None]).astype(np.float64)
+
+        # Initialise weights (Xavier-ish) — the same draw for every series
+        rng   = np.random.default_rng(42)
+        scale = 0.1
+        Wx = np.repeat(rng.normal(0, scale, (H, 1))[None], B, axis=0)
+        Wh = np.repeat(rng.normal(0, scale, (H, H))[None], B, axis=0)
+        b  = np.zeros((B, H, 1))
+        Wy = np.repeat(rng.normal(0, scale, (1, H))[None], B, axis=0)
+        by = np.zeros((B, 1, 1))
+        grad_scale = (lr / np.maximum(steps, 1))[:, None, None]
+
+        def step(x_t, h):
+            z     = Wx @ x_t + Wh @ h + b
+            h_raw = np.tanh(z)
+            gate  = models[0]._sigmoid(z)          # input gate
+            return h_raw, gate * h_raw + (1.0 - gate) * h
+
+        # Truncated BPTT — one step at a time, all series at once
+        for epoch in range(int(epochs.max())):
+            active = epochs > epoch
+            T_e = int(steps[active].max())
+            h   = np.zeros((B, H, 1))
+            dWx = np.zeros_like(Wx)
+            dWh = np.zeros_like(Wh)
+            db  = np.zeros_like(b)
+            dWy = np.zeros_like(Wy)
+            dby = np.zeros_like(by)
+
+            for t in range(T_e):
+                m      = step_mask[:, t, None, None]
+                x_t    = X[:, t, None, None]
+                y_true = X[:, t + 1, None, None]
+
+                # Forward pass
+                h_raw, h_new = step(x_t, h)
+                y_hat_m = Wy @ h_new + by
+
+                # Backward pass (one-step); padded steps contribute nothing
+                dy   = 2.0 * (y_hat_m - y_true) * m
+                dWy += dy @ h_new.transpose(0, 2, 1)
+                dby += dy
+                dh   = Wy.transpose(0, 2, 1) @ dy
+                dz   = dh * (1.0 - h_raw ** 2)
+                dWx += dz @ x_t.transpose(0, 2, 1)
+                dWh += dz @ h.transpose(0, 2, 1)
+                db  += dz
+                h    = h_new
+
+            # Gradient clipping + SGD update for the series still training
+            lr_b = grad_scale * active[:, None, None]
+            for param, grad in [(Wx, dWx), (Wh, dWh), (b, db), (Wy, dWy), (by, dby)]:
+                np.clip(grad, -1.0, 1.0, out=grad)
+                param -= lr_b * grad
+
+        # Cache final hidden state for warm-start forecasting
+        h = np.zeros((B, H, 1))
+        for t in range(T):
+            _, h_new = step(X[:, t, None, None], h)
+            h = np.where(step_mask[:, t, None, None] > 0, h_new, h)
+
+        for i, m in enumerate(models):
+            m.Wx, m.Wh, m.b  = Wx[i].copy(), Wh[i].copy(), b[i].copy()
+            m.Wy, m.by       = Wy[i].copy(), by[i].copy()
+            m._h_last   = h[i].copy()
+            m._last_val = float(seqs[i][-1])
+            m._fitted   = True
+
     def forecast(self, steps: int) -> List[float]:
         """Autoregressively forecast `steps` values ahead."""
         if not NUMPY_AVAILABLE or self.Wx is None:
@@ -525,34 +1132,86 @@ class LSTMLiteModel:
 
 
 # ============================================================================
-# PURE PYTHON RIDGE REGRESSION (ML Layer)
+# RIDGE REGRESSION (ML Layer)
 # ============================================================================
 
 class RidgeRegression:
-    """Pure Python Ridge Regression for residual correction"""
+    """
+    Ridge Regression for residual correction.
+
+    Minimises (1/2n)·||Xw + b - y||² + (alpha/2)·||w||² with an unpenalised
+    bias. With NumPy the minimiser is solved exactly from the normal equations
+    (Cholesky, falling back to lstsq); without NumPy the original pure-Python
+    gradient descent is used.
+
+    solver: "auto" (closed form when NumPy is available), "closed_form" or
+    "gradient_descent".
+    """
     
-    def __init__(self, alpha: float = 1.0, learning_rate: float = 0.001, iterations: int = 1000):
+    def __init__(
+        self,
+        alpha: float = 1.0,
+        learning_rate: float = 0.001,
+        iterations: int = 1000,
+        solver: str = "auto"
+    ):
         self.alpha = alpha  # Regularization strength
         self.lr = learning_rate
         self.iterations = iterations
+        self.solver = solver
         self.weights: List[float] = []
         self.bias: float = 0.0
         self.feature_names: List[str] = []
         self.trained = False
     
     def fit(self, X: List[List[float]], y: List[float], feature_names: List[str] = None) -> None:
-        """Train the model using gradient descent"""
-        if not X or not y or len(X) != len(y):
+        """Train the model"""
+        if X is None or y is None or len(X) == 0 or len(X) != len(y):
             return
         
-        n_samples = len(X)
-        n_features = len(X[0]) if X else 0
+        n_features = len(X[0])
         
         if n_features == 0:
             return
         
         self.feature_names = feature_names or [f"feature_{i}" for i in range(n_features)]
         
+        use_closed_form = NUMPY_AVAILABLE and self.solver != "gradient_descent"
+        if use_closed_form:
+            self._fit_closed_form(X, y)
+        else:
+            self._fit_gradient_descent(X, y)
+        
+        self.trained = True
+    
+    def _fit_closed_form(self, X, y) -> None:
+        """Exact ridge solution on centred data: (XcᵀXc + n·alpha·I) w = Xcᵀyc"""
+        A = np.asarray(X, dtype=np.float64)
+        b = np.asarray(y, dtype=np.float64)
+        n_samples, n_features = A.shape
+        
+        x_mean = A.mean(axis=0)
+        y_mean = b.mean()
+        Xc = A - x_mean
+        yc = b - y_mean
+        
+        gram = Xc.T @ Xc + n_samples * self.alpha * np.eye(n_features)
+        rhs = Xc.T @ yc
+        try:
+            L = np.linalg.cholesky(gram)
+            w = np.linalg.solve(L.T, np.linalg.solve(L, rhs))
+        except np.linalg.LinAlgError:
+            # Singular Gram matrix (alpha == 0 with collinear columns)
+            w = np.linalg.lstsq(gram, rhs, rcond=None)[0]
+        
+        self.weights = [float(v) for v in w]
+        self.bias = float(y_mean - x_mean @ w)
+    
+    def _fit_gradient_descent(self, X: List[List[float]], y: List[float]) -> None:
+        """Pure-Python gradient descent (fallback when NumPy is missing)"""
+        n_samples = len(X)
+        n_features = len(X[0])
+        
         # Initialize weights
         self.weights = [0.0] * n_features
         self.bias = 0.0
@@ -579,14 +1238,16 @@ class RidgeRegression:
             for j in range(n_features):
                 self.weights[j] -= self.lr * dw[j]
             self.bias -= self.lr * db
-        
-        self.trained = True
     
     def predict(self, X: List[List[float]]) -> List[float]:
         """Make predictions"""
-        if not self.trained or not X:
+        if not self.trained or len(X) == 0:
             return [0.0] * len(X)
         
+        if NUMPY_AVAILABLE:
+            preds = np.asarray(X, dtype=np.float64) @ np.asarray(self.weights) + self.bias
+            return [float(v) for v in preds]
+        
         predictions = []
         for x in X:
             pred = self.bias + sum(self.weights[j] * x[j] for j in range(len(self.weights)))
@@ -606,6 +1267,80 @@ class RidgeRegression:
         return {name: w * x[i] for i, (name, w) in enumerate(zip(self.feature_names, self.weights))}
 
 
+# ============================================================================
+# DIRECT MULTI-HORIZON REGRESSION
+# ============================================================================
+
+def predict_rows(model, X):
+    """model.predict(X), going straight to the LightGBM booster when there is one
+    (the sklearn wrapper's input validation dominates single-row calls)"""
+    booster = getattr(model, "booster_", None) if LIGHTGBM_AVAILABLE else None
+    if booster is not None:
+        return booster.predict(np.asarray(X, dtype=np.float64))
+    return model.predict(X)
+
+
+class DirectHorizonRegressor:
+    """
+    Direct multi-horizon strategy for the tree members: the feature row at
+    time t predicts prices t+1 ... t+H in one call, instead of rolling a
+    one-step model forward H times and compounding its errors.
+
+    Estimators with native multi-output regression (XGBoost) are fit once on
+    an (n, H) target matrix; others get one estimator per horizon. All are
+    trained from the same shared feature matrix, where row k is built from
+    prices[:start + k].
+    """
+
+    def __init__(self, factory, horizons: int = 14, multi_output: bool = False):
+        self.factory = factory
+        self.horizons = max(1, horizons)
+        self.multi_output = multi_output
+        self.models: List[Any] = []
+
+    def fit(self, X, prices: List[float], start: int = 7) -> "DirectHorizonRegressor":
+        prices = np.asarray(prices, dtype=np.float64)
+        X = np.asarray(X, dtype=np.float64)
+        rows = min(len(X), len(prices) - start)
+        H = self.horizons
+        if rows - H + 1 < 5:
+            raise ValueError(f"not enough history for a {H}-day direct model")
+
+        if self.multi_output:
+            usable = rows - H + 1
+            # Y[k, h] = prices[start + k + h]
+            Y = np.lib.stride_tricks.sliding_window_view(prices[start:start + rows], H)[:usable]
+            model = self.factory()
+            model.fit(X[:usable], Y)
+            self.models = [model]
+        else:
+            self.models = []
+            for h in range(H):
+                usable = rows - h
+                model = self.factory()
+                model.fit(X[:usable], prices[start + h:start + h + usable])
+                self.models.append(model)
+        return self
+
+    def predict(self, X):
+        """(n_rows, H) array of predictions for horizons 1..H"""
+        X = np.asarray(X, dtype=np.float64)
+        if self.multi_output:
+            return np.asarray(predict_rows(self.models[0], X)).reshape(len(X), self.horizons)
+        return np.column_stack([predict_rows(m, X) for m in self.models])
+
+    def forecast(self, prices: List[float], days: int, external: List[float] = ()) -> List[float]:
+        """`days` values ahead: one batched predict per block of H days"""
+        state = RollingFeatureState(prices)
+        preds: List[float] = []
+        while len(preds) < days:
+            block = self.predict([state.features() + list(external)])[0]
+            for value in block[:days - len(preds)]:
+                preds.append(float(value))
+                state.append(float(value))
+        return preds
+
+
 # ============================================================================
 # UNCERTAINTY ESTIMATION
 # ============================================================================
@@ -643,7 +1378,7 @@ class UncertaintyEstimator:
         if len(prices) < 2:
             return 0.5
         
-        cv = std_dev(prices) / mean(prices) if mean(prices) != 0 else 0
+        cv = RollingWindowStats((), prices).cv()
         # Normalize to 0-1 (assuming CV rarely exceeds 0.5)
         return min(1.0, cv * 2)
 
@@ -805,10 +1540,318 @@ class DecisionEngine:
             return Volatility.HIGH
 
 
+# ============================================================================
+# LATENCY BUDGET (deadline-aware member scheduling)
+# ============================================================================
+
+# Expected wall time (ms) of one run of each member before it has been
+# measured in this process
+MEMBER_COST_PRIORS_MS: Dict[str, float] = {
+    "holt": 1.0, "ridge": 5.0, "lgb": 60.0, "xgb": 80.0, "gbr": 150.0,
+    "lstm": 400.0, "sarima": 600.0, "prophet": 1500.0,
+}
+
+
+class MemberCostModel:
+    """
+    Running estimate of each member's wall time per phase, an exponential
+    moving average of the model_seconds observations recorded in this process
+    """
+
+    def __init__(self, priors_ms: Dict[str, float], smoothing: float = 0.3):
+        self.priors_ms = dict(priors_ms)
+        self.smoothing = smoothing
+        self._ms: Dict[Tuple[str, str], float] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, model: str, phase: str, seconds: float) -> None:
+        ms = seconds * 1000
+        with self._lock:
+            previous = self._ms.get((model, phase))
+            self._ms[(model, phase)] = ms if previous is None else (
+                previous + self.smoothing * (ms - previous)
+            )
+
+    def estimate_ms(self, model: str, phases: Tuple[str, ...]) -> float:
+        prior = self.priors_ms.get(model, 100.0)
+        with self._lock:
+            return sum(self._ms.get((model, phase), prior) for phase in phases)
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            return {f"{model}.{phase}": round(ms, 1) for (model, phase), ms in sorted(self._ms.items())}
+
+
+member_costs = MemberCostModel(MEMBER_COST_PRIORS_MS)
+
+
+class LatencyBudget:
+    """
+    Wall-clock deadline for one forecast (max_latency_ms from `started_at`,
+    a time.time() value, so it can be set in the API process and honoured in
+    a worker). Optional members are ordered cheapest-first by their estimated
+    cost and admitted only while that estimate fits in the time left; the
+    caller drops a member that is still running, or finishes, past the deadline.
+    """
+
+    def __init__(self, max_latency_ms: float, started_at: float = None):
+        self.max_latency_ms = float(max_latency_ms)
+        self.deadline = (started_at or time.time()) + self.max_latency_ms / 1000
+
+    @classmethod
+    def from_ms(cls, max_latency_ms: Optional[float], started_at: float = None) -> Optional["LatencyBudget"]:
+        return cls(max_latency_ms, started_at) if max_latency_ms else None
+
+    def remaining_ms(self) -> float:
+        return max(0.0, (self.deadline - time.time()) * 1000)
+
+    def expired(self) -> bool:
+        return time.time() >= self.deadline
+
+    def order(self, keys, phases: Tuple[str, ...]) -> List[str]:
+        return sorted(keys, key=lambda k: member_costs.estimate_ms(k, phases))
+
+    def admits(self, key: str, phases: Tuple[str, ...], runs: int = 1) -> bool:
+        return member_costs.estimate_ms(key, phases) * runs <= self.remaining_ms()
+
+
+def _timed_call(fn, *args):
+    """(fn(*args), wall ms); module-level so member jobs stay picklable"""
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def is_partial(members: Dict[str, Dict[str, Any]]) -> bool:
+    """True when a latency budget skipped or dropped any member"""
+    return any(m.get("status") in ("skipped", "dropped") for m in members.values())
+
+
+# ============================================================================
+# SARIMA STATE CACHE (warm refits per series)
+# ============================================================================
+
+# SARIMA fits kept per (series, role), and how many observations may be added
+# to a fit with a filter-only append before its parameters are re-estimated
+SARIMA_STATE_CACHE_SIZE = int(os.getenv("SARIMA_STATE_CACHE_SIZE", "256"))
+SARIMA_APPEND_MAX_OBS = int(os.getenv("SARIMA_APPEND_MAX_OBS", "7"))
+
+
+def fit_sarimax(prices: List[float], start_params=None):
+    """SARIMA(1,1,1)(0,1,1,7), the specification every SARIMA member uses"""
+    return SARIMAX(
+        prices,
+        order=(1, 1, 1),
+        seasonal_order=(0, 1, 1, 7),
+        enforce_stationarity=False,
+        enforce_invertibility=False
+    ).fit(disp=False, start_params=start_params)
+
+
+class SarimaStateCache:
+    """
+    Last SARIMA fit per (series key, role), so a daily refresh does not
+    re-estimate the model from default starting values.
+
+    fit(key, prices) compares `prices` with the series the cached fit saw:
+    - unchanged: the cached results are returned
+    - extended, with at most `append_max_obs` observations appended since the
+      parameters were last estimated: the new observations are run through
+      the Kalman filter with the cached parameters (results.append, refit=False)
+    - otherwise: the parameters are re-estimated, starting from `start_params`
+      or, failing that, the cached fit's parameters
+
+    Each fit is counted as a ("model_fits", ("sarima", mode)) metric, mode
+    being "reuse", "append", "warm" or "cold". Fits without a key are never cached.
+    """
+
+    def __init__(self, max_size: int, append_max_obs: int):
+        self.max_size = max(0, max_size)
+        self.append_max_obs = max(0, append_max_obs)
+        self._entries: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def fit(self, key: Optional[Tuple], prices: List[float], start_params=None):
+        prices = [float(p) for p in prices]
+        entry = None
+        if key is not None and self.max_size:
+            with self._lock:
+                entry = self._entries.get(key)
+
+        mode, results, appended = None, None, 0
+        if entry is not None:
+            seen = entry["prices"]
+            added = prices[len(seen):]
+            if len(prices) >= len(seen) and prices[:len(seen)] == seen:
+                if not added:
+                    mode, results, appended = "reuse", entry["results"], entry["appended"]
+                elif entry["appended"] + len(added) <= self.append_max_obs:
+                    try:
+                        results = entry["results"].append(added, refit=False)
+                        mode, appended = "append", entry["appended"] + len(added)
+                    except Exception as e:
+                        logger.warning(f"SARIMA append failed, refitting: {e}")
+            if start_params is None:
+                start_params = entry["results"].params
+        if results is None:
+            mode = "cold" if start_params is None else "warm"
+            results = fit_sarimax(prices, start_params)
+
+        record_metric("model_fits", ("sarima", mode), 1)
+        if key is not None and self.max_size:
+            with self._lock:
+                self._entries[key] = {"prices": prices, "results": results, "appended": appended}
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+        return results
+
+
+sarima_states = SarimaStateCache(SARIMA_STATE_CACHE_SIZE, SARIMA_APPEND_MAX_OBS)
+
+
+# ============================================================================
+# PROPHET FIT CACHE (shared by RASSPriceModel and EnsembleForecaster)
+# ============================================================================
+
+# Fitted Prophet models kept per exact series and configuration (0 disables)
+PROPHET_FIT_CACHE_SIZE = int(os.getenv("PROPHET_FIT_CACHE_SIZE", "64"))
+
+
+def prophet_config(n_points: int) -> Dict[str, Any]:
+    """Prophet settings for a series of `n_points` days, the same for every member"""
+    return {
+        "daily_seasonality": False,
+        "weekly_seasonality": n_points > 30,
+        "yearly_seasonality": n_points > 365,
+        "changepoint_prior_scale": 0.05,
+    }
+
+
+class ProphetFit:
+    """
+    A fitted Prophet model with its forecasts cached per horizon.
+
+    forecast(steps) predicts only the last observed day and the `steps` days
+    after it (the rows of make_future_dataframe(steps) from the end of the
+    history), instead of re-predicting the whole history each time. A later
+    `last_date` forecasts from there, for series that grew since the fit.
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self._horizons: Dict[Tuple, Any] = {}
+
+    def __getstate__(self):
+        # The horizon cache is rebuilt on demand; leaving it out also keeps a
+        # background artifact save from racing a forecast that fills it
+        return {"model": self.model, "_horizons": {}}
+
+    def forecast(self, steps: int, last_date: datetime = None):
+        """Prophet output frame: the last observed day, then `steps` future days"""
+        last = self.model.history["ds"].max() if last_date is None else pd.Timestamp(last_date)
+        frame = self._horizons.get((steps, last))
+        if frame is None:
+            future = pd.DataFrame({"ds": pd.date_range(last, periods=steps + 1, freq="D")})
+            frame = self._horizons[(steps, last)] = self.model.predict(future)
+        return frame
+
+
+class ProphetFitCache:
+    """
+    ProphetFit instances keyed by a hash of the exact dates, prices and
+    configuration they were fitted on, so RASSPriceModel and
+    EnsembleForecaster fitting the same series share one fit (LRU, at most
+    `max_size`). Each call is counted as a ("model_fits", ("prophet", mode))
+    metric, mode being "reuse" or "cold".
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max(0, max_size)
+        self._entries: "OrderedDict[str, ProphetFit]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(prices: List[float], dates: List[datetime], config: Dict[str, Any]) -> str:
+        payload = json.dumps(
+            [[d.isoformat() for d in dates], [float(p) for p in prices], config], sort_keys=True
+        )
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    def fit(self, prices: List[float], dates: List[datetime] = None) -> ProphetFit:
+        """Fitted Prophet for (dates, prices); without dates the series is taken
+        to end today, and the fit is not cached"""
+        config = prophet_config(len(prices))
+        key = None
+        if dates is None:
+            dates = [datetime.now() - timedelta(days=len(prices) - i) for i in range(len(prices))]
+        elif self.max_size:
+            key = self._key(prices, dates, config)
+            with self._lock:
+                fit = self._entries.get(key)
+                if fit is not None:
+                    self._entries.move_to_end(key)
+            if fit is not None:
+                record_metric("model_fits", ("prophet", "reuse"), 1)
+                return fit
+
+        model = Prophet(**config)
+        model.fit(pd.DataFrame({"ds": dates, "y": prices}))
+        fit = ProphetFit(model)
+        record_metric("model_fits", ("prophet", "cold"), 1)
+        if key is not None:
+            with self._lock:
+                self._entries[key] = fit
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+        return fit
+
+
+prophet_fits = ProphetFitCache(PROPHET_FIT_CACHE_SIZE)
+
+
 # ============================================================================
 # ENSEMBLE FORECASTER
 # ============================================================================
 
+# Concurrency for EnsembleForecaster members: pool size (0 = one per member),
+# per-member timeout in seconds (0 = none) and pool kind ("thread" or "process")
+ENSEMBLE_MAX_WORKERS = int(os.getenv("ENSEMBLE_MAX_WORKERS", "0"))
+ENSEMBLE_MEMBER_TIMEOUT = float(os.getenv("ENSEMBLE_MEMBER_TIMEOUT_SECONDS", "0")) or None
+ENSEMBLE_POOL = os.getenv("ENSEMBLE_POOL", "thread")
+
+# Process pools for ENSEMBLE_POOL=process, one per size, shared by every
+# EnsembleForecaster in this process (spawn start-up is paid once)
+_member_process_pools: Dict[int, ProcessPoolExecutor] = {}
+_member_process_pools_lock = threading.Lock()
+
+
+def _member_process_pool(max_workers: int) -> Optional[ProcessPoolExecutor]:
+    """The shared member process pool, or None inside a worker process.
+
+    Forecasts served through the API already run in ForecastExecutor worker
+    processes; a pool per worker would nest process pools, so members run on
+    threads there instead.
+    """
+    if multiprocessing.parent_process() is not None:
+        return None
+    with _member_process_pools_lock:
+        pool = _member_process_pools.get(max_workers)
+        if pool is None:
+            pool = _member_process_pools[max_workers] = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return pool
+
+
+def _discard_member_process_pool(pool: ProcessPoolExecutor) -> None:
+    """Forget a broken shared pool so the next fit starts a fresh one"""
+    with _member_process_pools_lock:
+        for size, shared in list(_member_process_pools.items()):
+            if shared is pool:
+                del _member_process_pools[size]
+
 class EnsembleForecaster:
     """
     Combines Prophet + SARIMA + GBR + LSTMLite + Holt-Winters into a single
@@ -817,122 +1860,231 @@ class EnsembleForecaster:
 
     Public API
     ----------
-    fit_and_weight(prices, dates=None)
-    forecast(steps, prices, dates=None) -> Dict
+    fit_and_weight(prices, dates=None, budget=None)
+    forecast(steps, prices, dates=None, budget=None) -> Dict
         {
           "ensemble"       : [{"date", "price", "lower", "upper"}, ...],
           "models"         : {"prophet": [...], "sarima": [...], ...},
           "modelWeights"   : {"prophet": 0.35, ...},
           "bestModel"      : "prophet",
           "ensembleAccuracy": 0.87,
+          "members"        : {"prophet": {"status", "weight", "trainMs", "predictMs"}, ...},
+          "partial"        : False,
+          "latencyBudgetMs": None,
         }
+
+    Under a LatencyBudget, members are started cheapest-first and only while
+    their estimated cost fits; those still running at the deadline are
+    abandoned and the weights renormalised over the members that finished.
     """
 
     MODEL_KEYS = ("prophet", "sarima", "gbr", "lstm", "holt")
 
-    def __init__(self):
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        member_timeout: Optional[float] = None,
+        pool: Optional[str] = None,
+    ):
         self.holt_model  = HoltLinearModel(alpha=0.3, beta=0.1)
         self.lstm_model  = LSTMLiteModel(hidden_size=8, epochs=80)
         self.weights: Dict[str, float] = {}
         self._trained_prices: List[float] = []
+        # Budgeted fits leave skipped/dropped members out of `weights`
+        self.member_status: Dict[str, str] = {}
+        self.train_ms: Dict[str, float] = {}
+        # Registry key of the series, set by forecast_ensemble; keys the SARIMA state cache
+        self.series_key: Optional[Tuple] = None
+        # Members run concurrently; one that exceeds `member_timeout` seconds
+        # is replaced by Holt, like a member that raises
+        self.max_workers = max_workers or ENSEMBLE_MAX_WORKERS or len(self.MODEL_KEYS) + 1
+        self.member_timeout = member_timeout if member_timeout is not None else ENSEMBLE_MEMBER_TIMEOUT
+        self.pool_kind = pool or ENSEMBLE_POOL
 
     # ------------------------------------------------------------------
-    # RMSE helper
+    # Concurrent member scheduling
     # ------------------------------------------------------------------
-    @staticmethod
-    def _rmse(actual: List[float], predicted: List[float]) -> float:
-        if not actual or not predicted:
-            return 1e6
-        n = min(len(actual), len(predicted))
-        return math.sqrt(sum((actual[i] - predicted[i]) ** 2 for i in range(n)) / n)
+    def _member_pool(self) -> Tuple[Any, bool]:
+        """(pool, shared): the shared process pool, or a thread pool owned by the caller"""
+        if self.pool_kind == "process":
+            pool = _member_process_pool(self.max_workers)
+            if pool is not None:
+                return pool, True
+        return ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="ensemble"), False
+
+    def _gather_members(
+        self,
+        jobs: Dict[str, Tuple[Any, tuple]],
+        timeout_fallbacks: Dict[str, Any],
+        budget: Optional[LatencyBudget] = None,
+    ) -> Dict[str, Any]:
+        """
+        Run `jobs` ({key: (fn, args)}) concurrently, in insertion order, and
+        collect their results.
+
+        A job that raises yields the exception instance; a job still running
+        when `member_timeout` elapses, or when `budget` runs out, yields
+        timeout_fallbacks[key]() instead. Timed-out workers are abandoned,
+        not joined.
+        """
+        results: Dict[str, Any] = {}
+        timeout = self.member_timeout
+        if budget is not None:
+            timeout = min(timeout or float("inf"), budget.remaining_ms() / 1000)
+        pool, shared = self._member_pool()
+        try:
+            try:
+                futures = {key: pool.submit(fn, *args) for key, (fn, args) in jobs.items()}
+            except BrokenProcessPool:
+                # A shared pool that broke since the last fit: run this one on threads
+                _discard_member_process_pool(pool)
+                pool, shared = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="ensemble"), False
+                futures = {key: pool.submit(fn, *args) for key, (fn, args) in jobs.items()}
+            deadline = None if timeout is None else time.monotonic() + timeout
+            for key, future in futures.items():
+                remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+                try:
+                    results[key] = future.result(timeout=remaining)
+                except FuturesTimeoutError:
+                    logger.warning(f"EnsembleForecaster {key} exceeded {timeout:.3f}s")
+                    future.cancel()
+                    results[key] = timeout_fallbacks[key]()
+                except BrokenProcessPool as e:
+                    _discard_member_process_pool(pool)
+                    results[key] = e
+                except Exception as e:
+                    results[key] = e
+        finally:
+            if not shared:
+                pool.shutdown(wait=False, cancel_futures=True)
+        return results
+
+    def _member_job(
+        self, key: str, train: List[float], steps: int, dates: List[datetime] = None,
+        role: str = "validate"
+    ):
+        """(fn, args) that trains and forecasts one member on `train` (the
+        validation split, or the full series when `role` is "full")"""
+        if key == "lstm":
+            return self._run_lstm, (train, steps)
+        if key == "sarima":
+            return self._run_sarima, (train, steps, role)
+        if key == "gbr":
+            return self._run_gbr, (train, steps)
+        if key == "prophet":
+            return self._run_prophet, (train, steps, dates)
+        return self._run_holt, (train, steps)
+
+    @staticmethod
+    def _timed_jobs(jobs: Dict[str, Tuple[Any, tuple]]) -> Dict[str, Tuple[Any, tuple]]:
+        """Wrap each job so its result comes back as (result, wall ms)"""
+        return {key: (_timed_call, (fn,) + tuple(args)) for key, (fn, args) in jobs.items()}
+
+    @staticmethod
+    def _admitted_members(
+        keys, budget: Optional[LatencyBudget], runs: int
+    ) -> Tuple[List[str], List[str]]:
+        """
+        (admitted, skipped): `keys` cheapest-first, admitting those whose
+        estimated cost for `runs` runs fits in the remaining budget. Holt is
+        always admitted.
+        """
+        if budget is None:
+            return list(keys), []
+        admitted, skipped = [], []
+        for key in budget.order(keys, ("member",)):
+            if key == "holt" or budget.admits(key, ("member",), runs=runs):
+                admitted.append(key)
+            else:
+                skipped.append(key)
+        return admitted, skipped
+
+    @staticmethod
+    @timed_model("lstm", "member")
+    def _fit_lstm_pair(
+        train: List[float], prices: List[float], steps: int
+    ) -> Tuple[List[float], "LSTMLiteModel"]:
+        """Validation LSTM on `train` and full-series LSTM in one batched fit"""
+        val_model, full_model = LSTMLiteModel.fit_batch(
+            [train, prices], hidden_size=8, epochs=[60, 80]
+        )
+        return val_model.forecast(steps), full_model
+
+    @staticmethod
+    def _holt_only_lstm(prices: List[float]) -> "LSTMLiteModel":
+        """Unfitted LSTM whose forecast() uses its fitted Holt fallback"""
+        m = LSTMLiteModel(hidden_size=8, epochs=80)
+        m._fallback.fit(prices)
+        return m
+
+    # ------------------------------------------------------------------
+    # RMSE helper
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _rmse(actual: List[float], predicted: List[float]) -> float:
+        if not actual or not predicted:
+            return 1e6
+        n = min(len(actual), len(predicted))
+        return math.sqrt(sum((actual[i] - predicted[i]) ** 2 for i in range(n)) / n)
 
     # ------------------------------------------------------------------
     # Per-model runners (train + predict in one call for validation)
     # ------------------------------------------------------------------
+    @timed_model("holt", "member")
     def _run_holt(self, train: List[float], steps: int) -> List[float]:
         m = HoltLinearModel(alpha=0.3, beta=0.1)
         m.fit(train)
         return m.forecast(steps)
 
+    @timed_model("lstm", "member")
     def _run_lstm(self, train: List[float], steps: int) -> List[float]:
         m = LSTMLiteModel(hidden_size=8, epochs=60)
         m.fit(train)
         return m.forecast(steps)
 
-    def _run_sarima(self, train: List[float], steps: int) -> List[float]:
+    @timed_model("sarima", "member")
+    def _run_sarima(self, train: List[float], steps: int, role: str = "validate") -> List[float]:
         if not SARIMA_AVAILABLE or len(train) < 14:
             return self._run_holt(train, steps)
         try:
-            res = SARIMAX(
-                train, order=(1, 1, 1), seasonal_order=(0, 1, 1, 7),
-                enforce_stationarity=False, enforce_invertibility=False
-            ).fit(disp=False)
+            state_key = None if self.series_key is None else self.series_key + (role,)
+            res = sarima_states.fit(state_key, train)
             return [max(1.0, float(v)) for v in res.forecast(steps=steps)]
         except Exception:
             return self._run_holt(train, steps)
 
+    @timed_model("gbr", "member")
     def _run_gbr(self, train: List[float], steps: int) -> List[float]:
         if not SKLEARN_AVAILABLE or len(train) < 14:
             return self._run_holt(train, steps)
         try:
             fe = FeatureEngineer()
-            X: List[List[float]] = []
-            y: List[float] = []
-            for i in range(7, len(train)):
-                lag  = fe.create_lag_features(train[:i])
-                roll = fe.create_rolling_features(train[:i])
-                X.append([
-                    lag.get("price_pct_change_1d", 0),
-                    lag.get("price_pct_change_7d", 0),
-                    roll.get("momentum", 0),
-                    roll.get("volatility_cv", 0),
-                ])
-                y.append(train[i])
+            X = fe.build_feature_matrix(train, start=7)
+            y = list(train[7:])
             if len(X) < 5:
                 return self._run_holt(train, steps)
             gbr = GradientBoostingRegressor(
                 random_state=42, n_estimators=100, learning_rate=0.05, max_depth=3
             )
             gbr.fit(X, y)
-            history = list(train)
+            state = RollingFeatureState(train)
             preds: List[float] = []
             for _ in range(steps):
-                lag  = fe.create_lag_features(history)
-                roll = fe.create_rolling_features(history)
-                feat = [
-                    lag.get("price_pct_change_1d", 0),
-                    lag.get("price_pct_change_7d", 0),
-                    roll.get("momentum", 0),
-                    roll.get("volatility_cv", 0),
-                ]
-                p = float(gbr.predict([feat])[0])
+                p = float(gbr.predict([state.features()])[0])
                 preds.append(p)
-                history.append(p)
+                state.append(p)
             return preds
         except Exception:
             return self._run_holt(train, steps)
 
+    @timed_model("prophet", "member")
     def _run_prophet(
         self, train: List[float], steps: int, train_dates: List[datetime] = None
     ) -> List[float]:
         if not PROPHET_AVAILABLE or len(train) < 14:
             return self._run_holt(train, steps)
         try:
-            if train_dates is None:
-                train_dates = [
-                    datetime.now() - timedelta(days=len(train) - i)
-                    for i in range(len(train))
-                ]
-            df = pd.DataFrame({"ds": train_dates, "y": train})
-            m = Prophet(
-                daily_seasonality=False,
-                weekly_seasonality=len(train) > 30,
-                yearly_seasonality=len(train) > 365,
-                changepoint_prior_scale=0.05,
-            )
-            m.fit(df)
-            future = m.make_future_dataframe(periods=steps)
-            fc = m.predict(future)
+            fc = prophet_fits.fit(train, train_dates).forecast(steps)
             return [max(1.0, float(v)) for v in fc["yhat"].tail(steps).tolist()]
         except Exception:
             return self._run_holt(train, steps)
@@ -940,13 +2092,21 @@ class EnsembleForecaster:
     # ------------------------------------------------------------------
     # Fit & weight
     # ------------------------------------------------------------------
+    @timed_model("ensemble", "train")
     def fit_and_weight(
-        self, prices: List[float], dates: List[datetime] = None
+        self, prices: List[float], dates: List[datetime] = None,
+        budget: Optional[LatencyBudget] = None
     ) -> None:
         """Compute RMSE-based model weights via a walk-forward validation split,
-        then fit the fast per-model instances on the full series."""
+        then fit the fast per-model instances on the full series.
+
+        Under `budget`, members that would not fit (validation plus forecast)
+        or that are still running at the deadline get no weight."""
         self._trained_prices = list(prices)
+        self.member_status = {}
+        self.train_ms = {}
         n = len(prices)
+        record_metric("series_length", ("ensemble",), n)
 
         if n < 10:
             # Not enough data — assign equal weights
@@ -959,43 +2119,65 @@ class EnsembleForecaster:
         train, test = prices[:-holdout], prices[-holdout:]
         train_dates = dates[:-holdout] if dates else None
 
+        # Validate every member on the split concurrently; the LSTM job also
+        # fits the full-series LSTM in the same batched pass
+        keys, skipped = self._admitted_members(self.MODEL_KEYS, budget, runs=2)
+        self.member_status.update({key: "skipped" for key in skipped})
+        jobs = {key: self._member_job(key, train, holdout, train_dates) for key in keys}
+        if "lstm" in jobs:
+            jobs["lstm"] = (self._fit_lstm_pair, (train, list(prices), holdout))
+        # Without a budget a late member falls back to Holt; with one it is
+        # dropped, except Holt itself, which is recomputed inline
+        if budget is None:
+            fallbacks = {key: (lambda: (self._run_holt(train, holdout), None)) for key in keys}
+            fallbacks["lstm"] = lambda: (
+                (self._run_holt(train, holdout), self._holt_only_lstm(prices)), None
+            )
+        else:
+            fallbacks = {key: (lambda: None) for key in keys}
+            fallbacks["holt"] = lambda: (self._run_holt(train, holdout), None)
+        outcomes = self._gather_members(self._timed_jobs(jobs), fallbacks, budget)
+
         rmse_scores: Dict[str, float] = {}
-        for key in self.MODEL_KEYS:
-            try:
-                if key == "holt":
-                    preds = self._run_holt(train, holdout)
-                elif key == "lstm":
-                    preds = self._run_lstm(train, holdout)
-                elif key == "sarima":
-                    preds = self._run_sarima(train, holdout)
-                elif key == "gbr":
-                    preds = self._run_gbr(train, holdout)
-                elif key == "prophet":
-                    preds = self._run_prophet(train, holdout, train_dates)
-                else:
-                    preds = self._run_holt(train, holdout)
-                rmse_scores[key] = self._rmse(test, preds)
-            except Exception as e:
-                logger.warning(f"EnsembleForecaster {key} validation error: {e}")
+        lstm_full = None
+        for key in keys:
+            outcome = outcomes[key]
+            if outcome is None:
+                logger.warning(f"EnsembleForecaster {key} dropped: latency budget exhausted")
+                self.member_status[key] = "dropped"
+                continue
+            if isinstance(outcome, tuple):
+                outcome, ms = outcome
+                if ms is not None:
+                    self.train_ms[key] = round(ms, 1)
+            if key == "lstm" and isinstance(outcome, tuple):
+                outcome, lstm_full = outcome
+            preds = outcome
+            if isinstance(preds, Exception):
+                logger.warning(f"EnsembleForecaster {key} validation error: {preds}")
                 rmse_scores[key] = 1e6
+            else:
+                rmse_scores[key] = self._rmse(test, preds)
 
-        # Inverse-RMSE weighting, normalised to sum=1
+        # Inverse-RMSE weighting over the members that finished, normalised to sum=1
         inv   = {k: 1.0 / max(v, 1e-4) for k, v in rmse_scores.items()}
         total = sum(inv.values())
         self.weights = {k: v / total for k, v in inv.items()}
 
         # Fit fast models on full series for forecasting
         self.holt_model.fit(prices)
-        self.lstm_model.fit(prices)
+        self.lstm_model = lstm_full or self._holt_only_lstm(prices)
 
     # ------------------------------------------------------------------
     # Forecast
     # ------------------------------------------------------------------
+    @timed_model("ensemble", "predict")
     def forecast(
         self,
         steps: int,
         prices: List[float],
         dates: List[datetime] = None,
+        budget: Optional[LatencyBudget] = None,
     ) -> Dict[str, Any]:
         """
         Generate multi-model ensemble forecast for `steps` days ahead.
@@ -1003,41 +2185,63 @@ class EnsembleForecaster:
         Returns a dict matching the /forecast/multi-model API contract.
         """
         base_date = datetime.now()
+        statuses = dict(self.member_status)
+        keys, skipped = self._admitted_members(
+            [k for k in self.MODEL_KEYS if k not in statuses], budget, runs=1
+        )
+        statuses.update({key: "skipped" for key in skipped})
+
+        # --- collect raw predictions from every model, concurrently ---
+        jobs = {key: self._member_job(key, prices, steps, dates, role="full") for key in keys}
+        jobs["holt"] = (self.holt_model.forecast, (steps,))
+        if "lstm" in jobs:
+            jobs["lstm"] = (self.lstm_model.forecast, (steps,))
+        if budget is None:
+            fallbacks = {key: (lambda: (self.holt_model.forecast(steps), None)) for key in keys}
+        else:
+            fallbacks = {key: (lambda: None) for key in keys}
+            fallbacks["holt"] = lambda: (self.holt_model.forecast(steps), None)
+        outcomes = self._gather_members(self._timed_jobs(jobs), fallbacks, budget)
 
-        # --- collect raw predictions from every model ---
         model_preds: Dict[str, List[float]] = {}
-        for key in self.MODEL_KEYS:
-            try:
-                if key == "holt":
-                    preds = self.holt_model.forecast(steps)
-                elif key == "lstm":
-                    preds = self.lstm_model.forecast(steps)
-                elif key == "sarima":
-                    preds = self._run_sarima(prices, steps)
-                elif key == "gbr":
-                    preds = self._run_gbr(prices, steps)
-                elif key == "prophet":
-                    preds = self._run_prophet(prices, steps, dates)
-                else:
-                    preds = self._run_holt(prices, steps)
-                model_preds[key] = [max(1.0, p) for p in preds]
-            except Exception as e:
-                logger.warning(f"EnsembleForecaster {key} forecast failed: {e}")
+        predict_ms: Dict[str, float] = {}
+        for key in keys:
+            preds = outcomes[key]
+            if preds is None:
+                logger.warning(f"EnsembleForecaster {key} dropped: latency budget exhausted")
+                statuses[key] = "dropped"
+                continue
+            if isinstance(preds, tuple):
+                preds, ms = preds
+                if ms is not None:
+                    predict_ms[key] = round(ms, 1)
+            if isinstance(preds, Exception):
+                logger.warning(f"EnsembleForecaster {key} forecast failed: {preds}")
                 fallback_price = prices[-1] if prices else 300.0
                 model_preds[key] = [fallback_price] * steps
+            else:
+                model_preds[key] = [max(1.0, p) for p in preds]
 
+        # --- weights renormalised over the members that produced a forecast ---
+        used = [k for k in self.MODEL_KEYS if k in model_preds]
         weights = self.weights or {k: 1.0 / len(self.MODEL_KEYS) for k in self.MODEL_KEYS}
+        if len(used) < len(weights):
+            total = sum(weights.get(k, 0.0) for k in used)
+            weights = (
+                {k: weights.get(k, 0.0) / total for k in used} if total > 0
+                else {k: 1.0 / len(used) for k in used}
+            )
 
         # --- weighted ensemble mean ---
         ensemble_vals: List[float] = []
         for i in range(steps):
-            val = sum(weights.get(k, 0.0) * model_preds[k][i] for k in self.MODEL_KEYS)
+            val = sum(weights.get(k, 0.0) * model_preds[k][i] for k in used)
             ensemble_vals.append(val)
 
         # --- confidence intervals: spread of constituent model predictions ---
         ensemble_out: List[Dict[str, Any]] = []
         for i in range(steps):
-            day_preds = [model_preds[k][i] for k in self.MODEL_KEYS]
+            day_preds = [model_preds[k][i] for k in used]
             spread    = (max(day_preds) - min(day_preds)) / 2.0
             mid       = ensemble_vals[i]
             ensemble_out.append({
@@ -1061,19 +2265,174 @@ class EnsembleForecaster:
         else:
             accuracy = 0.5
 
+        members = {
+            key: {
+                "status": statuses.get(key, "used"),
+                "weight": round(weights.get(key, 0.0), 4),
+                "trainMs": self.train_ms.get(key),
+                "predictMs": predict_ms.get(key),
+            }
+            for key in self.MODEL_KEYS
+        }
+
         return {
             "ensemble":        ensemble_out,
-            "models":          {k: [round(p, 2) for p in v] for k, v in model_preds.items()},
+            "models":          {k: [round(p, 2) for p in model_preds[k]] for k in used},
             "modelWeights":    {k: round(v, 4) for k, v in weights.items()},
             "bestModel":       best_model,
             "ensembleAccuracy": accuracy,
+            "members":         members,
+            "partial":         is_partial(members),
+            "latencyBudgetMs": budget.max_latency_ms if budget else None,
         }
 
 
+# ============================================================================
+# MEMBER PRUNING (learned per series)
+# ============================================================================
+
+# A member whose blend weight stayed below MEMBER_PRUNE_THRESHOLD in each of a
+# series' last MEMBER_PRUNE_WINDOW trainings is no longer trained for it, except
+# on every MEMBER_PRUNE_REPROBE_EVERY-th training (0 threshold disables)
+MEMBER_PRUNE_THRESHOLD = float(os.getenv("MEMBER_PRUNE_THRESHOLD", "0.05"))
+MEMBER_PRUNE_WINDOW = int(os.getenv("MEMBER_PRUNE_WINDOW", "3"))
+MEMBER_PRUNE_REPROBE_EVERY = int(os.getenv("MEMBER_PRUNE_REPROBE_EVERY", "10"))
+MEMBER_PRUNE_MAX_SERIES = int(os.getenv("MEMBER_PRUNE_MAX_SERIES", "1024"))
+
+
+class MemberPruningCache:
+    """
+    Per-series record of RASSPriceModel blend weights, used to stop training
+    members that consistently contribute nothing to a series.
+
+    plan(key) returns the members to leave out of the next training and the
+    wall time each is expected to save (its last measured validate + train
+    time for that series). record(key, model, skipped) then appends the new
+    weights: a member below `threshold` in all of the last `window` trainings
+    is pruned; a pruned member is trained again once it has been skipped
+    `reprobe_every` times and stays pruned only if its weight is still below
+    the threshold. Series are kept in LRU order, at most `max_series`.
+    """
+
+    def __init__(self, threshold: float, window: int, reprobe_every: int, max_series: int = 1024):
+        self.threshold = threshold
+        self.window = max(1, window)
+        self.reprobe_every = max(1, reprobe_every)
+        self.max_series = max(1, max_series)
+        self._series: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.threshold > 0
+
+    def _entry(self, key: Tuple) -> Dict[str, Any]:
+        entry = self._series.get(key)
+        if entry is None:
+            entry = self._series[key] = {
+                "weights": {}, "pruned": {}, "costMs": {},
+                "trainings": 0, "skippedFits": 0, "savedMs": 0.0,
+            }
+            while len(self._series) > self.max_series:
+                self._series.popitem(last=False)
+        else:
+            self._series.move_to_end(key)
+        return entry
+
+    def plan(self, key: Tuple) -> Dict[str, float]:
+        """{member: expected ms saved} for the members to skip in the next training of `key`"""
+        if not self.enabled:
+            return {}
+        with self._lock:
+            entry = self._series.get(key)
+            if entry is None:
+                return {}
+            return {
+                member: entry["costMs"].get(member) or member_costs.estimate_ms(member, ("validate", "train"))
+                for member, skipped in entry["pruned"].items()
+                if skipped < self.reprobe_every
+            }
+
+    def record(self, key: Tuple, model: "RASSPriceModel", skipped: Dict[str, float]) -> None:
+        """Update `key` from a finished training of `model` that left out `skipped`"""
+        if not self.enabled:
+            return
+        timings = model.training_timings
+        with self._lock:
+            entry = self._entry(key)
+            entry["trainings"] += 1
+            for member, saved_ms in skipped.items():
+                if model.member_status.get(member) == "pruned":
+                    entry["pruned"][member] += 1
+                    entry["skippedFits"] += 1
+                    entry["savedMs"] += saved_ms
+                    record_metric("member_pruned_ms", (key[1], key[2], member), saved_ms)
+            for member, weight in model.ensemble_weights.items():
+                if member == "baseline":
+                    continue
+                entry["costMs"][member] = timings.get(member, 0.0) + timings.get(f"validation_{member}", 0.0)
+                history = entry["weights"].setdefault(member, deque(maxlen=self.window))
+                history.append(weight)
+                negligible = weight < self.threshold
+                if member in entry["pruned"]:
+                    if negligible:
+                        entry["pruned"][member] = 0
+                    else:
+                        # Re-probe found it useful again: start a fresh window
+                        del entry["pruned"][member]
+                        history.clear()
+                        history.append(weight)
+                elif len(history) == self.window and all(w < self.threshold for w in history):
+                    entry["pruned"][member] = 0
+                    logger.info(f"Pruning {member} for series {key[1:3]}: weight below {self.threshold} in {self.window} trainings")
+
+    def series_stats(self, key: Tuple) -> Dict[str, Any]:
+        with self._lock:
+            entry = self._series.get(key)
+            if entry is None:
+                return {"pruned": [], "trainings": 0, "skippedFits": 0, "savedMs": 0.0}
+            return {
+                "pruned": sorted(entry["pruned"]),
+                "trainings": entry["trainings"],
+                "skippedFits": entry["skippedFits"],
+                "savedMs": round(entry["savedMs"], 1),
+            }
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "threshold": self.threshold,
+                "window": self.window,
+                "reprobeEvery": self.reprobe_every,
+                "series": len(self._series),
+                "prunedMembers": sum(len(e["pruned"]) for e in self._series.values()),
+                "skippedFits": sum(e["skippedFits"] for e in self._series.values()),
+                "savedMs": round(sum(e["savedMs"] for e in self._series.values()), 1),
+            }
+
+
+member_pruning = MemberPruningCache(
+    MEMBER_PRUNE_THRESHOLD, MEMBER_PRUNE_WINDOW, MEMBER_PRUNE_REPROBE_EVERY, MEMBER_PRUNE_MAX_SERIES
+)
+
+
 # ============================================================================
 # MAIN PRICE PREDICTION MODEL
 # ============================================================================
 
+# How the GBR / XGBoost / LightGBM members forecast: "recursive" (one-step
+# model fed its own predictions) or "direct" (DirectHorizonRegressor over
+# TREE_FORECAST_HORIZONS days)
+TREE_FORECAST_STRATEGY = os.getenv("TREE_FORECAST_STRATEGY", "recursive")
+TREE_FORECAST_HORIZONS = int(os.getenv("TREE_FORECAST_HORIZONS", "14"))
+# Fit the final GBR / XGBoost / LightGBM members by continuing to boost their
+# validation fits (WARM_START_EXTRA_ESTIMATORS rounds) instead of refitting on
+# the full series. Faster, but the holdout days - the most recent prices - are
+# then only learned by those few extra rounds, which biases the forecasts
+# toward the pre-holdout level after a recent shift
+TREE_WARM_START = os.getenv("TREE_WARM_START", "false").lower() in ("1", "true", "yes")
+
 class RASSPriceModel:
     """
     Main price prediction model combining:
@@ -1083,7 +2442,7 @@ class RASSPriceModel:
     4. Explainability
     """
     
-    def __init__(self):
+    def __init__(self, forecast_strategy: str = None, forecast_horizons: int = None):
         self.statistical_model = HoltLinearModel(alpha=0.3, beta=0.1)
         self.ml_model = RidgeRegression(alpha=1.0, learning_rate=0.001, iterations=500)
         self.prophet_model = None
@@ -1098,107 +2457,117 @@ class RASSPriceModel:
         self.feature_engineer = FeatureEngineer()
         self.trained = False
         self.historical_errors: List[float] = []
+        self.training_timings: Dict[str, float] = {}
+        self.predict_timings: Dict[str, float] = {}
+        self._validation_fits: Dict[str, Any] = {}
+        # Members a latency budget kept out of the last training: key -> "skipped" / "dropped"
+        self.member_status: Dict[str, str] = {}
+        # Registry key of the series, set by get_model; keys the SARIMA state cache
+        self.series_key: Optional[Tuple] = None
+        self.forecast_strategy = forecast_strategy or TREE_FORECAST_STRATEGY
+        self.forecast_horizons = forecast_horizons or TREE_FORECAST_HORIZONS
+    
+    # Members trained on top of the Holt + ridge baseline, in their order
+    # without a latency budget
+    OPTIONAL_MEMBERS = ("prophet", "sarima", "gbr", "xgb", "lgb")
     
     def train(
         self,
         historical_prices: List[PricePoint],
         market_features: MarketFeatures = None,
-        external_factors: ExternalFactors = None
+        external_factors: ExternalFactors = None,
+        budget: LatencyBudget = None,
+        prune: Collection[str] = ()
     ) -> bool:
-        """Train the model on historical data"""
+        """Train the model on historical data (PricePoints or a PriceHistory).
+
+        With a `budget`, the optional members train cheapest-first while their
+        estimated cost fits in the time left; the rest are skipped, and one
+        that finishes past the deadline is dropped. Members in `prune` (see
+        MemberPruningCache) are not trained at all.
+        """
         try:
             if len(historical_prices) < 7:
                 logger.warning("Insufficient data for training, using defaults")
                 return False
             
-            # Sort by date
-            sorted_prices = sorted(historical_prices, key=lambda x: x.date)
-            prices = [p.price for p in sorted_prices]
-            dates = [p.date for p in sorted_prices]
+            # Sorted columns (a PriceHistory is already sorted)
+            history = as_price_history(historical_prices)
+            prices = history.price_list
+            dates = history.date_list
+            record_metric("series_length", ("price",), len(prices))
             
-            # --- Attempt Prophet Training First ---
-            if PROPHET_AVAILABLE and len(prices) >= 14:
-                try:
-                    df = pd.DataFrame({
-                        'ds': dates,
-                        'y': prices
-                    })
-                    # Add regressors if external features exist (simplified for this scope)
-                    self.prophet_model = Prophet(
-                        daily_seasonality=False,
-                        weekly_seasonality=len(prices) > 30,
-                        yearly_seasonality=len(prices) > 365,
-                        changepoint_prior_scale=0.05
-                    )
-                    self.prophet_model.fit(df)
-                    logger.info("Successfully trained Prophet model.")
-                except Exception as e:
-                    logger.warning(f"Prophet training failed: {e}. Falling back to baseline.")
-                    self.prophet_model = None
+            # Wall time per training stage, in milliseconds
+            self.training_timings = {}
+            timings = self.training_timings
+            
+            # --- Statistical baseline ---
+            with stage_timer(timings, "holt"):
+                self.statistical_model.fit(prices)
             
-            # --- Fallback: Fit statistical model ---
-            self.statistical_model.fit(prices)
+            # One feature matrix (rows for prices[:i], i >= 7) shared by the
+            # residual model, validation fits and final tree members
+            features = None
+            if len(prices) >= 14:
+                with stage_timer(timings, "features"):
+                    features = self._prepare_feature_matrix(prices, external_factors)
             
             # Prepare features for ML residual correction model (if enough data)
             if len(prices) >= 14:
-                X = []
-                y = []  # Residuals from statistical model
+                # Residual samples start at i = 14, i.e. row 7 of the shared matrix
+                X = features[7:]
                 
-                # Create training samples
-                for i in range(14, len(prices)):
-                    # Get statistical forecast for this point
-                    temp_model = HoltLinearModel()
-                    temp_model.fit(prices[:i-1])
-                    stat_forecast = temp_model.forecast(1)[0]
-                    
-                    # Residual is actual - forecast
-                    residual = prices[i] - stat_forecast
-                    
-                    # Generate features
-                    features = []
-                    lag_feats = self.feature_engineer.create_lag_features(prices[:i])
-                    roll_feats = self.feature_engineer.create_rolling_features(prices[:i])
-                    
-                    features.extend([
-                        lag_feats.get("price_pct_change_1d", 0),
-                        lag_feats.get("price_pct_change_7d", 0),
-                        roll_feats.get("momentum", 0),
-                        roll_feats.get("volatility_cv", 0),
-                    ])
-                    
-                    # Add external features if available
-                    if external_factors:
-                        ext_feats = self.feature_engineer.create_external_features(external_factors)
-                        features.extend([
-                            ext_feats.get("rainfall_anomaly", 0),
-                            ext_feats.get("fuel_price_index", 1),
-                            ext_feats.get("supply_demand_ratio", 1),
-                        ])
-                    else:
-                        features.extend([0, 1, 1])  # Defaults
-                    
-                    X.append(features)
-                    y.append(residual)
+                # Residual targets from the single Holt pass above: sample i pairs
+                # prices[i] with the forecast made from prices[:i-1], i.e. fitted_values[i-1]
+                stat_forecasts = self.statistical_model.fitted_values
+                y = [prices[i] - stat_forecasts[i - 1] for i in range(14, len(prices))]
                 
                 # Train ML model
                 feature_names = [
                     "price_pct_change_1d", "price_pct_change_7d", "momentum", "volatility_cv",
                     "rainfall_anomaly", "fuel_price_index", "supply_demand_ratio"
                 ]
-                self.ml_model.fit(X, y, feature_names)
+                with stage_timer(timings, "ridge"):
+                    self.ml_model.fit(X, y, feature_names)
                 
                 # Store historical errors for uncertainty estimation
                 if self.ml_model.trained:
                     predictions = self.ml_model.predict(X)
                     self.historical_errors = [y[i] - predictions[i] for i in range(len(y))]
 
-            # Train additional ensemble components
-            self._train_sarima(prices)
-            self._train_gbr(prices, external_factors)
-            self._train_xgb(prices, external_factors)
-            self._train_lgb(prices, external_factors)
-            self.ensemble_weights = self._compute_ensemble_weights(prices, external_factors)
-
+            # Optional members: each is validated on the holdout split (for the
+            # blend weights), then fitted on the full series (SARIMA seeded with
+            # its validation parameters; trees warm-started only with TREE_WARM_START)
+            split = self._validation_split(prices, external_factors, features)
+            errors: Dict[str, float] = {"baseline": split["baseline_error"]} if split else {}
+            self.member_status = {}
+            members = self.OPTIONAL_MEMBERS
+            if budget is not None:
+                members = budget.order(members, ("validate", "train"))
+            for key in members:
+                if key in prune and self._member_available(key, prices):
+                    self._drop_member(key)
+                    self.member_status[key] = "pruned"
+                    continue
+                if (
+                    budget is not None and self._member_available(key, prices)
+                    and not budget.admits(key, ("validate", "train"))
+                ):
+                    self._drop_member(key)
+                    self.member_status[key] = "skipped"
+                    continue
+                self._train_member(key, prices, dates, external_factors, features, split, errors)
+                if budget is not None and budget.expired() and self._member_available(key, prices):
+                    self._drop_member(key)
+                    errors.pop(key, None)
+                    self.member_status[key] = "dropped"
+            self.ensemble_weights = self._weights_from_errors(errors) if split else {"baseline": 1.0}
+            self._validation_fits = {}
+
+            logger.info(
+                "Training stages (ms): "
+                + ", ".join(f"{stage}={ms:.1f}" for stage, ms in timings.items())
+            )
             self.trained = True
             return True
             
@@ -1211,9 +2580,17 @@ class RASSPriceModel:
         historical_prices: List[PricePoint],
         forecast_days: int,
         market_features: MarketFeatures = None,
-        external_factors: ExternalFactors = None
+        external_factors: ExternalFactors = None,
+        budget: LatencyBudget = None,
+        prune: Collection[str] = ()
     ) -> ForecastOutput:
-        """Generate price forecast"""
+        """Generate price forecast.
+
+        With a `budget`, training (if needed) is budgeted as in train(), and a
+        member whose turn comes after the deadline is dropped from the blend.
+        `prune` is passed on to train(). The output lists each member's status
+        and timings.
+        """
         
         # Ensure we have data
         if not historical_prices:
@@ -1221,32 +2598,37 @@ class RASSPriceModel:
             return self._default_forecast(forecast_days)
         
         # Sort and extract prices
-        sorted_prices = sorted(historical_prices, key=lambda x: x.date)
-        prices = [p.price for p in sorted_prices]
+        history = as_price_history(historical_prices)
+        prices = history.price_list
         current_price = prices[-1]
-        current_date = sorted_prices[-1].date
+        current_date = history.date_list[-1]
         
         # Train if not already trained
         if not self.trained:
-            self.train(historical_prices, market_features, external_factors)
+            self.train(history, market_features, external_factors, budget=budget, prune=prune)
             # If still not trained, use simple forecast
             if not self.trained:
                 self.statistical_model.fit(prices)
         
         forecasts = []
         contributions = {}
+        # Wall time per forecasting member, in milliseconds
+        self.predict_timings = {}
+        timings = self.predict_timings
+        statuses = dict(self.member_status)
         
         # --- Run Prophet if available and trained ---
-        if self.prophet_model is not None:
+        if self.prophet_model is not None and self._within_budget("prophet", budget, statuses):
             try:
-                future = self.prophet_model.make_future_dataframe(periods=forecast_days)
-                forecast_df = self.prophet_model.predict(future)
+                with stage_timer(timings, "prophet", phase="predict"):
+                    forecast_df = self.prophet_model.forecast(forecast_days, current_date)
                 # Extract only the future predictions
                 forecasts = forecast_df['yhat'].tail(forecast_days).tolist()
                 
                 # Estimate basic contributions based on prophet components
+                # (row 0 is the last observed day)
                 if 'trend' in forecast_df.columns:
-                    trend_diff = forecast_df['trend'].iloc[-1] - forecast_df['trend'].iloc[-forecast_days-1]
+                    trend_diff = forecast_df['trend'].iloc[-1] - forecast_df['trend'].iloc[0]
                     contributions['momentum'] = trend_diff
                 
                 logger.info("Generated predictions using Prophet.")
@@ -1254,15 +2636,19 @@ class RASSPriceModel:
                 logger.warning(f"Prophet prediction failed: {e}. Falling back to baseline.")
                 forecasts = []
         
+        prophet_used = bool(forecasts)
+        
         # --- Fallback to baseline (+ ML correction) if Prophet failed or is missing ---
         if not forecasts:
             # Generate base forecast
-            base_forecasts = self.statistical_model.forecast(forecast_days)
+            with stage_timer(timings, "holt", phase="predict"):
+                base_forecasts = self.statistical_model.forecast(forecast_days)
             
             # Apply ML correction if available
             if self.ml_model.trained:
-                features = self._prepare_features(prices, external_factors)
-                corrections = self.ml_model.predict([features] * forecast_days)
+                with stage_timer(timings, "ridge", phase="predict"):
+                    features = self._prepare_features(prices, external_factors)
+                    corrections = self.ml_model.predict([features] * forecast_days)
                 forecasts = [base_forecasts[i] + corrections[i] for i in range(forecast_days)]
                 contributions = self.ml_model.get_feature_contributions(features)
             else:
@@ -1273,31 +2659,36 @@ class RASSPriceModel:
         # Ensemble blend with SARIMA / Gradient Boosting if available
         ensemble_candidates: Dict[str, List[float]] = {"baseline": baseline_forecasts}
 
-        if self.sarima_model is not None:
+        if self.sarima_model is not None and self._within_budget("sarima", budget, statuses):
             try:
-                sarima_preds = list(self.sarima_model.forecast(steps=forecast_days))
+                with stage_timer(timings, "sarima", phase="predict"):
+                    sarima_preds = list(self.sarima_model.forecast(steps=forecast_days))
                 if len(sarima_preds) == forecast_days:
                     ensemble_candidates["sarima"] = sarima_preds
             except Exception as e:
                 logger.warning(f"SARIMA forecast failed: {e}")
 
-        if self.gbr_trained:
-            gbr_preds = self._gbr_forecast(prices, forecast_days, external_factors)
+        if self.gbr_trained and self._within_budget("gbr", budget, statuses):
+            with stage_timer(timings, "gbr", phase="predict"):
+                gbr_preds = self._gbr_forecast(prices, forecast_days, external_factors)
             if len(gbr_preds) == forecast_days:
                 ensemble_candidates["gbr"] = gbr_preds
 
-        if self.xgb_trained:
-            xgb_preds = self._xgb_forecast(prices, forecast_days, external_factors)
+        if self.xgb_trained and self._within_budget("xgb", budget, statuses):
+            with stage_timer(timings, "xgb", phase="predict"):
+                xgb_preds = self._xgb_forecast(prices, forecast_days, external_factors)
             if len(xgb_preds) == forecast_days:
                 ensemble_candidates["xgb"] = xgb_preds
 
-        if self.lgb_trained:
-            lgb_preds = self._lgb_forecast(prices, forecast_days, external_factors)
+        if self.lgb_trained and self._within_budget("lgb", budget, statuses):
+            with stage_timer(timings, "lgb", phase="predict"):
+                lgb_preds = self._lgb_forecast(prices, forecast_days, external_factors)
             if len(lgb_preds) == forecast_days:
                 ensemble_candidates["lgb"] = lgb_preds
 
         if len(ensemble_candidates) > 1:
             forecasts = self._blend_forecasts(ensemble_candidates, self.ensemble_weights)
+        members = self._member_report(ensemble_candidates, prophet_used, statuses)
 
         # Ensure no negative prices
         forecasts = [max(10, f) for f in forecasts]
@@ -1352,48 +2743,177 @@ class RASSPriceModel:
             confidence=round(confidence, 2),
             recommendation=recommendation.value,
             explanation=explanation,
-            top_factors=top_factors
+            top_factors=top_factors,
+            members=members,
+            partial=is_partial(members)
+        )
+
+    def update(self, new_prices: List[float]) -> List[float]:
+        """
+        Fold observations that extend the training series into the fitted
+        state without retraining: the Holt level and trend (exactly as a refit
+        would) and the SARIMA filter (parameters kept). Prophet, ridge and the
+        tree members forecast from the series passed to predict() and need no
+        update. Returns each observation's one-step-ahead Holt error.
+        """
+        errors = [self.statistical_model.update(p) for p in new_prices]
+        if self.sarima_model is not None:
+            try:
+                self.sarima_model = self.sarima_model.append(list(new_prices), refit=False)
+            except Exception as e:
+                logger.warning(f"SARIMA append failed ({e}); dropping it until the next training")
+                self._drop_member("sarima")
+        return errors
+
+    def _train_prophet(self, prices: List[float], dates: List[datetime]) -> None:
+        """Fit Prophet; when it trains, its forecast replaces the Holt + ridge baseline"""
+        if not PROPHET_AVAILABLE or len(prices) < 14:
+            self.prophet_model = None
+            return
+        try:
+            # Shared with EnsembleForecaster fits of the same series
+            with stage_timer(self.training_timings, "prophet"):
+                self.prophet_model = prophet_fits.fit(prices, dates)
+            logger.info("Successfully trained Prophet model.")
+        except Exception as e:
+            logger.warning(f"Prophet training failed: {e}. Falling back to baseline.")
+            self.prophet_model = None
+
+    def _member_available(self, key: str, prices: List[float]) -> bool:
+        """Whether an optional member can train at all (backend installed, enough data)"""
+        if len(prices) < 14:
+            return False
+        return {
+            "prophet": PROPHET_AVAILABLE,
+            "sarima": SARIMA_AVAILABLE,
+            "gbr": SKLEARN_AVAILABLE,
+            "xgb": XGBOOST_AVAILABLE and xgb is not None,
+            "lgb": LIGHTGBM_AVAILABLE and lgb is not None,
+        }[key]
+
+    @property
+    def budget_limited(self) -> bool:
+        """Whether a latency budget kept members out of the last training"""
+        return any(status in ("skipped", "dropped") for status in self.member_status.values())
+
+    def _drop_member(self, key: str) -> None:
+        if key == "prophet":
+            self.prophet_model = None
+        elif key == "sarima":
+            self.sarima_model = None
+        else:
+            setattr(self, f"{key}_model", None)
+            setattr(self, f"{key}_trained", False)
+
+    def _train_member(
+        self,
+        key: str,
+        prices: List[float],
+        dates: List[datetime],
+        external_factors: ExternalFactors,
+        features,
+        split: Optional[Dict[str, Any]],
+        errors: Dict[str, float]
+    ) -> None:
+        """Validate one optional member (recording its holdout error) and fit it on the full series"""
+        timings = self.training_timings
+        if key == "prophet":
+            self._train_prophet(prices, dates)
+            return
+        warm_from = self._validate_member(key, split, external_factors, errors) if split else None
+        if key != "sarima" and not TREE_WARM_START:
+            warm_from = None
+        with stage_timer(timings, key):
+            if key == "sarima":
+                self._train_sarima(prices, warm_from=warm_from)
+            else:
+                getattr(self, f"_train_{key}")(prices, external_factors, features, warm_from=warm_from)
+
+    # Boosting rounds added on top of a validation fit when warm-starting the
+    # final model on the full series (instead of refitting from scratch)
+    WARM_START_EXTRA_ESTIMATORS = 50
+
+    @staticmethod
+    def _new_gbr(n_estimators: int = 200):
+        return GradientBoostingRegressor(
+            random_state=42,
+            n_estimators=n_estimators,
+            learning_rate=0.05,
+            max_depth=3
         )
 
-    def _train_sarima(self, prices: List[float]) -> None:
+    @staticmethod
+    def _new_xgb(n_estimators: int = 200):
+        return xgb.XGBRegressor(
+            random_state=42,
+            n_estimators=n_estimators,
+            learning_rate=0.05,
+            max_depth=4,
+            subsample=0.8,
+            colsample_bytree=0.8,
+            verbosity=0
+        )
+
+    @staticmethod
+    def _new_lgb(n_estimators: int = 200):
+        return lgb.LGBMRegressor(
+            random_state=42,
+            n_estimators=n_estimators,
+            learning_rate=0.05,
+            max_depth=4,
+            subsample=0.8,
+            colsample_bytree=0.8,
+            verbose=-1
+        )
+
+    def _fit_sarima(self, prices: List[float], role: str, start_params=None):
+        """SARIMA fit through the per-series state cache"""
+        state_key = None if self.series_key is None else self.series_key + (role,)
+        return sarima_states.fit(state_key, prices, start_params)
+
+    def _train_sarima(self, prices: List[float], warm_from=None) -> None:
         if not SARIMA_AVAILABLE or len(prices) < 14:
             self.sarima_model = None
             return
         try:
-            model = SARIMAX(
-                prices,
-                order=(1, 1, 1),
-                seasonal_order=(0, 1, 1, 7),
-                enforce_stationarity=False,
-                enforce_invertibility=False
-            )
-            self.sarima_model = model.fit(disp=False)
+            # A refit is seeded with the validation fit's parameters when available
+            start_params = warm_from.params if warm_from is not None else None
+            self.sarima_model = self._fit_sarima(prices, "full", start_params)
         except Exception as e:
             logger.warning(f"SARIMA training failed: {e}")
             self.sarima_model = None
 
-    def _train_gbr(self, prices: List[float], external_factors: ExternalFactors = None) -> None:
+    def _train_gbr(
+        self,
+        prices: List[float],
+        external_factors: ExternalFactors = None,
+        features=None,
+        warm_from=None
+    ) -> None:
         if not SKLEARN_AVAILABLE or len(prices) < 14:
             self.gbr_model = None
             self.gbr_trained = False
             return
         try:
-            X: List[List[float]] = []
-            y: List[float] = []
-            for i in range(7, len(prices)):
-                X.append(self._prepare_features(prices[:i], external_factors))
-                y.append(prices[i])
+            X = features if features is not None else self._prepare_feature_matrix(prices, external_factors)
+            y = prices[7:]
             if len(X) < 5:
                 self.gbr_model = None
                 self.gbr_trained = False
                 return
-            model = GradientBoostingRegressor(
-                random_state=42,
-                n_estimators=200,
-                learning_rate=0.05,
-                max_depth=3
-            )
-            model.fit(X, y)
+            if self.forecast_strategy == "direct":
+                model = self._fit_direct("gbr", X, prices)
+            elif warm_from is not None:
+                # Continue boosting the validation fit on the full series
+                model = warm_from
+                model.set_params(
+                    warm_start=True,
+                    n_estimators=model.n_estimators + self.WARM_START_EXTRA_ESTIMATORS
+                )
+            else:
+                model = self._new_gbr()
+            if not isinstance(model, DirectHorizonRegressor):
+                model.fit(X, y)
             self.gbr_model = model
             self.gbr_trained = True
         except Exception as e:
@@ -1401,43 +2921,74 @@ class RASSPriceModel:
             self.gbr_model = None
             self.gbr_trained = False
 
-    def _gbr_forecast(self, prices: List[float], forecast_days: int, external_factors: ExternalFactors = None) -> List[float]:
-        if not self.gbr_trained or self.gbr_model is None:
-            return []
-        history = list(prices)
+    def _recursive_forecast(
+        self,
+        model,
+        prices: List[float],
+        forecast_days: int,
+        external_factors: ExternalFactors = None
+    ) -> List[float]:
+        """Roll a one-step regressor forward, feeding each prediction back in"""
+        state = RollingFeatureState(prices)
+        external = self._external_feature_values(external_factors)
         preds: List[float] = []
         for _ in range(forecast_days):
-            features = self._prepare_features(history, external_factors)
-            pred = float(self.gbr_model.predict([features])[0])
+            pred = float(predict_rows(model, [state.features() + external])[0])
             preds.append(pred)
-            history.append(pred)
+            state.append(pred)
         return preds
 
-    def _train_xgb(self, prices: List[float], external_factors: ExternalFactors = None) -> None:
+    def _fit_direct(self, key: str, X, prices: List[float]) -> DirectHorizonRegressor:
+        """Direct multi-horizon member; XGBoost fits all horizons as one multi-output model"""
+        factory = {"gbr": self._new_gbr, "xgb": self._new_xgb, "lgb": self._new_lgb}[key]
+        return DirectHorizonRegressor(
+            factory, self.forecast_horizons, multi_output=(key == "xgb")
+        ).fit(X, prices)
+
+    def _member_forecast(
+        self,
+        model,
+        prices: List[float],
+        forecast_days: int,
+        external_factors: ExternalFactors = None
+    ) -> List[float]:
+        """Forecast with a tree member, whichever strategy it was trained with"""
+        if isinstance(model, DirectHorizonRegressor):
+            return model.forecast(prices, forecast_days, self._external_feature_values(external_factors))
+        return self._recursive_forecast(model, prices, forecast_days, external_factors)
+
+    def _gbr_forecast(self, prices: List[float], forecast_days: int, external_factors: ExternalFactors = None) -> List[float]:
+        if not self.gbr_trained or self.gbr_model is None:
+            return []
+        return self._member_forecast(self.gbr_model, prices, forecast_days, external_factors)
+
+    def _train_xgb(
+        self,
+        prices: List[float],
+        external_factors: ExternalFactors = None,
+        features=None,
+        warm_from=None
+    ) -> None:
         if not XGBOOST_AVAILABLE or xgb is None or len(prices) < 14:
             self.xgb_model = None
             self.xgb_trained = False
             return
         try:
-            X: List[List[float]] = []
-            y: List[float] = []
-            for i in range(7, len(prices)):
-                X.append(self._prepare_features(prices[:i], external_factors))
-                y.append(prices[i])
+            X = features if features is not None else self._prepare_feature_matrix(prices, external_factors)
+            y = prices[7:]
             if len(X) < 5:
                 self.xgb_model = None
                 self.xgb_trained = False
                 return
-            model = xgb.XGBRegressor(
-                random_state=42,
-                n_estimators=200,
-                learning_rate=0.05,
-                max_depth=4,
-                subsample=0.8,
-                colsample_bytree=0.8,
-                verbosity=0
-            )
-            model.fit(X, y)
+            if self.forecast_strategy == "direct":
+                model = self._fit_direct("xgb", X, prices)
+            elif warm_from is not None:
+                # Continue boosting the validation booster on the full series
+                model = self._new_xgb(self.WARM_START_EXTRA_ESTIMATORS)
+                model.fit(X, y, xgb_model=warm_from.get_booster())
+            else:
+                model = self._new_xgb()
+                model.fit(X, y)
             self.xgb_model = model
             self.xgb_trained = True
         except Exception as e:
@@ -1448,40 +2999,35 @@ class RASSPriceModel:
     def _xgb_forecast(self, prices: List[float], forecast_days: int, external_factors: ExternalFactors = None) -> List[float]:
         if not self.xgb_trained or self.xgb_model is None:
             return []
-        history = list(prices)
-        preds: List[float] = []
-        for _ in range(forecast_days):
-            features = self._prepare_features(history, external_factors)
-            pred = float(self.xgb_model.predict([features])[0])
-            preds.append(pred)
-            history.append(pred)
-        return preds
+        return self._member_forecast(self.xgb_model, prices, forecast_days, external_factors)
 
-    def _train_lgb(self, prices: List[float], external_factors: ExternalFactors = None) -> None:
+    def _train_lgb(
+        self,
+        prices: List[float],
+        external_factors: ExternalFactors = None,
+        features=None,
+        warm_from=None
+    ) -> None:
         if not LIGHTGBM_AVAILABLE or lgb is None or len(prices) < 14:
             self.lgb_model = None
             self.lgb_trained = False
             return
         try:
-            X: List[List[float]] = []
-            y: List[float] = []
-            for i in range(7, len(prices)):
-                X.append(self._prepare_features(prices[:i], external_factors))
-                y.append(prices[i])
+            X = features if features is not None else self._prepare_feature_matrix(prices, external_factors)
+            y = prices[7:]
             if len(X) < 5:
                 self.lgb_model = None
                 self.lgb_trained = False
                 return
-            model = lgb.LGBMRegressor(
-                random_state=42,
-                n_estimators=200,
-                learning_rate=0.05,
-                max_depth=4,
-                subsample=0.8,
-                colsample_bytree=0.8,
-                verbose=-1
-            )
-            model.fit(X, y)
+            if self.forecast_strategy == "direct":
+                model = self._fit_direct("lgb", X, prices)
+            elif warm_from is not None:
+                # Continue boosting the validation booster on the full series
+                model = self._new_lgb(self.WARM_START_EXTRA_ESTIMATORS)
+                model.fit(X, y, init_model=warm_from.booster_)
+            else:
+                model = self._new_lgb()
+                model.fit(X, y)
             self.lgb_model = model
             self.lgb_trained = True
         except Exception as e:
@@ -1492,14 +3038,7 @@ class RASSPriceModel:
     def _lgb_forecast(self, prices: List[float], forecast_days: int, external_factors: ExternalFactors = None) -> List[float]:
         if not self.lgb_trained or self.lgb_model is None:
             return []
-        history = list(prices)
-        preds: List[float] = []
-        for _ in range(forecast_days):
-            features = self._prepare_features(history, external_factors)
-            pred = float(self.lgb_model.predict([features])[0])
-            preds.append(pred)
-            history.append(pred)
-        return preds
+        return self._member_forecast(self.lgb_model, prices, forecast_days, external_factors)
 
     def _mape(self, actual: List[float], predicted: List[float]) -> float:
         if not actual or not predicted:
@@ -1512,114 +3051,102 @@ class RASSPriceModel:
                 errors.append(abs((a - p) / a))
         return mean(errors) if errors else 1.0
 
-    def _compute_ensemble_weights(self, prices: List[float], external_factors: ExternalFactors = None) -> Dict[str, float]:
+    def _validation_split(
+        self,
+        prices: List[float],
+        external_factors: ExternalFactors = None,
+        features=None
+    ) -> Optional[Dict[str, Any]]:
+        """Holdout split shared by the member validations, or None for short series.
+
+        `features` is the full-series feature matrix; because row k only depends
+        on prices[:7 + k], the training split's matrix is a prefix of it. The
+        fitted validation members are kept in self._validation_fits so the
+        final models can be seeded (SARIMA) or warm-started (TREE_WARM_START)
+        from them.
+        """
+        self._validation_fits = {}
         if len(prices) < 20:
-            return {"baseline": 1.0}
+            return None
 
         holdout = min(7, max(3, len(prices) // 4))
         train_prices = prices[:-holdout]
         test_prices = prices[-holdout:]
-
-        errors: Dict[str, float] = {}
+        if features is None:
+            features = self._prepare_feature_matrix(prices, external_factors)
 
         # Baseline Holt-linear
         base_model = HoltLinearModel(alpha=0.3, beta=0.1)
         base_model.fit(train_prices)
         base_preds = base_model.forecast(holdout)
-        errors["baseline"] = self._mape(test_prices, base_preds)
+
+        return {
+            "holdout": holdout,
+            "train": train_prices,
+            "test": test_prices,
+            "X_train": features[:len(train_prices) - 7],
+            "y_train": train_prices[7:],
+            "baseline_error": self._mape(test_prices, base_preds),
+        }
+
+    def _validate_member(
+        self,
+        key: str,
+        split: Dict[str, Any],
+        external_factors: ExternalFactors,
+        errors: Dict[str, float]
+    ):
+        """Fit `key` on the training split and record its holdout MAPE in `errors`.
+
+        Returns the fitted member when the final fit can be warm-started from it.
+        """
+        train_prices, test_prices, holdout = split["train"], split["test"], split["holdout"]
+        timings = self.training_timings
 
         # SARIMA
-        if SARIMA_AVAILABLE and len(train_prices) >= 14:
+        if key == "sarima":
+            if not SARIMA_AVAILABLE or len(train_prices) < 14:
+                return None
             try:
-                sarima = SARIMAX(
-                    train_prices,
-                    order=(1, 1, 1),
-                    seasonal_order=(0, 1, 1, 7),
-                    enforce_stationarity=False,
-                    enforce_invertibility=False
-                ).fit(disp=False)
-                sarima_preds = list(sarima.forecast(steps=holdout))
+                with stage_timer(timings, "validation_sarima", model="sarima", phase="validate"):
+                    sarima = self._fit_sarima(train_prices, "validate")
+                    sarima_preds = list(sarima.forecast(steps=holdout))
                 errors["sarima"] = self._mape(test_prices, sarima_preds)
+                self._validation_fits["sarima"] = sarima
+                return sarima
             except Exception as e:
                 logger.warning(f"SARIMA validation failed: {e}")
+                return None
+
+        # Tree members share the training-split feature matrix
+        X_train = split["X_train"]
+        tree_members = {
+            "gbr": (SKLEARN_AVAILABLE, self._new_gbr, "Gradient boosting"),
+            "xgb": (XGBOOST_AVAILABLE and xgb is not None, self._new_xgb, "XGBoost"),
+            "lgb": (LIGHTGBM_AVAILABLE and lgb is not None, self._new_lgb, "LightGBM"),
+        }
+        available, factory, label = tree_members[key]
+        if not available or len(train_prices) < 14 or len(X_train) < 5:
+            return None
+        try:
+            with stage_timer(timings, f"validation_{key}", model=key, phase="validate"):
+                if self.forecast_strategy == "direct":
+                    member = self._fit_direct(key, X_train, train_prices)
+                else:
+                    member = factory()
+                    member.fit(X_train, split["y_train"])
+                preds = self._member_forecast(member, train_prices, holdout, external_factors)
+            errors[key] = self._mape(test_prices, preds)
+            if self.forecast_strategy != "direct":
+                self._validation_fits[key] = member
+                return member
+        except Exception as e:
+            logger.warning(f"{label} validation failed: {e}")
+        return None
 
-        # Gradient Boosting
-        if SKLEARN_AVAILABLE and len(train_prices) >= 14:
-            try:
-                X: List[List[float]] = []
-                y: List[float] = []
-                for i in range(7, len(train_prices)):
-                    X.append(self._prepare_features(train_prices[:i], external_factors))
-                    y.append(train_prices[i])
-                if len(X) >= 5:
-                    gbr = GradientBoostingRegressor(
-                        random_state=42,
-                        n_estimators=200,
-                        learning_rate=0.05,
-                        max_depth=3
-                    )
-                    gbr.fit(X, y)
-                    history = list(train_prices)
-                    gbr_preds: List[float] = []
-                    for _ in range(holdout):
-                        feat = self._prepare_features(history, external_factors)
-                        pred = float(gbr.predict([feat])[0])
-                        gbr_preds.append(pred)
-                        history.append(pred)
-                    errors["gbr"] = self._mape(test_prices, gbr_preds)
-            except Exception as e:
-                logger.warning(f"Gradient boosting validation failed: {e}")
-
-        # XGBoost
-        if XGBOOST_AVAILABLE and xgb is not None and len(train_prices) >= 14:
-            try:
-                X_xgb: List[List[float]] = []
-                y_xgb: List[float] = []
-                for i in range(7, len(train_prices)):
-                    X_xgb.append(self._prepare_features(train_prices[:i], external_factors))
-                    y_xgb.append(train_prices[i])
-                if len(X_xgb) >= 5:
-                    xgb_model = xgb.XGBRegressor(
-                        random_state=42, n_estimators=200, learning_rate=0.05,
-                        max_depth=4, subsample=0.8, colsample_bytree=0.8, verbosity=0
-                    )
-                    xgb_model.fit(X_xgb, y_xgb)
-                    history = list(train_prices)
-                    xgb_preds: List[float] = []
-                    for _ in range(holdout):
-                        feat = self._prepare_features(history, external_factors)
-                        pred = float(xgb_model.predict([feat])[0])
-                        xgb_preds.append(pred)
-                        history.append(pred)
-                    errors["xgb"] = self._mape(test_prices, xgb_preds)
-            except Exception as e:
-                logger.warning(f"XGBoost validation failed: {e}")
-
-        # LightGBM
-        if LIGHTGBM_AVAILABLE and lgb is not None and len(train_prices) >= 14:
-            try:
-                X_lgb: List[List[float]] = []
-                y_lgb: List[float] = []
-                for i in range(7, len(train_prices)):
-                    X_lgb.append(self._prepare_features(train_prices[:i], external_factors))
-                    y_lgb.append(train_prices[i])
-                if len(X_lgb) >= 5:
-                    lgb_model = lgb.LGBMRegressor(
-                        random_state=42, n_estimators=200, learning_rate=0.05,
-                        max_depth=4, subsample=0.8, colsample_bytree=0.8, verbose=-1
-                    )
-                    lgb_model.fit(X_lgb, y_lgb)
-                    history = list(train_prices)
-                    lgb_preds: List[float] = []
-                    for _ in range(holdout):
-                        feat = self._prepare_features(history, external_factors)
-                        pred = float(lgb_model.predict([feat])[0])
-                        lgb_preds.append(pred)
-                        history.append(pred)
-                    errors["lgb"] = self._mape(test_prices, lgb_preds)
-            except Exception as e:
-                logger.warning(f"LightGBM validation failed: {e}")
-
+    @staticmethod
+    def _weights_from_errors(errors: Dict[str, float]) -> Dict[str, float]:
+        """Inverse-MAPE weights over the members that were validated"""
         weights: Dict[str, float] = {}
         total = 0.0
         for key, err in errors.items():
@@ -1632,10 +3159,55 @@ class RASSPriceModel:
 
         return {k: v / total for k, v in weights.items()}
 
-    def _blend_forecasts(self, candidates: Dict[str, List[float]], weights: Dict[str, float]) -> List[float]:
-        if not candidates:
-            return []
-        length = len(next(iter(candidates.values())))
+    @staticmethod
+    def _within_budget(key: str, budget: Optional[LatencyBudget], statuses: Dict[str, str]) -> bool:
+        """False, marking the member skipped, when its estimated predict time
+        no longer fits in the budget"""
+        if budget is None or budget.admits(key, ("predict",)):
+            return True
+        statuses[key] = "skipped"
+        return False
+
+    def _member_report(
+        self,
+        candidates: Dict[str, List[float]],
+        prophet_used: bool,
+        statuses: Dict[str, str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Status ("used", "unused", "skipped", "dropped", "pruned",
+        "unavailable"), blend weight and train / predict milliseconds of every member"""
+        weights = self._effective_weights(candidates, self.ensemble_weights)
+        baseline = {"prophet"} if prophet_used else (
+            {"holt", "ridge"} if self.ml_model.trained else {"holt"}
+        )
+        trained = {
+            "holt": True,
+            "ridge": self.ml_model.trained,
+            "prophet": self.prophet_model is not None,
+            "sarima": self.sarima_model is not None,
+            "gbr": self.gbr_trained,
+            "xgb": self.xgb_trained,
+            "lgb": self.lgb_trained,
+        }
+        report: Dict[str, Dict[str, Any]] = {}
+        for key in ("holt", "ridge") + self.OPTIONAL_MEMBERS:
+            if key in baseline or key in candidates:
+                entry = {"status": "used", "weight": round(float(weights.get("baseline" if key in baseline else key, 0.0)), 4)}
+            elif key in statuses:
+                entry = {"status": statuses[key]}
+            else:
+                entry = {"status": "unused" if trained[key] else "unavailable"}
+            train_ms = self.training_timings.get(key, 0.0) + self.training_timings.get(f"validation_{key}", 0.0)
+            if train_ms:
+                entry["trainMs"] = round(train_ms, 1)
+            if key in self.predict_timings:
+                entry["predictMs"] = round(self.predict_timings[key], 1)
+            report[key] = entry
+        return report
+
+    @staticmethod
+    def _effective_weights(candidates: Dict[str, List[float]], weights: Dict[str, float]) -> Dict[str, float]:
+        """Blend weights renormalised over the candidates present (unweighted ones count 1)"""
         weight_total = 0.0
         effective_weights: Dict[str, float] = {}
         for key in candidates.keys():
@@ -1648,6 +3220,13 @@ class RASSPriceModel:
             weight_total = 1.0
         for key in effective_weights:
             effective_weights[key] /= weight_total
+        return effective_weights
+
+    def _blend_forecasts(self, candidates: Dict[str, List[float]], weights: Dict[str, float]) -> List[float]:
+        if not candidates:
+            return []
+        length = len(next(iter(candidates.values())))
+        effective_weights = self._effective_weights(candidates, weights)
 
         blended: List[float] = []
         for i in range(length):
@@ -1669,18 +3248,32 @@ class RASSPriceModel:
             roll_feats.get("momentum", 0),
             roll_feats.get("volatility_cv", 0),
         ]
-        
+        features.extend(self._external_feature_values(external_factors))
+        return features
+
+    def _external_feature_values(self, external_factors: ExternalFactors = None) -> List[float]:
+        """External columns appended to every feature row (constant per request)"""
         if external_factors:
             ext_feats = self.feature_engineer.create_external_features(external_factors)
-            features.extend([
+            return [
                 ext_feats.get("rainfall_anomaly", 0),
                 ext_feats.get("fuel_price_index", 1),
                 ext_feats.get("supply_demand_ratio", 1),
-            ])
-        else:
-            features.extend([0, 1, 1])
-        
-        return features
+            ]
+        return [0, 1, 1]
+
+    def _prepare_feature_matrix(
+        self,
+        prices: List[float],
+        external_factors: ExternalFactors = None,
+        start: int = 7
+    ):
+        """Feature rows for prices[:i], i in range(start, len(prices)), built in one pass"""
+        base = self.feature_engineer.build_feature_matrix(prices, start)
+        ext = self._external_feature_values(external_factors)
+        if not NUMPY_AVAILABLE:
+            return [row + ext for row in base]
+        return np.hstack([base, np.tile(np.asarray(ext, dtype=np.float64), (len(base), 1))])
     
     def _default_forecast(self, days: int) -> ForecastOutput:
         """Return default forecast when no data available"""
@@ -1711,132 +3304,775 @@ class RASSPriceModel:
 # CONVENIENCE FUNCTIONS FOR API INTEGRATION
 # ============================================================================
 
-# Global model instance
-_model_instance: Optional[RASSPriceModel] = None
+# ============================================================================
+# MODEL ARTIFACT STORE (trained models persisted across restarts)
+# ============================================================================
+
+ARTIFACT_FORMAT_VERSION = 3
+
+# Libraries whose objects end up inside a pickled model (see requirements.txt);
+# an artifact is only loaded by a process running the exact same versions
+ARTIFACT_LIBRARIES = (
+    "numpy", "pandas", "scipy", "scikit-learn", "statsmodels",
+    "prophet", "xgboost", "lightgbm", "joblib",
+)
+
+
+def library_versions(libraries=ARTIFACT_LIBRARIES) -> Dict[str, Optional[str]]:
+    """Installed version of each library, None when it is not installed"""
+    versions: Dict[str, Optional[str]] = {}
+    for name in libraries:
+        try:
+            versions[name] = importlib.metadata.version(name)
+        except importlib.metadata.PackageNotFoundError:
+            versions[name] = None
+    return versions
+
+
+class ModelArtifactStore:
+    """
+    Versioned on-disk store of trained models, one joblib file per registry key.
+
+    Each artifact records its key, series signature, save time and the
+    versions of ARTIFACT_LIBRARIES it was pickled with. Artifacts written by a
+    different format version or library set are ignored on load (and replaced
+    on the next save). Writes go through a temp file and an atomic rename, so
+    several worker processes can share one directory. save_async() hands the
+    (compressed) dump to one background writer thread, off the request that
+    trained the model.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self.versions = library_versions()
+        self.saved = 0
+        self.loaded = 0
+        self.rejected = 0
+        self.errors = 0
+        self._writer: Optional[ThreadPoolExecutor] = None
+        self._pending = 0
+        self._lock = threading.Lock()
+        if self.enabled:
+            os.makedirs(self.root, exist_ok=True)
+
+    @property
+    def enabled(self) -> bool:
+        return JOBLIB_AVAILABLE and bool(self.root)
+
+    def _path(self, key: Tuple) -> str:
+        readable = re.sub(r"[^a-z0-9]+", "-", "-".join(str(k) for k in key[:3]).lower())
+        digest = hashlib.sha1(json.dumps(list(key)).encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.root, f"{readable.strip('-')}-{digest}.joblib")
+
+    def save(self, key: Tuple, signature: Tuple, model: Any, saved_at: float = None) -> bool:
+        if not self.enabled:
+            return False
+        path = self._path(key)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        record = {
+            "format": ARTIFACT_FORMAT_VERSION,
+            "key": key,
+            "signature": signature,
+            "savedAt": saved_at if saved_at is not None else time.time(),
+            "versions": self.versions,
+            "model": model,
+        }
+        try:
+            joblib.dump(record, tmp, compress=3)
+            os.replace(tmp, path)
+            self.saved += 1
+            return True
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Could not persist model artifact {path}: {e}")
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            return False
+
+    def save_async(self, key: Tuple, signature: Tuple, model: Any) -> None:
+        """Queue save() on the background writer thread"""
+        if not self.enabled:
+            return
+        saved_at = time.time()
+        with self._lock:
+            if self._writer is None:
+                self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="artifact-writer")
+            self._pending += 1
+            self._writer.submit(self._save_queued, key, signature, model, saved_at)
+
+    def _save_queued(self, key: Tuple, signature: Tuple, model: Any, saved_at: float) -> None:
+        try:
+            self.save(key, signature, model, saved_at)
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def flush(self) -> None:
+        """Wait for queued saves to be written"""
+        with self._lock:
+            writer, self._writer = self._writer, None
+        if writer is not None:
+            writer.shutdown(wait=True)
+
+    def _read(self, path: str) -> Optional[Dict[str, Any]]:
+        try:
+            record = joblib.load(path)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Unreadable model artifact {path}: {e}")
+            return None
+        if (
+            not isinstance(record, dict)
+            or record.get("format") != ARTIFACT_FORMAT_VERSION
+            or record.get("versions") != self.versions
+        ):
+            self.rejected += 1
+            logger.info(f"Ignoring model artifact {path}: built with a different format or library versions")
+            return None
+        return record
+
+    def load(self, key: Tuple) -> Optional[Dict[str, Any]]:
+        """The artifact record for `key`, or None if missing or incompatible"""
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        record = self._read(path)
+        if record is None or tuple(record.get("key", ())) != tuple(key):
+            return None
+        self.loaded += 1
+        return record
+
+    def load_all(self) -> List[Dict[str, Any]]:
+        """Every compatible artifact in the store, most recently saved first"""
+        if not self.enabled:
+            return []
+        records = []
+        for name in os.listdir(self.root):
+            if name.endswith(".joblib"):
+                record = self._read(os.path.join(self.root, name))
+                if record is not None:
+                    self.loaded += 1
+                    records.append(record)
+        records.sort(key=lambda r: r["savedAt"], reverse=True)
+        return records
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "directory": self.root or None,
+            "saved": self.saved,
+            "pendingSaves": self._pending,
+            "loaded": self.loaded,
+            "rejected": self.rejected,
+            "errors": self.errors,
+        }
+
+
+# ============================================================================
+# MODEL REGISTRY (one warm model per crop / market / feature-config)
+# ============================================================================
+
+@dataclass
+class RegistryEntry:
+    """A trained model plus the bookkeeping used for eviction and staleness"""
+    model: Any
+    signature: Tuple
+    trained_at: float
+    last_used: float
+    hits: int = 0
 
 
-def get_model() -> RASSPriceModel:
-    """Get or create model instance"""
-    global _model_instance
-    if _model_instance is None:
-        _model_instance = RASSPriceModel()
-    return _model_instance
+class ModelRegistry:
+    """
+    Bounded LRU registry of trained models keyed by (kind, crop, market, config hash).
+
+    An entry is stale, and dropped on lookup, when it is older than
+    ``max_age_seconds`` or when the caller's series signature differs from the
+    one the model was trained on. Inserting past ``max_size`` evicts the least
+    recently used entry.
+
+    With a ``store``, every registered model is also written to disk, and a
+    key missing from memory is looked up there before counting as a miss.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 64,
+        max_age_seconds: float = 6 * 3600,
+        store: Optional[ModelArtifactStore] = None
+    ):
+        self.max_size = max(1, max_size)
+        self.max_age_seconds = max_age_seconds
+        self.store = store
+        self._entries: "OrderedDict[Tuple, RegistryEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.evictions = 0
+        self.disk_hits = 0
+
+    def get(self, key: Tuple, signature: Tuple) -> Optional[Any]:
+        """Return the warm model for `key`, or None if missing or stale"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.signature != signature or now - entry.trained_at > self.max_age_seconds:
+                    del self._entries[key]
+                    self.stale += 1
+                    self.misses += 1
+                    return None
+                entry.hits += 1
+                entry.last_used = now
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.model
+
+        # Lazy load: the model may have been trained before a restart or by
+        # another worker process
+        model = self._load_artifact(key, signature)
+        with self._lock:
+            if model is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.disk_hits += 1
+        return model
+
+    def _load_artifact(self, key: Tuple, signature: Tuple) -> Optional[Any]:
+        if self.store is None:
+            return None
+        record = self.store.load(key)
+        if record is None or tuple(record["signature"]) != tuple(signature):
+            return None
+        if not self._insert_record(record):
+            return None
+        return record["model"]
+
+    def _insert_record(self, record: Dict[str, Any]) -> bool:
+        """Register a stored model unless it has outlived max_age_seconds"""
+        age = time.time() - record["savedAt"]
+        if age > self.max_age_seconds:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            self._entries[tuple(record["key"])] = RegistryEntry(
+                model=record["model"], signature=tuple(record["signature"]),
+                trained_at=now - max(age, 0.0), last_used=now
+            )
+            self._evict_locked()
+        return True
+
+    def _evict_locked(self) -> None:
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def put(self, key: Tuple, signature: Tuple, model: Any) -> None:
+        """Store a freshly trained model, evicting the LRU entry if full"""
+        now = time.monotonic()
+        with self._lock:
+            self._entries[key] = RegistryEntry(
+                model=model, signature=signature, trained_at=now, last_used=now
+            )
+            self._entries.move_to_end(key)
+            self._evict_locked()
+        if self.store is not None:
+            self.store.save_async(key, signature, model)
+
+    def preload(self) -> int:
+        """Eagerly load every fresh artifact from the store; returns the count"""
+        if self.store is None:
+            return 0
+        loaded = 0
+        # Oldest first, so the most recent artifacts end up most recently used
+        for record in reversed(self.store.load_all()[:self.max_size]):
+            if self._insert_record(record):
+                loaded += 1
+        return loaded
+
+    def invalidate(self, key: Tuple) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxSize": self.max_size,
+                "maxAgeSeconds": self.max_age_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "stale": self.stale,
+                "evictions": self.evictions,
+                "diskHits": self.disk_hits,
+                "hitRate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "artifacts": self.store.stats() if self.store is not None else None,
+            }
+
+
+def make_series_key(
+    crop: str,
+    market: str,
+    market_info: Dict[str, Any] = None,
+    external_info: Dict[str, Any] = None,
+    kind: str = "price"
+) -> Tuple[str, str, str, str]:
+    """Registry key: model kind, normalised crop and market plus a hash of the feature config"""
+    config = json.dumps(
+        {"market_info": market_info or {}, "external_info": external_info or {}},
+        sort_keys=True, default=str
+    )
+    config_hash = hashlib.sha1(config.encode("utf-8")).hexdigest()[:12]
+    return (kind, (crop or "").strip().lower(), (market or "").strip().lower(), config_hash)
+
+
+def values_signature(prices: List[float], dates: List[datetime] = None) -> Tuple:
+    """Cheap fingerprint of an ordered price series; stable across processes"""
+    if not prices:
+        return (0,)
+    return (
+        len(prices),
+        dates[0].isoformat() if dates else None,
+        dates[-1].isoformat() if dates else None,
+        hashlib.sha1(json.dumps([float(p) for p in prices]).encode("utf-8")).hexdigest(),
+    )
+
+
+def series_signature(price_points: List[PricePoint]) -> Tuple:
+    """Cheap fingerprint of a price series; a model is only reused for the same data"""
+    history = as_price_history(price_points or [])
+    return values_signature(history.price_list, history.date_list)
+
+
+# Process-wide registry of trained RASSPriceModel and EnsembleForecaster
+# instances, persisted under MODEL_ARTIFACT_DIR when it is set
+_model_registry = ModelRegistry(
+    max_size=int(os.getenv("MODEL_REGISTRY_MAX_SIZE", "64")),
+    max_age_seconds=float(os.getenv("MODEL_REGISTRY_MAX_AGE_SECONDS", str(6 * 3600))),
+    store=ModelArtifactStore(os.getenv("MODEL_ARTIFACT_DIR", "")),
+)
+_artifacts_preloaded: Optional[int] = None
+
+
+def get_model_registry() -> ModelRegistry:
+    """Get the process-wide model registry"""
+    return _model_registry
+
+
+def preload_model_artifacts() -> int:
+    """Load stored artifacts into this process's registry (once per process)"""
+    global _artifacts_preloaded
+    if _artifacts_preloaded is None:
+        _artifacts_preloaded = _model_registry.preload()
+        logger.info(f"Preloaded {_artifacts_preloaded} model artifacts")
+    return _artifacts_preloaded
+
+
+def get_model(
+    crop: str = "",
+    market: str = "",
+    price_points: List[PricePoint] = None,
+    market_info: Dict[str, Any] = None,
+    external_info: Dict[str, Any] = None
+) -> Tuple[RASSPriceModel, Tuple, Tuple]:
+    """Get the warm model for a series, or a fresh untrained one on a miss.
+
+    Returns (model, key, signature) so callers can register the model once trained.
+    """
+    key = make_series_key(crop, market, market_info, external_info)
+    signature = series_signature(price_points or [])
+    model = _model_registry.get(key, signature)
+    if model is None:
+        model = RASSPriceModel()
+        if crop:
+            model.series_key = key
+    return model, key, signature
+
+
+def init_worker(preload_artifacts: bool = False, preload_backends: bool = False) -> None:
+    """Process-pool initializer: optionally warm this worker before its first task"""
+    if preload_backends:
+        report = load_backends()
+        logger.info("Worker backend imports (ms): " + ", ".join(
+            f"{name}={info['importMs']}" for name, info in report["backends"].items() if info["loaded"]
+        ))
+    if preload_artifacts:
+        preload_model_artifacts()
+
+
+def forecast_ensemble(
+    prices: List[float],
+    dates: List[datetime] = None,
+    steps: int = 14,
+    crop: str = "",
+    market: str = "",
+    max_latency_ms: float = None,
+    started_at: float = None
+) -> Dict[str, Any]:
+    """Fit an EnsembleForecaster on a series and forecast `steps` days.
+
+    With a crop, the fitted ensemble is kept in the model registry and
+    reused for the same series, unless a latency budget left members out of
+    its fit. Module-level so it can be dispatched to worker processes.
+    """
+    budget = LatencyBudget.from_ms(max_latency_ms, started_at)
+    if not crop:
+        ef = EnsembleForecaster()
+        ef.fit_and_weight(prices, dates, budget=budget)
+        return ef.forecast(steps, prices, dates, budget=budget)
+
+    key = make_series_key(crop, market, kind="ensemble")
+    signature = values_signature(prices, dates)
+    ef = _model_registry.get(key, signature)
+    if ef is None:
+        ef = EnsembleForecaster()
+        ef.series_key = key
+        ef.fit_and_weight(prices, dates, budget=budget)
+        if not ef.member_status:
+            _model_registry.put(key, signature, ef)
+    return ef.forecast(steps, prices, dates, budget=budget)
+
+
+def as_market_features(market_info: Optional[Dict[str, Any]]) -> Optional[MarketFeatures]:
+    """MarketFeatures from an API market_info dict"""
+    if not market_info:
+        return None
+    return MarketFeatures(
+        market_name=market_info.get("name", ""),
+        distance_to_kigali_km=market_info.get("distanceToKigali", 0),
+        is_urban=market_info.get("isUrban", False),
+        road_quality=market_info.get("roadQuality", "paved")
+    )
+
+
+def as_external_factors(external_info: Optional[Dict[str, Any]]) -> Optional[ExternalFactors]:
+    """ExternalFactors from an API external_factors dict"""
+    if not external_info:
+        return None
+    return ExternalFactors(
+        rainfall_anomaly=external_info.get("rainfallAnomaly", 0),
+        fuel_price_index=external_info.get("fuelPriceIndex", 1),
+        expected_supply_kg=external_info.get("expectedSupply", 0),
+        buyer_demand_index=external_info.get("demandIndex", 1),
+        season=external_info.get("season", "normal")
+    )
+
+
+def forecast_to_dict(forecast: ForecastOutput) -> Dict[str, Any]:
+    """API dict for a ForecastOutput"""
+    return {
+        "forecast_date": forecast.forecast_date,
+        "forecast_period_days": forecast.forecast_period_days,
+        "predictions": forecast.predictions,
+        "trend": forecast.trend,
+        "volatility": forecast.volatility,
+        "confidence": forecast.confidence,
+        "recommendation": forecast.recommendation,
+        "explanation": forecast.explanation,
+        "top_factors": forecast.top_factors,
+        "members": forecast.members,
+        "partial": forecast.partial
+    }
 
 
 def train_model(
     historical_data: List[Dict[str, Any]],
     market_info: Dict[str, Any] = None,
-    external_info: Dict[str, Any] = None
+    external_info: Dict[str, Any] = None,
+    crop: str = "",
+    market: str = ""
 ) -> bool:
-    """Train the model with historical data"""
-    model = get_model()
-    
-    # Convert dict to PricePoint
-    price_points = []
-    for item in historical_data:
-        try:
-            date_str = item.get("date", item.get("observedAt", ""))
-            if isinstance(date_str, str):
-                # Try multiple date formats
-                for fmt in ["%Y-%m-%dT%H:%M:%S", "%Y-%m-%d", "%Y-%m-%dT%H:%M:%S.%f"]:
-                    try:
-                        date = datetime.strptime(date_str[:19], fmt[:len(date_str)])
-                        break
-                    except ValueError:
-                        continue
-                else:
-                    date = datetime.now()
-            else:
-                date = date_str
-            
-            price = float(item.get("price", item.get("pricePerKg", 0)))
-            price_points.append(PricePoint(date=date, price=price))
-        except Exception as e:
-            logger.warning(f"Skipping invalid price point: {e}")
-    
-    market_features = None
-    if market_info:
-        market_features = MarketFeatures(
-            market_name=market_info.get("name", ""),
-            distance_to_kigali_km=market_info.get("distanceToKigali", 0),
-            is_urban=market_info.get("isUrban", False),
-            road_quality=market_info.get("roadQuality", "paved")
-        )
+    """Train the model for a (crop, market) series and register it"""
+    # Sorted, one-observation-per-day columns
+    history = ingest_price_history(historical_data)
     
-    external_factors = None
-    if external_info:
-        external_factors = ExternalFactors(
-            rainfall_anomaly=external_info.get("rainfallAnomaly", 0),
-            fuel_price_index=external_info.get("fuelPriceIndex", 1),
-            expected_supply_kg=external_info.get("expectedSupply", 0),
-            buyer_demand_index=external_info.get("demandIndex", 1),
-            season=external_info.get("season", "normal")
-        )
+    market_features = as_market_features(market_info)
+    external_factors = as_external_factors(external_info)
     
-    return model.train(price_points, market_features, external_factors)
+    model, key, signature = get_model(crop, market, history, market_info, external_info)
+    if model.trained:
+        return True
+    prune = member_pruning.plan(key) if crop else {}
+    trained = model.train(history, market_features, external_factors, prune=prune)
+    if trained:
+        if crop:
+            member_pruning.record(key, model, prune)
+        _model_registry.put(key, signature, model)
+    return trained
 
 
 def predict_price(
     historical_data: List[Dict[str, Any]],
     forecast_days: int = 7,
     market_info: Dict[str, Any] = None,
-    external_info: Dict[str, Any] = None
+    external_info: Dict[str, Any] = None,
+    crop: str = "",
+    market: str = "",
+    max_latency_ms: float = None,
+    started_at: float = None
 ) -> Dict[str, Any]:
-    """Generate price prediction"""
-    model = get_model()
-    
-    # Convert dict to PricePoint
-    price_points = []
-    for item in historical_data:
-        try:
-            date_str = item.get("date", item.get("observedAt", ""))
-            if isinstance(date_str, str):
-                for fmt in ["%Y-%m-%dT%H:%M:%S", "%Y-%m-%d", "%Y-%m-%dT%H:%M:%S.%f"]:
-                    try:
-                        date = datetime.strptime(date_str[:19], fmt[:len(date_str)])
-                        break
-                    except ValueError:
-                        continue
-                else:
-                    date = datetime.now()
-            else:
-                date = date_str
-            
-            price = float(item.get("price", item.get("pricePerKg", 0)))
-            price_points.append(PricePoint(date=date, price=price))
-        except Exception as e:
-            logger.warning(f"Skipping invalid price point: {e}")
-    
-    market_features = None
-    if market_info:
-        market_features = MarketFeatures(
-            market_name=market_info.get("name", ""),
-            distance_to_kigali_km=market_info.get("distanceToKigali", 0),
-            is_urban=market_info.get("isUrban", False),
-            road_quality=market_info.get("roadQuality", "paved")
-        )
+    """Generate price prediction using the warm model for this (crop, market) series.
+
+    `max_latency_ms` (counted from `started_at`, a time.time() value) bounds
+    the members that run; a model trained without all of its members is not
+    registered. Members pruned for the series are not trained; `pruning`
+    reports what that has saved so far.
+    """
+    # Sorted, one-observation-per-day columns
+    history = ingest_price_history(historical_data)
     
-    external_factors = None
-    if external_info:
-        external_factors = ExternalFactors(
-            rainfall_anomaly=external_info.get("rainfallAnomaly", 0),
-            fuel_price_index=external_info.get("fuelPriceIndex", 1),
-            expected_supply_kg=external_info.get("expectedSupply", 0),
-            buyer_demand_index=external_info.get("demandIndex", 1),
-            season=external_info.get("season", "normal")
-        )
+    market_features = as_market_features(market_info)
+    external_factors = as_external_factors(external_info)
     
-    forecast = model.predict(price_points, forecast_days, market_features, external_factors)
+    budget = LatencyBudget.from_ms(max_latency_ms, started_at)
+    model, key, signature = get_model(crop, market, history, market_info, external_info)
+    was_trained = model.trained
+    prune = member_pruning.plan(key) if crop and not was_trained else {}
+    forecast = model.predict(
+        history, forecast_days, market_features, external_factors, budget=budget, prune=prune
+    )
+    if model.trained and not was_trained and not model.budget_limited:
+        if crop:
+            member_pruning.record(key, model, prune)
+        _model_registry.put(key, signature, model)
+    for member, saved_ms in prune.items():
+        if forecast.members.get(member, {}).get("status") == "pruned":
+            forecast.members[member]["savedMs"] = round(saved_ms, 1)
     
-    # Convert to dict
     return {
-        "forecast_date": forecast.forecast_date,
-        "forecast_period_days": forecast.forecast_period_days,
-        "predictions": forecast.predictions,
-        "trend": forecast.trend,
-        "volatility": forecast.volatility,
-        "confidence": forecast.confidence,
-        "recommendation": forecast.recommendation,
-        "explanation": forecast.explanation,
-        "top_factors": forecast.top_factors
+        **forecast_to_dict(forecast),
+        "pruning": member_pruning.series_stats(key) if crop else {}
     }
+
+
+
+# ============================================================================
+# INCREMENTAL SERIES UPDATES
+# ============================================================================
+
+# Stored series kept in memory (least recently updated evicted first)
+SERIES_STORE_MAX_SIZE = int(os.getenv("SERIES_STORE_MAX_SIZE", "256"))
+# Full retrain once the model is this old, or has absorbed this many
+# observations incrementally (0 disables either trigger)
+SERIES_RETRAIN_MAX_AGE_SECONDS = float(os.getenv("SERIES_RETRAIN_MAX_AGE_SECONDS", "604800"))
+SERIES_RETRAIN_MAX_OBS = int(os.getenv("SERIES_RETRAIN_MAX_OBS", "30"))
+# Full retrain when a new observation's one-step Holt error exceeds this many
+# standard deviations of the recent errors (0 disables)
+SERIES_DRIFT_Z = float(os.getenv("SERIES_DRIFT_Z", "4.0"))
+# Recent one-step errors the drift test is measured against
+SERIES_DRIFT_WINDOW = 30
+
+
+@dataclass
+class SeriesState:
+    """One stored (crop, market) series and the model trained on it.
+
+    `lock` serialises the appends, retrains and forecasts of the series; it
+    lives and is evicted with the state. `pending_retrain` is the reason for a
+    retrain of `model` that has been requested and has not succeeded yet.
+    """
+    history: PriceHistory
+    market_info: Optional[Dict[str, Any]] = None
+    external_info: Optional[Dict[str, Any]] = None
+    model: Optional[RASSPriceModel] = None
+    trained_at: Optional[float] = None
+    since_training: int = 0
+    residuals: RollingWindowStats = field(default_factory=lambda: RollingWindowStats((SERIES_DRIFT_WINDOW,)))
+    pending_retrain: Optional[str] = None
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
+
+
+class SeriesStore:
+    """
+    Price series that grow by appended observations, each with a model that
+    is updated in place rather than retrained on every append.
+
+    open() returns a series' state (empty on first use). append() merges new
+    observations into it. Observations after its last day are folded into
+    the model with RASSPriceModel.update(); a full retrain is requested
+    instead for a new series, a revision of a stored day, changed
+    market/external inputs, a one-step error beyond `drift_z` recent standard
+    deviations, or once `retrain_max_obs` observations or `retrain_max_age`
+    seconds have passed since the last training. Retraining itself is left to
+    the caller (see train_series_model), which hands the result back through
+    set_model(). The methods work on the SeriesState they are given, so a
+    series evicted mid-request is still served. Series are kept in LRU order,
+    at most `max_series`.
+    """
+
+    def __init__(
+        self, max_series: int = 256, retrain_max_age: float = 604800,
+        retrain_max_obs: int = 30, drift_z: float = 4.0
+    ):
+        self.max_series = max(1, max_series)
+        self.retrain_max_age = retrain_max_age
+        self.retrain_max_obs = retrain_max_obs
+        self.drift_z = drift_z
+        self._series: "OrderedDict[Tuple[str, str], SeriesState]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.updates = {"incremental": 0, "retrain": 0, "none": 0}
+
+    @staticmethod
+    def key(crop: str, market: str) -> Tuple[str, str]:
+        return (crop.strip().lower(), market.strip().lower())
+
+    def get(self, crop: str, market: str) -> Optional[SeriesState]:
+        with self._lock:
+            return self._series.get(self.key(crop, market))
+
+    def open(self, crop: str, market: str) -> SeriesState:
+        """The state of a series, created empty (and stored) on first use"""
+        key = self.key(crop, market)
+        with self._lock:
+            state = self._series.get(key)
+            if state is None:
+                state = self._series[key] = SeriesState(ingest_price_history([]))
+                while len(self._series) > self.max_series:
+                    self._series.popitem(last=False)
+            else:
+                self._series.move_to_end(key)
+            return state
+
+    def _retrain_reason(self, state: SeriesState, errors: List[float]) -> Optional[str]:
+        sigma = state.residuals.std(SERIES_DRIFT_WINDOW)
+        if self.drift_z > 0 and sigma > 0 and any(abs(e) > self.drift_z * sigma for e in errors):
+            return "drift"
+        if self.retrain_max_obs > 0 and state.since_training >= self.retrain_max_obs:
+            return "observations"
+        if self.retrain_max_age > 0 and time.time() - state.trained_at >= self.retrain_max_age:
+            return "age"
+        return None
+
+    def append(
+        self,
+        state: SeriesState,
+        points: List[Dict[str, Any]],
+        market_info: Dict[str, Any] = None,
+        external_info: Dict[str, Any] = None
+    ) -> Dict[str, Any]:
+        """
+        Merge `points` (API price dicts) into the series. Returns the number
+        of days `appended` (new or revised), `update` ("incremental",
+        "retrain" when the caller should retrain, or "none" when there is
+        too little data to train) and the `reason` for a retrain.
+
+        A retrain of a trained series stays requested (`pending_retrain`)
+        until set_model() installs its result, so a retrain that failed is
+        asked for again by the next append instead of being skipped.
+        """
+        incoming = ingest_price_history(points)
+        outcome = {"appended": len(incoming), "update": "retrain", "reason": None}
+
+        if len(incoming) == 0:
+            outcome["update"] = "none"
+            outcome["reason"] = state.pending_retrain
+            if state.pending_retrain is not None:
+                outcome["update"] = "retrain"
+        else:
+            new = len(state.history) == 0 and state.model is None
+            appends = len(state.history) == 0 or state.history.dates[-1] < incoming.dates[0]
+            state.history = state.history.merge(incoming)
+            if market_info is not None and market_info != state.market_info:
+                state.market_info = market_info
+                outcome["reason"] = "config"
+            if external_info is not None and external_info != state.external_info:
+                state.external_info = external_info
+                outcome["reason"] = "config"
+            if new:
+                outcome["reason"] = "new"
+            elif outcome["reason"] is None:
+                if state.model is None:
+                    outcome["reason"] = "untrained"
+                elif state.pending_retrain is not None:
+                    outcome["reason"] = state.pending_retrain
+                elif not appends:
+                    outcome["reason"] = "revision"
+                else:
+                    errors = state.model.update(incoming.price_list)
+                    state.since_training += len(incoming)
+                    outcome["reason"] = self._retrain_reason(state, errors)
+                    state.residuals.extend(errors)
+                    if outcome["reason"] is None:
+                        outcome["update"] = "incremental"
+
+        if outcome["update"] == "retrain" and state.model is not None:
+            # The first unmet reason is kept until a retrain succeeds
+            state.pending_retrain = state.pending_retrain or outcome["reason"]
+            outcome["reason"] = state.pending_retrain
+        if outcome["update"] == "retrain" and len(state.history) < 7:
+            outcome["update"] = "none"
+        with self._lock:
+            self.updates[outcome["update"]] += 1
+        return outcome
+
+    def set_model(self, state: SeriesState, model: Optional[RASSPriceModel]) -> bool:
+        """Install a freshly trained model for the series and restart its retrain
+        triggers. A failed training (None) keeps the previous model, and its
+        retrain stays pending; returns whether the model was installed."""
+        if model is None:
+            return False
+        state.model = model
+        state.trained_at = time.time()
+        state.since_training = 0
+        state.pending_retrain = None
+        state.residuals = RollingWindowStats((SERIES_DRIFT_WINDOW,))
+        state.residuals.extend(model.statistical_model.residuals[-SERIES_DRIFT_WINDOW:])
+        return True
+
+    def forecast(self, state: SeriesState, days: int) -> Dict[str, Any]:
+        """predict_price-style forecast of a stored series from its current model"""
+        model = state.model if state.model is not None else RASSPriceModel()
+        forecast = model.predict(
+            state.history, days,
+            as_market_features(state.market_info), as_external_factors(state.external_info)
+        )
+        return forecast_to_dict(forecast)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            series = list(self._series.values())
+            updates = dict(self.updates)
+        return {
+            "series": len(series),
+            "maxSeries": self.max_series,
+            "trained": sum(1 for s in series if s.model is not None),
+            "observations": sum(len(s.history) for s in series),
+            "updates": updates,
+        }
+
+
+def train_series_model(
+    history: PriceHistory,
+    market_info: Dict[str, Any] = None,
+    external_info: Dict[str, Any] = None,
+    crop: str = "",
+    market: str = ""
+) -> Optional[RASSPriceModel]:
+    """Train a RASSPriceModel for a stored series and return it (None if it
+    could not be trained). Module-level so it can run in worker processes."""
+    key = make_series_key(crop, market, market_info, external_info)
+    model = RASSPriceModel()
+    model.series_key = key
+    prune = member_pruning.plan(key)
+    if not model.train(history, as_market_features(market_info), as_external_factors(external_info), prune=prune):
+        return None
+    member_pruning.record(key, model, prune)
+    return model
+
+
+series_store = SeriesStore(
+    SERIES_STORE_MAX_SIZE, SERIES_RETRAIN_MAX_AGE_SECONDS, SERIES_RETRAIN_MAX_OBS, SERIES_DRIFT_Z
+)
+
+MODEL_IMPORT_MS = round((time.perf_counter() - _MODULE_IMPORT_STARTED) * 1000, 1)